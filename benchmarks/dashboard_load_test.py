@@ -0,0 +1,158 @@
+"""
+Dashboard API load test.
+
+Simulates N dashboard tabs polling the API concurrently and reports
+per-endpoint latency percentiles.
+
+Usage:
+    uvicorn dashboard.main:app --workers 1          # in another shell
+    python benchmarks/dashboard_load_test.py --clients 200 --duration 30
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import defaultdict
+
+import httpx
+import numpy as np
+
+
+DEFAULT_ENDPOINTS = [
+    "/health/symbols",
+    "/alerts/active",
+    "/alerts/history",
+]
+
+
+async def _client_loop(
+    client: httpx.AsyncClient,
+    endpoints: list[str],
+    stop_at: float,
+    think_time: float,
+    latencies: dict,
+    errors: dict,
+):
+    while time.perf_counter() < stop_at:
+        for path in endpoints:
+            t0 = time.perf_counter()
+            try:
+                resp = await client.get(path)
+                resp.raise_for_status()
+            except httpx.HTTPError:
+                errors[path] += 1
+                continue
+            latencies[path].append(time.perf_counter() - t0)
+
+        if think_time:
+            await asyncio.sleep(think_time)
+
+
+def _summarize(latencies: dict, errors: dict, elapsed: float) -> dict:
+    summary = {}
+
+    for path in sorted(set(latencies) | set(errors)):
+        samples = np.array(latencies.get(path, []), dtype="float64") * 1000
+
+        summary[path] = {
+            "requests": int(samples.size),
+            "errors": errors.get(path, 0),
+            "rps": round(samples.size / elapsed, 1),
+            "p50_ms": round(float(np.percentile(samples, 50)), 2) if samples.size else None,
+            "p95_ms": round(float(np.percentile(samples, 95)), 2) if samples.size else None,
+            "p99_ms": round(float(np.percentile(samples, 99)), 2) if samples.size else None,
+            "max_ms": round(float(samples.max()), 2) if samples.size else None,
+        }
+
+    return summary
+
+
+async def run_load_test(
+    base_url: str,
+    clients: int,
+    duration: float,
+    think_time: float,
+    endpoints: list[str],
+) -> dict:
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+
+    limits = httpx.Limits(
+        max_connections=clients,
+        max_keepalive_connections=clients,
+    )
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30.0
+    ) as client:
+        started = time.perf_counter()
+        stop_at = started + duration
+
+        await asyncio.gather(*[
+            _client_loop(client, endpoints, stop_at, think_time, latencies, errors)
+            for _ in range(clients)
+        ])
+
+        elapsed = time.perf_counter() - started
+
+    return _summarize(latencies, errors, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard API load test")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.0,
+        help="Seconds each client waits between polling rounds",
+    )
+    parser.add_argument(
+        "--endpoint",
+        action="append",
+        dest="endpoints",
+        help="Endpoint path to poll (repeatable)",
+    )
+    parser.add_argument("--output", help="Write JSON summary to this path")
+    args = parser.parse_args()
+
+    endpoints = args.endpoints or DEFAULT_ENDPOINTS
+
+    summary = asyncio.run(
+        run_load_test(
+            base_url=args.base_url,
+            clients=args.clients,
+            duration=args.duration,
+            think_time=args.think_time,
+            endpoints=endpoints,
+        )
+    )
+
+    print(f"\nLOAD TEST | clients={args.clients} | duration={args.duration}s")
+    print(f"{'ENDPOINT':<28} | {'REQ':>7} | {'ERR':>5} | {'RPS':>7} | "
+          f"{'P50':>8} | {'P99':>8}")
+    print("-" * 78)
+    for path, s in summary.items():
+        print(
+            f"{path:<28} | {s['requests']:>7} | {s['errors']:>5} | "
+            f"{s['rps']:>7} | {s['p50_ms'] or '-':>8} | {s['p99_ms'] or '-':>8}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "clients": args.clients,
+                    "duration_sec": args.duration,
+                    "endpoints": summary,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+"""
+End-to-end ingestion throughput benchmark.
+
+Drives run_multi_backfill and run_ingestion_job against the local fake
+Kite server and a local Postgres/TimescaleDB (DB_CONFIG), across symbol
+counts and timeframes. Reports candles/sec, Kite API calls, DB round
+trips and p50/p99 latency per stage:
+
+    last_ts → fetch → gaps → write → governance
+
+Benchmark symbols are named BENCH0001… and are deleted before and
+after each scenario.
+
+Usage:
+    PYTHONPATH=src python benchmarks/ingestion_benchmark.py \\
+        --symbols 10 --symbols 100 --symbols 500 \\
+        --timeframe 5M --timeframe 15M --days 5 --output bench.json
+"""
+
+import argparse
+import functools
+import json
+import os
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+import psycopg2
+import pytz
+from psycopg2.extras import RealDictCursor
+
+IST = pytz.timezone("Asia/Kolkata")
+
+SYMBOL_PREFIX = "BENCH"
+DEFAULT_SYMBOL_COUNTS = [10, 100, 500]
+DEFAULT_TIMEFRAMES = ["5M", "15M"]
+
+STAGES = [
+    "last_ts", "fetch", "gaps", "write",
+    "governance_freshness", "governance", "governance_flush",
+]
+
+
+class _Stats:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.latencies = defaultdict(list)
+        self.db_round_trips = 0
+        self.candles_fetched = 0
+        self.candles_written = 0
+        self.governance_errors = 0
+
+
+STATS = _Stats()
+
+
+class CountingCursor(RealDictCursor):
+    """
+    RealDictCursor that counts statements sent to the server.
+    """
+
+    def execute(self, query, vars=None):
+        STATS.db_round_trips += 1
+        return super().execute(query, vars)
+
+    def executemany(self, query, vars_list):
+        STATS.db_round_trips += len(vars_list) if hasattr(vars_list, "__len__") else 1
+        return super().executemany(query, vars_list)
+
+    def copy_expert(self, sql, file, size=8192):
+        STATS.db_round_trips += 1
+        return super().copy_expert(sql, file, size)
+
+
+def counting_connection():
+    from data_ingestion.db import DB_CONFIG
+
+    return psycopg2.connect(**DB_CONFIG, cursor_factory=CountingCursor)
+
+
+def _timed(stage: str, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            STATS.latencies[stage].append(time.perf_counter() - t0)
+    return wrapper
+
+
+def _instrument_orchestrator():
+    """
+    Wrap the orchestrator's stage functions with timers and route its
+    DB connections through the counting cursor.
+    """
+    from data_ingestion import orchestrator
+
+    fetch = orchestrator.fetch_candles
+    write = orchestrator.write_candles
+    write_frame = orchestrator.write_candle_frame
+
+    def fetch_counted(*args, **kwargs):
+        df = fetch(*args, **kwargs)
+        STATS.candles_fetched += len(df)
+        return df
+
+    def write_counted(conn, symbol, timeframe, df, *args, **kwargs):
+        written = write(conn, symbol, timeframe, df, *args, **kwargs)
+        STATS.candles_written += written or 0
+        return written
+
+    def write_frame_counted(conn, frame, *args, **kwargs):
+        written = write_frame(conn, frame, *args, **kwargs)
+        STATS.candles_written += written or 0
+        return written
+
+    orchestrator.fetch_candles = _timed("fetch", fetch_counted)
+    orchestrator.write_candles = _timed("write", write_counted)
+    orchestrator.write_candle_frame = _timed("write", write_frame_counted)
+    orchestrator.detect_gaps = _timed("gaps", orchestrator.detect_gaps)
+    orchestrator.get_last_candle_ts = _timed("last_ts", orchestrator.get_last_candle_ts)
+    orchestrator.get_last_candle_ts_many = _timed("last_ts", orchestrator.get_last_candle_ts_many)
+    orchestrator.get_db_connection = counting_connection
+
+    # run_multi_backfill runs its chunks through the backfill executor
+    from data_ingestion import backfill_executor
+    backfill_executor.fetch_candles = orchestrator.fetch_candles
+    backfill_executor.write_candles = orchestrator.write_candles
+    backfill_executor.get_db_connection = counting_connection
+
+    # Intraday jobs are skipped outside market hours
+    orchestrator.is_market_open = lambda *a, **k: True
+
+    return orchestrator
+
+
+# ─────────────────────────────────────────────
+# Setup / teardown
+# ─────────────────────────────────────────────
+
+def bench_symbols(n: int) -> list[str]:
+    return [f"{SYMBOL_PREFIX}{i:04d}" for i in range(1, n + 1)]
+
+
+def cleanup():
+    conn = counting_connection()
+    try:
+        with conn.cursor() as cur:
+            for table in (
+                "candles", "candle_watermarks", "backfill_tasks",
+                "data_quality_reports", "data_quality_latest",
+            ):
+                cur.execute(f"DELETE FROM {table} WHERE symbol LIKE %s", (f"{SYMBOL_PREFIX}%",))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def start_fake_broker(symbols: list[str], historical_rps: float, latency_ms: float):
+    """
+    Start the fake Kite server and point the Kite client/instrument
+    cache at it. Must run before the ingestion modules build a client.
+    """
+    from data_ingestion.clients.fake_kite_server import start_fake_kite_server
+
+    server = start_fake_kite_server(
+        symbols=symbols,
+        rate_limits={"historical": historical_rps},
+        latency_ms=latency_ms,
+    )
+
+    os.environ["KITE_API_ROOT"] = server.url
+    os.environ["KITE_ACCESS_TOKEN"] = "benchmark"
+    os.environ["KITE_INSTRUMENTS_FILE"] = os.path.join(
+        tempfile.mkdtemp(prefix="kite-bench-"), "instruments.parquet"
+    )
+
+    from data_ingestion import instruments
+    instruments.INSTRUMENTS_FILE = os.environ["KITE_INSTRUMENTS_FILE"]
+    instruments.download_instruments()
+
+    return server
+
+
+# ─────────────────────────────────────────────
+# Scenario
+# ─────────────────────────────────────────────
+
+def _summarize_stage(samples: list[float]) -> dict:
+    arr = np.array(samples, dtype="float64") * 1000
+    return {
+        "calls": int(arr.size),
+        "total_ms": round(float(arr.sum()), 1),
+        "p50_ms": round(float(np.percentile(arr, 50)), 2) if arr.size else None,
+        "p99_ms": round(float(np.percentile(arr, 99)), 2) if arr.size else None,
+    }
+
+
+def _job_for_timeframe(timeframe: str) -> str:
+    from scheduler.job_registry import JOB_REGISTRY
+
+    for name, job in JOB_REGISTRY.items():
+        if job["timeframe"].upper() == timeframe:
+            return name
+    raise ValueError(f"No ingestion job for timeframe {timeframe}")
+
+
+def run_governance(symbols: list[str], timeframe: str):
+    from agents.data_quality.data_completeness_agent import DataCompletenessAgent
+    from monitoring.health_metrics import get_last_candles
+
+    agent = DataCompletenessAgent()
+    conn = counting_connection()
+    try:
+        if timeframe != "1D":
+            # Freshness is evaluated for all series in one batch
+            t0 = time.perf_counter()
+            last_ts = get_last_candles(conn, symbols, [timeframe])
+            agent._check_intraday_freshness(
+                conn, [(s, tf, ts) for (s, tf), ts in last_ts.items()]
+            )
+            STATS.latencies["governance_freshness"].append(time.perf_counter() - t0)
+
+        for symbol in symbols:
+            t0 = time.perf_counter()
+            try:
+                if timeframe == "1D":
+                    agent._check_daily_coverage(conn, symbol)
+                else:
+                    agent._check_intraday_completeness(conn, symbol, timeframe)
+            except Exception as e:
+                conn.rollback()
+                STATS.governance_errors += 1
+                print(f"  governance error | {symbol} | {e}")
+            finally:
+                STATS.latencies["governance"].append(time.perf_counter() - t0)
+
+        # All buffered reports in one transaction
+        t0 = time.perf_counter()
+        agent.flush_reports(conn)
+        STATS.latencies["governance_flush"].append(time.perf_counter() - t0)
+    finally:
+        conn.close()
+
+
+def run_scenario(orchestrator, server, symbols: list[str], timeframe: str, days: int, governance: bool) -> dict:
+    cleanup()
+    STATS.reset()
+    api_before = dict(server.stats)
+
+    end = datetime.now(IST).replace(hour=0, minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=days)
+
+    phases = {}
+
+    t0 = time.perf_counter()
+    orchestrator.run_multi_backfill({
+        "symbols": symbols,
+        "timeframes": [timeframe],
+        "start": start,
+        "end": end,
+    })
+    phases["backfill_sec"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    orchestrator.run_ingestion_job(_job_for_timeframe(timeframe), symbols)
+    phases["incremental_sec"] = time.perf_counter() - t0
+
+    if governance:
+        t0 = time.perf_counter()
+        run_governance(symbols, timeframe)
+        phases["governance_sec"] = time.perf_counter() - t0
+
+    elapsed = sum(phases.values())
+    api = {
+        k: server.stats.get(k, 0) - api_before.get(k, 0)
+        for k in ("historical.requests", "historical.throttled")
+    }
+
+    result = {
+        "symbols": len(symbols),
+        "timeframe": timeframe,
+        "days": days,
+        "elapsed_sec": round(elapsed, 2),
+        **{k: round(v, 2) for k, v in phases.items()},
+        "candles_fetched": STATS.candles_fetched,
+        "candles_written": STATS.candles_written,
+        "candles_per_sec": round(STATS.candles_fetched / phases["backfill_sec"], 1)
+        if phases["backfill_sec"] else None,
+        "api_calls": api["historical.requests"],
+        "api_throttled": api["historical.throttled"],
+        "db_round_trips": STATS.db_round_trips,
+        "governance_errors": STATS.governance_errors,
+        "stages": {
+            stage: _summarize_stage(STATS.latencies[stage])
+            for stage in STAGES
+            if STATS.latencies.get(stage)
+        },
+    }
+
+    cleanup()
+    return result
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingestion throughput benchmark")
+    parser.add_argument(
+        "--symbols", action="append", type=int, dest="symbol_counts",
+        help="Symbol count to run (repeatable, default: 10/100/500)",
+    )
+    parser.add_argument(
+        "--timeframe", action="append", dest="timeframes",
+        help="Timeframe to run (repeatable, default: 5M/15M)",
+    )
+    parser.add_argument("--days", type=int, default=5, help="Backfill window in days")
+    parser.add_argument(
+        "--historical-rps", type=float, default=1000.0,
+        help="Fake broker historical rate limit (Kite: 3)",
+    )
+    parser.add_argument(
+        "--client-interval", type=float, default=None,
+        help="Override KiteClient min call interval (seconds)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Fake broker latency")
+    parser.add_argument("--no-governance", action="store_true")
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    symbol_counts = args.symbol_counts or DEFAULT_SYMBOL_COUNTS
+    timeframes = [tf.upper() for tf in (args.timeframes or DEFAULT_TIMEFRAMES)]
+
+    server = start_fake_broker(
+        bench_symbols(max(symbol_counts)), args.historical_rps, args.latency_ms
+    )
+
+    from data_ingestion.clients.kite_client import KiteClient
+    if args.client_interval is not None:
+        KiteClient._MIN_CALL_INTERVAL_SEC = args.client_interval
+
+    orchestrator = _instrument_orchestrator()
+
+    results = []
+    try:
+        for n in symbol_counts:
+            for tf in timeframes:
+                print(f"▶ {n} symbols | {tf} | {args.days} days")
+                r = run_scenario(
+                    orchestrator, server, bench_symbols(n), tf, args.days,
+                    governance=not args.no_governance,
+                )
+                results.append(r)
+    finally:
+        server.shutdown()
+
+    print(f"\n{'SYMBOLS':>7} | {'TF':<4} | {'CANDLES':>9} | {'C/SEC':>9} | "
+          f"{'API':>6} | {'429':>5} | {'DB RT':>7} | {'FETCH P99':>9} | {'WRITE P99':>9}")
+    print("-" * 90)
+    for r in results:
+        fetch = r["stages"].get("fetch", {})
+        write = r["stages"].get("write", {})
+        print(
+            f"{r['symbols']:>7} | {r['timeframe']:<4} | {r['candles_fetched']:>9} | "
+            f"{r['candles_per_sec'] or '-':>9} | {r['api_calls']:>6} | "
+            f"{r['api_throttled']:>5} | {r['db_round_trips']:>7} | "
+            f"{fetch.get('p99_ms') or '-':>9} | {write.get('p99_ms') or '-':>9}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "run_at": datetime.now(IST).isoformat(),
+                    "config": {
+                        "days": args.days,
+                        "historical_rps": args.historical_rps,
+                        "latency_ms": args.latency_ms,
+                        "client_interval": args.client_interval,
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from datetime import datetime
 
-from dashboard.db import get_db
+from dashboard.cache import cached_json_response, response_cache
+from dashboard.db import get_db, connection
+from dashboard.pagination import decode_cursor, keyset_page
+from data_ingestion.db import ALERT_CHECK_TYPES, DATA_QUALITY_CHANNEL, NOTIFY_PAYLOAD_SQL
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
 
@@ -10,63 +13,87 @@ router = APIRouter(prefix="/alerts", tags=["Alerts"])
 # ACTIVE ALERTS
 # ─────────────────────────────────────────────
 @router.get("/active")
-def get_active_alerts(conn=Depends(get_db)):
+async def get_active_alerts(request: Request):
     """
     Return currently active alerts (RAISED or ACKED).
     """
-    with conn.cursor() as cur:
-        cur.execute(
-            """
-            SELECT
-                id,
-                run_ts,
-                symbol,
-                status,
-                details
-            FROM data_quality_reports
-            WHERE check_type = 'auto_backfill_alert'
-              AND status IN ('RAISED', 'ACKED')
-            ORDER BY run_ts DESC
-            """
-        )
-        return cur.fetchall()
+    async def compute():
+        async with connection() as conn, conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT
+                    id,
+                    run_ts,
+                    symbol,
+                    status,
+                    details
+                FROM data_quality_reports
+                WHERE check_type = ANY(%s)
+                  AND status IN ('RAISED', 'ACKED')
+                ORDER BY run_ts DESC
+                """,
+                (list(ALERT_CHECK_TYPES),),
+            )
+            return await cur.fetchall(), {}
+
+    return await cached_json_response(request, ("alerts_active",), compute)
 
 
 # ─────────────────────────────────────────────
 # ALERT HISTORY
 # ─────────────────────────────────────────────
 @router.get("/history")
-def get_alert_history(
+async def get_alert_history(
+    request: Request,
     limit: int = Query(100, ge=1, le=1000),
-    conn=Depends(get_db),
+    cursor: str | None = Query(None),
+    include_details: bool = Query(False),
 ):
     """
-    Return historical alert lifecycle events.
+    Return historical alert lifecycle events, newest first.
+
+    Keyset-paginated on (run_ts, id): pass the X-Next-Cursor header of
+    one page as `cursor` to fetch the next. `details` is only selected
+    when include_details=true.
     """
-    with conn.cursor() as cur:
-        cur.execute(
-            """
-            SELECT
-                id,
-                run_ts,
-                symbol,
-                status,
-                details
-            FROM data_quality_reports
-            WHERE check_type = 'auto_backfill_alert'
-            ORDER BY run_ts DESC
-            LIMIT %s
-            """,
-            (limit,),
-        )
-        return cur.fetchall()
+    after = decode_cursor(cursor) if cursor else None
+
+    columns = "id, run_ts, symbol, status"
+    if include_details:
+        columns += ", details"
+
+    where = "check_type = ANY(%s)"
+    params = [list(ALERT_CHECK_TYPES)]
+    if after:
+        where += " AND (run_ts, id) < (%s, %s)"
+        params.extend(after)
+
+    async def compute():
+        async with connection() as conn, conn.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT {columns}
+                FROM data_quality_reports
+                WHERE {where}
+                ORDER BY run_ts DESC, id DESC
+                LIMIT %s
+                """,
+                (*params, limit + 1),
+            )
+            return keyset_page(await cur.fetchall(), limit)
+
+    return await cached_json_response(
+        request,
+        ("alerts_history", limit, cursor, include_details),
+        compute,
+    )
 
 
 # ─────────────────────────────────────────────
 # ACKNOWLEDGE ALERT
 # ─────────────────────────────────────────────
 @router.post("/{alert_id}/ack")
-def acknowledge_alert(
+async def acknowledge_alert(
     alert_id: int,
     user: str = Query("unknown"),
     conn=Depends(get_db),
@@ -76,26 +103,39 @@ def acknowledge_alert(
     """
     acknowledged_at = datetime.utcnow().isoformat()
 
-    with conn.cursor() as cur:
-        cur.execute(
+    async with conn.cursor() as cur:
+        await cur.execute(
             """
-            UPDATE data_quality_reports
-            SET
-              status = 'ACKED',
-              details = jsonb_set(
-                COALESCE(details, '{}'),
-                '{acknowledged_by,acknowledged_at}',
-                to_jsonb(%s::text || '|' || %s::text)
-              )
-            WHERE id = %s
-              AND status = 'RAISED'
-            RETURNING id
+            WITH updated AS (
+                UPDATE data_quality_reports
+                SET
+                  status = 'ACKED',
+                  details = jsonb_set(
+                    COALESCE(details, '{}'),
+                    '{acknowledged_by,acknowledged_at}',
+                    to_jsonb(%s::text || '|' || %s::text)
+                  )
+                WHERE id = %s
+                  AND status = 'RAISED'
+                RETURNING id, run_ts, symbol, timeframe, check_type, status, details
+            ),
+            latest AS (
+                UPDATE data_quality_latest l
+                SET status = u.status, details = u.details
+                FROM updated u
+                WHERE l.report_id = u.id
+            )
+            SELECT id, pg_notify(%s, """ + NOTIFY_PAYLOAD_SQL + """)
+            FROM updated
             """,
-            (user, acknowledged_at, alert_id),
+            (user, acknowledged_at, alert_id, DATA_QUALITY_CHANNEL),
         )
 
-        updated = cur.fetchone()
-        conn.commit()
+        updated = await cur.fetchone()
+        await conn.commit()
+
+        # Don't wait for our own NOTIFY before serving fresh data
+        response_cache.invalidate()
 
         if not updated:
             return {
@@ -114,7 +154,7 @@ def acknowledge_alert(
 # RESOLVE ALERT
 # ─────────────────────────────────────────────
 @router.post("/{alert_id}/resolve")
-def resolve_alert(
+async def resolve_alert(
     alert_id: int,
     user: str = Query("unknown"),
     note: str = Query(""),
@@ -125,26 +165,39 @@ def resolve_alert(
     """
     resolved_at = datetime.utcnow().isoformat()
 
-    with conn.cursor() as cur:
-        cur.execute(
+    async with conn.cursor() as cur:
+        await cur.execute(
             """
-            UPDATE data_quality_reports
-            SET
-              status = 'RESOLVED',
-              details = COALESCE(details, '{}') || jsonb_build_object(
-                'resolved_by', %s,
-                'resolved_at', %s,
-                'resolution_note', %s
-              )
-            WHERE id = %s
-              AND status IN ('RAISED', 'ACKED')
-            RETURNING id
+            WITH updated AS (
+                UPDATE data_quality_reports
+                SET
+                  status = 'RESOLVED',
+                  details = COALESCE(details, '{}') || jsonb_build_object(
+                    'resolved_by', %s::text,
+                    'resolved_at', %s::text,
+                    'resolution_note', %s::text
+                  )
+                WHERE id = %s
+                  AND status IN ('RAISED', 'ACKED')
+                RETURNING id, run_ts, symbol, timeframe, check_type, status, details
+            ),
+            latest AS (
+                UPDATE data_quality_latest l
+                SET status = u.status, details = u.details
+                FROM updated u
+                WHERE l.report_id = u.id
+            )
+            SELECT id, pg_notify(%s, """ + NOTIFY_PAYLOAD_SQL + """)
+            FROM updated
             """,
-            (user, resolved_at, note, alert_id),
+            (user, resolved_at, note, alert_id, DATA_QUALITY_CHANNEL),
         )
 
-        updated = cur.fetchone()
-        conn.commit()
+        updated = await cur.fetchone()
+        await conn.commit()
+
+        # Don't wait for our own NOTIFY before serving fresh data
+        response_cache.invalidate()
 
         if not updated:
             return {
@@ -0,0 +1,374 @@
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from psycopg.rows import tuple_row
+
+from agents.calendar.trading_calendar import IST, get_trading_calendar
+from dashboard.db import connection
+from dashboard.downsample import (
+    DAY_MINUTES,
+    DAY_ORIGIN,
+    bucket_starts,
+    lttb_indices,
+    m4_points,
+    ohlc_bucket_minutes,
+    reduce_m4,
+    reduce_ohlc,
+)
+from data_ingestion.archive import ARCHIVE_ROOT, read_candles
+from data_ingestion.db import pooled_connection
+from data_ingestion.retention import retention_cutoff
+from data_ingestion.timeframe_mapper import TIMEFRAMES
+
+router = APIRouter(prefix="/candles", tags=["Candles"])
+
+DEFAULT_POINTS = 1000
+MAX_POINTS = 20_000
+DEFAULT_RANGE = timedelta(days=30)
+
+# Sub-session buckets restart at each day's 09:15 IST open
+SESSION_ORIGIN_SQL = (
+    "((ts AT TIME ZONE 'Asia/Kolkata')::date + TIME '09:15') AT TIME ZONE 'Asia/Kolkata'"
+)
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+OHLC_COLUMNS = ["ts", "open", "high", "low", "close", "volume"]
+LTTB_COLUMNS = ["ts", "close"]
+M4_COLUMNS = [
+    "first_ts", "first", "min_ts", "min",
+    "max_ts", "max", "last_ts", "last",
+]
+
+
+# ─────────────────────────────────────────────
+# Queries
+# ─────────────────────────────────────────────
+async def _fetch_columns(sql: str, params: tuple, columns: list[str]) -> dict:
+    """
+    Run a candle query and return {column: np.ndarray}.
+    ts is returned as epoch milliseconds.
+    """
+    async with connection() as conn:
+        cur = conn.cursor(row_factory=tuple_row)
+        await cur.execute(sql, params)
+        rows = await cur.fetchall()
+
+    cols = list(zip(*rows)) if rows else [()] * len(columns)
+
+    arrays = {}
+    for name, values in zip(columns, cols):
+        dtype = "int64" if name == "volume" or name.endswith("ts") else "float64"
+        arrays[name] = np.array(values, dtype=dtype)
+    return arrays
+
+
+def _read_archived(symbol, timeframe, start, end) -> dict:
+    """
+    OHLC_COLUMNS for [start, end) through archive.read_candles: the
+    Parquet archive plus any hot rows not yet archived.
+    """
+    with pooled_connection() as conn:
+        df = read_candles(conn, symbol, timeframe, start, end, root=ARCHIVE_ROOT)
+
+    ts = pd.to_datetime(df["ts"], utc=True).dt.tz_localize(None)
+    arrays = {"ts": ts.to_numpy("datetime64[ms]").astype("int64")}
+    for name in OHLC_COLUMNS[1:]:
+        dtype = "int64" if name == "volume" else "float64"
+        arrays[name] = df[name].to_numpy(dtype)
+    return arrays
+
+
+def _hot_start(timeframe: str, start: datetime, end: datetime) -> datetime:
+    """
+    Where the Postgres-only part of [start, end) begins. Everything
+    before it may already sit in the archive (see _read_archived).
+    """
+    cutoff = retention_cutoff(timeframe, datetime.now(IST))
+    return min(max(start, cutoff), end)
+
+
+def _concat(parts: list[dict]) -> dict:
+    return {c: np.concatenate([p[c] for p in parts]) for c in parts[0]}
+
+
+def _range_days(start: datetime, end: datetime) -> tuple[int, int]:
+    """
+    (trading days, calendar days) touched by [start, end), in IST.
+    """
+    first_day = start.astimezone(IST).date()
+    last_day = (end - timedelta(microseconds=1)).astimezone(IST).date()
+    trading_days = len(get_trading_calendar().trading_days(first_day, last_day))
+    return trading_days, (last_day - first_day).days + 1
+
+
+async def _bucket_minutes(timeframe, start, end, points) -> int:
+    # The calendar loads holidays over psycopg2 on first use
+    trading_days, calendar_days = await run_in_threadpool(_range_days, start, end)
+    return ohlc_bucket_minutes(
+        TIMEFRAMES[timeframe]["minutes"], trading_days, calendar_days, points
+    )
+
+
+def _bucket_sql(bucket_minutes: int) -> str:
+    """
+    time_bucket() expression matching downsample.bucket_starts.
+    """
+    if bucket_minutes % DAY_MINUTES == 0:
+        return "time_bucket(%(width)s, ts, origin => %(day_origin)s)"
+    return f"time_bucket(%(width)s, ts, origin => {SESSION_ORIGIN_SQL})"
+
+
+def _bucket_params(symbol, timeframe, start, end, bucket_minutes) -> dict:
+    return {
+        "width": timedelta(minutes=bucket_minutes),
+        "day_origin": DAY_ORIGIN,
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "start": start,
+        "end": end,
+    }
+
+
+async def _ohlc(symbol, timeframe, start, end, points) -> tuple[dict, int]:
+    tf_minutes = TIMEFRAMES[timeframe]["minutes"]
+    bucket_minutes = await _bucket_minutes(timeframe, start, end, points)
+    hot_start = _hot_start(timeframe, start, end)
+
+    parts = []
+    if start < hot_start:
+        rows = await run_in_threadpool(
+            _read_archived, symbol, timeframe, start, hot_start
+        )
+        if bucket_minutes != tf_minutes:
+            keys = bucket_starts(rows["ts"], bucket_minutes)
+            rows = reduce_ohlc(keys, *(rows[c] for c in OHLC_COLUMNS[1:]))
+        parts.append(rows)
+
+    if hot_start < end:
+        if bucket_minutes == tf_minutes:
+            sql = """
+                SELECT
+                    (EXTRACT(EPOCH FROM ts) * 1000)::bigint,
+                    open::float8,
+                    high::float8,
+                    low::float8,
+                    close::float8,
+                    volume::bigint
+                FROM candles
+                WHERE symbol = %s
+                  AND timeframe = %s
+                  AND ts >= %s
+                  AND ts < %s
+                ORDER BY ts
+            """
+            params = (symbol, timeframe, hot_start, end)
+        else:
+            # Re-bucket inside TimescaleDB so only `points` rows leave the DB
+            sql = f"""
+                SELECT
+                    (EXTRACT(EPOCH FROM bucket) * 1000)::bigint,
+                    open, high, low, close, volume
+                FROM (
+                    SELECT
+                        {_bucket_sql(bucket_minutes)} AS bucket,
+                        first(open, ts)::float8 AS open,
+                        MAX(high)::float8 AS high,
+                        MIN(low)::float8 AS low,
+                        last(close, ts)::float8 AS close,
+                        SUM(volume)::bigint AS volume
+                    FROM candles
+                    WHERE symbol = %(symbol)s
+                      AND timeframe = %(timeframe)s
+                      AND ts >= %(start)s
+                      AND ts < %(end)s
+                    GROUP BY bucket
+                ) b
+                ORDER BY bucket
+            """
+            params = _bucket_params(symbol, timeframe, hot_start, end, bucket_minutes)
+        parts.append(await _fetch_columns(sql, params, OHLC_COLUMNS))
+
+    arrays = _concat(parts)
+    if len(parts) > 1 and bucket_minutes != tf_minutes:
+        # Merge the bucket that straddles the retention cutoff
+        arrays = reduce_ohlc(arrays["ts"], *(arrays[c] for c in OHLC_COLUMNS[1:]))
+
+    return arrays, bucket_minutes
+
+
+async def _lttb(symbol, timeframe, start, end, points) -> dict:
+    tf_minutes = TIMEFRAMES[timeframe]["minutes"]
+    bucket_minutes = await _bucket_minutes(timeframe, start, end, points)
+    hot_start = _hot_start(timeframe, start, end)
+
+    parts = []
+    if start < hot_start:
+        rows = await run_in_threadpool(
+            _read_archived, symbol, timeframe, start, hot_start
+        )
+        ts, close = rows["ts"], rows["close"]
+        if bucket_minutes != tf_minutes:
+            ts, close = m4_points(*reduce_m4(ts, close, bucket_minutes))
+        parts.append({"ts": ts, "close": close})
+
+    if hot_start < end:
+        if bucket_minutes == tf_minutes:
+            parts.append(await _fetch_columns(
+                """
+                SELECT
+                    (EXTRACT(EPOCH FROM ts) * 1000)::bigint,
+                    close::float8
+                FROM candles
+                WHERE symbol = %s
+                  AND timeframe = %s
+                  AND ts >= %s
+                  AND ts < %s
+                ORDER BY ts
+                """,
+                (symbol, timeframe, hot_start, end),
+                LTTB_COLUMNS,
+            ))
+        else:
+            # Pre-reduce to each bucket's first/min/max/last close (at most
+            # 4 x points rows) so the raw series never leaves the DB
+            m4 = await _fetch_columns(
+                f"""
+                SELECT
+                    (EXTRACT(EPOCH FROM first(ts, ts)) * 1000)::bigint,
+                    first(close, ts)::float8,
+                    (EXTRACT(EPOCH FROM first(ts, close)) * 1000)::bigint,
+                    MIN(close)::float8,
+                    (EXTRACT(EPOCH FROM last(ts, close)) * 1000)::bigint,
+                    MAX(close)::float8,
+                    (EXTRACT(EPOCH FROM last(ts, ts)) * 1000)::bigint,
+                    last(close, ts)::float8
+                FROM candles
+                WHERE symbol = %(symbol)s
+                  AND timeframe = %(timeframe)s
+                  AND ts >= %(start)s
+                  AND ts < %(end)s
+                GROUP BY {_bucket_sql(bucket_minutes)}
+                """,
+                _bucket_params(symbol, timeframe, hot_start, end, bucket_minutes),
+                M4_COLUMNS,
+            )
+            ts, close = m4_points(*(m4[c] for c in M4_COLUMNS))
+            parts.append({"ts": ts, "close": close})
+
+    # Tiers are split at hot_start, so the parts never share a timestamp
+    arrays = _concat(parts)
+    idx = lttb_indices(arrays["ts"], arrays["close"], points)
+    return {k: v[idx] for k, v in arrays.items()}
+
+
+# ─────────────────────────────────────────────
+# Encoders
+# ─────────────────────────────────────────────
+def _arrow_response(arrays: dict, metadata: dict) -> Response:
+    batch = pa.record_batch(
+        [
+            pa.array(arrays["ts"], type=pa.timestamp("ms", tz="UTC"))
+            if name == "ts" else pa.array(values)
+            for name, values in arrays.items()
+        ],
+        names=list(arrays),
+    )
+    batch = batch.replace_schema_metadata(
+        {k: str(v) for k, v in metadata.items()}
+    )
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+
+    return Response(
+        content=sink.getvalue().to_pybytes(),
+        media_type=ARROW_MEDIA_TYPE,
+    )
+
+
+def _json_response(arrays: dict, metadata: dict) -> Response:
+    payload = {
+        **metadata,
+        "columns": list(arrays),
+        "data": [arrays[c].tolist() for c in arrays],
+    }
+    return Response(
+        content=json.dumps(payload, separators=(",", ":")),
+        media_type="application/json",
+    )
+
+
+# ─────────────────────────────────────────────
+# Endpoint
+# ─────────────────────────────────────────────
+@router.get("/{symbol}")
+async def get_candles(
+    symbol: str,
+    timeframe: str = Query("1M"),
+    start: datetime | None = Query(None),
+    end: datetime | None = Query(None),
+    points: int = Query(DEFAULT_POINTS, ge=3, le=MAX_POINTS),
+    mode: Literal["ohlc", "lttb"] = Query("ohlc"),
+    format: Literal["json", "arrow"] = Query("json"),
+):
+    """
+    Candles for a time range, downsampled on the server to ~`points`.
+
+    - mode=ohlc: OHLCV re-bucketed to the smallest multiple of the
+      timeframe that fits `points` buckets (exact when it already fits).
+      Intraday buckets restart at each session open; wider ones are
+      whole IST days
+    - mode=lttb: close-only series reduced with Largest-Triangle-Three-Buckets
+      over the per-bucket first/min/max/last closes of the same buckets
+
+    Ranges reaching past the retention cutoff read the older part from
+    the Parquet archive (data_ingestion.archive.read_candles).
+
+    JSON is columnar: {"columns": [...], "data": [[...], ...]} with ts in
+    epoch milliseconds. format=arrow returns an Arrow IPC stream.
+    """
+    timeframe = timeframe.upper()
+    if timeframe not in TIMEFRAMES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported timeframe '{timeframe}'. "
+                   f"Supported: {list(TIMEFRAMES.keys())}",
+        )
+
+    end = end or datetime.now(timezone.utc)
+    start = start or end - DEFAULT_RANGE
+
+    if end.tzinfo is None or start.tzinfo is None:
+        raise HTTPException(
+            status_code=400, detail="start/end must include a UTC offset"
+        )
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    if mode == "ohlc":
+        arrays, bucket_minutes = await _ohlc(symbol, timeframe, start, end, points)
+    else:
+        arrays = await _lttb(symbol, timeframe, start, end, points)
+        bucket_minutes = None
+
+    metadata = {
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "mode": mode,
+        "bucket_minutes": bucket_minutes,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+    }
+
+    if format == "arrow":
+        return _arrow_response(arrays, metadata)
+
+    return _json_response(arrays, metadata)
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from data_ingestion.export import EXPORT_FORMATS, stream_export
+from data_ingestion.timeframe_mapper import TIMEFRAMES
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+MAX_EXPORT_SYMBOLS = 500
+
+
+@router.get("/candles")
+def export_candles(
+    symbols: list[str] = Query(...),
+    timeframe: str = Query(...),
+    start: datetime = Query(...),
+    end: datetime = Query(...),
+    format: Literal["arrow", "parquet"] = Query("parquet"),
+):
+    """
+    Bulk candle download as an Arrow IPC stream or Parquet file.
+
+    Rows are read through a server-side cursor and encoded batch by
+    batch, so memory stays constant regardless of range or symbol count.
+    Ranges past the retention cutoff are read from the Parquet archive
+    one symbol-year at a time.
+    The sync generator runs on the threadpool with its own connection,
+    keeping long downloads off the async request pool.
+    """
+    timeframe = timeframe.upper()
+    if timeframe not in TIMEFRAMES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported timeframe '{timeframe}'. "
+                   f"Supported: {list(TIMEFRAMES.keys())}",
+        )
+
+    if len(symbols) > MAX_EXPORT_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_EXPORT_SYMBOLS} symbols per export",
+        )
+
+    if end.tzinfo is None or start.tzinfo is None:
+        raise HTTPException(
+            status_code=400, detail="start/end must include a UTC offset"
+        )
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    ext = "arrows" if format == "arrow" else "parquet"
+    filename = f"candles_{timeframe}_{start:%Y%m%d}_{end:%Y%m%d}.{ext}"
+
+    return StreamingResponse(
+        stream_export(symbols, timeframe, start, end, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
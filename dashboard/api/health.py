@@ -1,30 +1,34 @@
-from fastapi import APIRouter, Depends
-from dashboard.db import get_db
-from dashboard.schemas import SymbolHealth
+from fastapi import APIRouter, Query, Request
+from fastapi.concurrency import run_in_threadpool
+
+from dashboard.cache import cached_json_response
+from dashboard.db import connection
+from dashboard.schemas import SeriesLag, SymbolHealth
+from monitoring.health_metrics import LAST_TS_SQL, compute_health
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
 
-@router.get("/symbols", response_model=list[SymbolHealth])
-def get_symbol_health(conn=Depends(get_db)):
-    cur = conn.cursor()
+async def _load_symbol_health():
+    async with connection() as conn:
+        cur = conn.cursor()
 
-    cur.execute("""
-        WITH latest AS (
-            SELECT DISTINCT ON (symbol, timeframe, check_type)
+        # data_quality_latest holds one row per (symbol, timeframe, check_type),
+        # so this read is O(series) regardless of report history size.
+        await cur.execute("""
+            SELECT
                 symbol,
                 timeframe,
                 check_type,
                 status
-            FROM data_quality_reports
-            ORDER BY symbol, timeframe, check_type, run_ts DESC
-        )
-        SELECT * FROM latest
-    """)
+            FROM data_quality_latest
+            WHERE check_type IN ('daily_coverage', 'auto_backfill', 'freshness')
+        """)
+        rows = await cur.fetchall()
 
     health = {}
 
-    for row in cur.fetchall():
+    for row in rows:
         symbol = row["symbol"]
         health.setdefault(symbol, {
             "symbol": symbol,
@@ -42,4 +46,34 @@ def get_symbol_health(conn=Depends(get_db)):
         elif row["check_type"] == "freshness":
             health[symbol]["freshness"][row["timeframe"]] = row["status"]
 
-    return list(health.values())
+    return list(health.values()), {}
+
+
+@router.get("/symbols", responses={200: {"model": list[SymbolHealth]}})
+async def get_symbol_health(request: Request):
+    return await cached_json_response(
+        request, ("health_symbols",), _load_symbol_health, list[SymbolHealth]
+    )
+
+
+@router.get("/lag", response_model=list[SeriesLag])
+async def get_series_lag(
+    symbol: list[str] | None = Query(None),
+    timeframe: list[str] | None = Query(None),
+    status: str | None = Query(None, description="OK, WARN or NO_DATA"),
+):
+    """
+    Trading-time lag of every series (or the requested ones) from one
+    watermark query. Not cached: lag moves every minute in session.
+    """
+    async with connection() as conn, conn.cursor() as cur:
+        await cur.execute(LAST_TS_SQL, {"symbols": symbol, "timeframes": timeframe})
+        last_ts = {(r["symbol"], r["timeframe"]): r["last_ts"] for r in await cur.fetchall()}
+
+    # The trading calendar loads holidays over psycopg2 on first use
+    results = await run_in_threadpool(compute_health, last_ts, symbol, timeframe)
+
+    return [
+        r.as_dict() for r in results
+        if status is None or r.status == status
+    ]
@@ -0,0 +1,139 @@
+from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+
+from dashboard.db import connection
+from dashboard.pagination import decode_cursor, keyset_page
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+RUN_COLUMNS = """
+    id, run_ts, finished_at, job_name, timeframe, replica, status,
+    symbols, symbols_failed, symbols_abandoned, api_calls, gap_refetches,
+    rows_fetched, rows_written, duration_ms, fetch_ms, db_ms, sleep_ms,
+    deadline_hit
+"""
+
+
+# ─────────────────────────────────────────────
+# RUN HISTORY
+# ─────────────────────────────────────────────
+@router.get("/runs")
+async def get_job_runs(
+    job_name: str | None = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = Query(None),
+    include_symbols: bool = Query(False),
+):
+    """
+    Scheduler job runs with stage timings and counts, newest first.
+
+    Keyset-paginated on (run_ts, id) via the X-Next-Cursor header.
+    The per-symbol breakdown is only selected when include_symbols=true.
+    Not cached: a new run lands every minute during market hours.
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    columns = RUN_COLUMNS
+    if include_symbols:
+        columns += ", per_symbol"
+
+    where = ["TRUE"]
+    params = []
+    if job_name:
+        where.append("job_name = %s")
+        params.append(job_name)
+    if after:
+        where.append("(run_ts, id) < (%s, %s)")
+        params.extend(after)
+
+    async with connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            f"""
+            SELECT {columns}
+            FROM job_runs
+            WHERE {" AND ".join(where)}
+            ORDER BY run_ts DESC, id DESC
+            LIMIT %s
+            """,
+            (*params, limit + 1),
+        )
+        rows, headers = keyset_page(await cur.fetchall(), limit)
+
+    return JSONResponse(jsonable_encoder(rows), headers=headers)
+
+
+# ─────────────────────────────────────────────
+# BUDGET SUMMARY
+# ─────────────────────────────────────────────
+@router.get("/summary")
+async def get_job_summary(
+    hours: int = Query(24, ge=1, le=24 * 30),
+    top: int = Query(10, ge=1, le=100),
+):
+    """
+    Per-job duration percentiles and totals over the last `hours`, plus
+    the symbols with the most fetch time per job: what is eating each
+    job's budget.
+    """
+    async with connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            """
+            SELECT
+                job_name,
+                timeframe,
+                COUNT(*) AS runs,
+                COUNT(*) FILTER (WHERE status <> 'ok') AS runs_not_ok,
+                COUNT(*) FILTER (WHERE deadline_hit) AS deadline_hits,
+                percentile_cont(0.5) WITHIN GROUP (ORDER BY duration_ms) AS p50_duration_ms,
+                percentile_cont(0.95) WITHIN GROUP (ORDER BY duration_ms) AS p95_duration_ms,
+                MAX(duration_ms) AS max_duration_ms,
+                AVG(fetch_ms) AS avg_fetch_ms,
+                AVG(db_ms) AS avg_db_ms,
+                AVG(sleep_ms) AS avg_sleep_ms,
+                SUM(api_calls) AS api_calls,
+                SUM(gap_refetches) AS gap_refetches,
+                SUM(rows_written) AS rows_written
+            FROM job_runs
+            WHERE run_ts > NOW() - make_interval(hours => %s)
+            GROUP BY job_name, timeframe
+            ORDER BY job_name
+            """,
+            (hours,),
+        )
+        jobs = await cur.fetchall()
+
+        await cur.execute(
+            """
+            SELECT job_name, symbol, fetch_ms, api_calls, gap_refetches
+            FROM (
+                SELECT
+                    r.job_name,
+                    s.key AS symbol,
+                    SUM((s.value->>'fetch_ms')::float8) AS fetch_ms,
+                    SUM((s.value->>'api_calls')::int) AS api_calls,
+                    SUM((s.value->>'gap_refetches')::int) AS gap_refetches,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY r.job_name
+                        ORDER BY SUM((s.value->>'fetch_ms')::float8) DESC NULLS LAST
+                    ) AS rank
+                FROM job_runs r,
+                     jsonb_each(r.per_symbol) s
+                WHERE r.run_ts > NOW() - make_interval(hours => %s)
+                GROUP BY r.job_name, s.key
+            ) ranked
+            WHERE rank <= %s
+            ORDER BY job_name, rank
+            """,
+            (hours, top),
+        )
+        slowest = await cur.fetchall()
+
+    by_job = {}
+    for row in slowest:
+        by_job.setdefault(row.pop("job_name"), []).append(row)
+
+    for job in jobs:
+        job["slowest_symbols"] = by_job.get(job["job_name"], [])
+
+    return jobs
@@ -1,24 +1,53 @@
-from fastapi import APIRouter, Depends
-from dashboard.db import get_db
+from fastapi import APIRouter, Query, Request
+from dashboard.cache import cached_json_response
+from dashboard.db import connection
+from dashboard.pagination import decode_cursor, keyset_page
 from dashboard.schemas import QualityEvent
 
 router = APIRouter(prefix="/symbols", tags=["Symbols"])
 
 
-@router.get("/{symbol}/history", response_model=list[QualityEvent])
-def get_symbol_history(symbol: str, limit: int = 50, conn=Depends(get_db)):
-    cur = conn.cursor()
+@router.get("/{symbol}/history", responses={200: {"model": list[QualityEvent]}})
+async def get_symbol_history(
+    request: Request,
+    symbol: str,
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: str | None = Query(None),
+    include_details: bool = Query(False),
+):
+    """
+    Report history for one symbol, newest first.
+    Keyset-paginated on (run_ts, id) via the X-Next-Cursor header.
+    """
+    after = decode_cursor(cursor) if cursor else None
 
-    cur.execute("""
-        SELECT
-            run_ts,
-            check_type,
-            status,
-            details
-        FROM data_quality_reports
-        WHERE symbol = %s
-        ORDER BY run_ts DESC
-        LIMIT %s
-    """, (symbol, limit))
+    columns = "id, run_ts, check_type, status"
+    if include_details:
+        columns += ", details"
 
-    return cur.fetchall()
+    where = "symbol = %s"
+    params = [symbol]
+    if after:
+        where += " AND (run_ts, id) < (%s, %s)"
+        params.extend(after)
+
+    async def compute():
+        async with connection() as conn:
+            cur = conn.cursor()
+
+            await cur.execute(f"""
+                SELECT {columns}
+                FROM data_quality_reports
+                WHERE {where}
+                ORDER BY run_ts DESC, id DESC
+                LIMIT %s
+            """, (*params, limit + 1))
+
+            return keyset_page(await cur.fetchall(), limit)
+
+    return await cached_json_response(
+        request,
+        ("symbol_history", symbol, limit, cursor, include_details),
+        compute,
+        list[QualityEvent],
+    )
@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+# ─────────────────────────────────────────────
+# Cache configuration
+# ─────────────────────────────────────────────
+MAX_ENTRIES = 512
+
+# Safety net only — entries are invalidated on every report write
+TTL_SEC = 60.0
+
+
+class CachedResponse:
+    __slots__ = ("body", "etag", "headers", "expires_at")
+
+    def __init__(self, body: bytes, headers: dict, ttl: float):
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        self.headers = headers
+        self.expires_at = time.monotonic() + ttl
+
+
+class ResponseCache:
+    """
+    In-process TTL + LRU cache of serialized JSON responses.
+
+    Keys are (endpoint, params) tuples. Every data quality report write
+    clears the cache; a generation counter keeps a computation that
+    raced with an invalidation from storing its (stale) result.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl: float = TTL_SEC):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, CachedResponse] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._generation = 0
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, entry: CachedResponse):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self):
+        self._generation += 1
+        self._entries.clear()
+
+    async def get_or_compute(
+        self,
+        key: tuple,
+        compute: Callable[[], Awaitable[tuple[Any, dict]]],
+    ) -> CachedResponse:
+        """
+        Return the cached entry for `key`, computing it at most once
+        across concurrent callers. `compute` returns (payload, headers).
+        """
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+
+        try:
+            payload, headers = await compute()
+            body = json.dumps(
+                jsonable_encoder(payload), separators=(",", ":")
+            ).encode()
+            entry = CachedResponse(body, headers, self.ttl)
+
+            if generation == self._generation:
+                self.put(key, entry)
+
+            future.set_result(entry)
+            return entry
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged
+            future.exception()
+            raise
+
+        finally:
+            self._inflight.pop(key, None)
+
+
+response_cache = ResponseCache()
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = [t.strip() for t in if_none_match.split(",")]
+    return etag in candidates or f"W/{etag}" in candidates
+
+
+async def cached_json_response(
+    request: Request,
+    key: tuple,
+    compute: Callable[[], Awaitable[tuple[Any, dict]]],
+    model: Any = None,
+) -> Response:
+    """
+    Serve a JSON payload from the response cache with a strong ETag.
+    A matching If-None-Match returns 304 without touching the DB or
+    re-serializing the payload.
+
+    FastAPI does not validate a returned Response against the route's
+    response_model, so routes pass their `model` (e.g. list[Foo]) here
+    and declare it with `responses=` instead. The payload is validated
+    and filtered by it once, before it is cached.
+    """
+    if model is not None:
+        adapter = TypeAdapter(model)
+        compute_raw = compute
+
+        async def compute():
+            payload, headers = await compute_raw()
+            return adapter.dump_python(adapter.validate_python(payload), mode="json"), headers
+
+    entry = await response_cache.get_or_compute(key, compute)
+
+    headers = {
+        "ETag": entry.etag,
+        "Cache-Control": "no-cache",
+        **entry.headers,
+    }
+
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=entry.body,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -1,8 +1,45 @@
-from data_ingestion.db import get_db_connection
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 
-def get_db():
-    conn = get_db_connection()
-    try:
+from data_ingestion.db import get_db_conninfo
+
+# ─────────────────────────────────────────────
+# Async connection pool (one per API process)
+# ─────────────────────────────────────────────
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 20
+POOL_TIMEOUT_SEC = 10.0
+
+pool = AsyncConnectionPool(
+    conninfo=get_db_conninfo(),
+    min_size=POOL_MIN_SIZE,
+    max_size=POOL_MAX_SIZE,
+    timeout=POOL_TIMEOUT_SEC,
+    kwargs={"row_factory": dict_row},
+    open=False,
+)
+
+
+async def open_pool():
+    await pool.open(wait=True)
+
+
+async def close_pool():
+    await pool.close()
+
+
+async def get_db():
+    """
+    Borrow a pooled async connection for the duration of a request.
+    The pool commits on clean exit and rolls back on error.
+    """
+    async with pool.connection() as conn:
         yield conn
-    finally:
-        conn.close()
+
+
+def connection():
+    """
+    Pooled connection context for handlers that only need the DB
+    on a cache miss.
+    """
+    return pool.connection()
@@ -0,0 +1,199 @@
+import math
+from datetime import datetime, timezone
+
+import numpy as np
+
+
+# Regular NSE session (09:15-15:30 IST). Buckets narrower than a
+# session restart at every session open; wider ones span whole days.
+SESSION_MINUTES = 375
+SESSION_OPEN_OFFSET_MS = (9 * 60 + 15) * 60_000
+DAY_MINUTES = 1440
+DAY_MS = DAY_MINUTES * 60_000
+
+# IST is UTC+05:30 all year (no DST)
+IST_OFFSET_MS = 330 * 60_000
+
+# Multi-day buckets are aligned to this IST midnight
+DAY_ORIGIN = datetime(2000, 1, 2, 18, 30, tzinfo=timezone.utc)
+DAY_ORIGIN_MS = int(DAY_ORIGIN.timestamp() * 1000)
+
+
+def ohlc_bucket_minutes(
+    timeframe_minutes: int,
+    trading_days: int,
+    calendar_days: int,
+    target_points: int,
+) -> int:
+    """
+    Bucket width in minutes that re-buckets a range touching
+    `trading_days` sessions (`calendar_days` days) into at most
+    `target_points` buckets (see bucket_starts for the alignment).
+
+    - intraday: the narrowest multiple of the timeframe with
+      ceil(SESSION_MINUTES / width) buckets per session that fits
+    - otherwise whole days (a multiple of DAY_MINUTES)
+    """
+    target_points = max(target_points, 2)
+
+    if timeframe_minutes < DAY_MINUTES:
+        per_session = target_points // max(trading_days, 1)
+        if per_session >= 1:
+            width = math.ceil(SESSION_MINUTES / per_session)
+            width = math.ceil(width / timeframe_minutes) * timeframe_minutes
+            if width < SESSION_MINUTES:
+                return width
+            # One bucket per trading day; days without a session are
+            # never emitted
+            return DAY_MINUTES
+    elif trading_days <= target_points:
+        return timeframe_minutes
+
+    # Day windows also cover weekends and holidays, and the range's ends
+    # may each start a partial one
+    days = max(1, math.ceil(calendar_days / (target_points - 1)))
+    return days * DAY_MINUTES
+
+
+def bucket_starts(ts_ms: np.ndarray, bucket_minutes: int) -> np.ndarray:
+    """
+    Bucket start (epoch ms) of each timestamp. Sub-session buckets are
+    aligned to the 09:15 IST open of the timestamp's own day, day
+    buckets to IST midnight. Mirrors the SQL in dashboard.api.candles.
+    """
+    ts_ms = np.asarray(ts_ms, dtype="int64")
+    width = bucket_minutes * 60_000
+
+    if bucket_minutes % DAY_MINUTES == 0:
+        origin = DAY_ORIGIN_MS
+    else:
+        ist_midnight = (ts_ms + IST_OFFSET_MS) // DAY_MS * DAY_MS - IST_OFFSET_MS
+        origin = ist_midnight + SESSION_OPEN_OFFSET_MS
+
+    return origin + (ts_ms - origin) // width * width
+
+
+def _runs(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    First and last index of each run of equal values in sorted `keys`.
+    """
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+    return starts, ends
+
+
+def reduce_ohlc(
+    keys: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+) -> dict:
+    """
+    OHLCV per run of equal `keys` in ts-ordered rows, keyed by ts=key.
+    Same aggregates as the time_bucket query in dashboard.api.candles.
+    """
+    keys = np.asarray(keys, dtype="int64")
+    if not len(keys):
+        return {
+            "ts": keys, "open": open_, "high": high,
+            "low": low, "close": close, "volume": volume,
+        }
+
+    starts, ends = _runs(keys)
+    return {
+        "ts": keys[starts],
+        "open": open_[starts],
+        "high": np.maximum.reduceat(high, starts),
+        "low": np.minimum.reduceat(low, starts),
+        "close": close[ends],
+        "volume": np.add.reduceat(volume, starts),
+    }
+
+
+def reduce_m4(ts: np.ndarray, close: np.ndarray, bucket_minutes: int) -> tuple:
+    """
+    Per-bucket first/min/max/last closes of ts-ordered rows, in
+    m4_points argument order.
+    """
+    if not len(ts):
+        return (ts, close) * 4
+
+    keys = bucket_starts(ts, bucket_minutes)
+    starts, ends = _runs(keys)
+
+    # Sorted by bucket, then close: each bucket keeps its run's positions
+    by_close = np.lexsort((close, keys))
+    lo, hi = by_close[starts], by_close[ends]
+
+    return (
+        ts[starts], close[starts],
+        ts[lo], close[lo],
+        ts[hi], close[hi],
+        ts[ends], close[ends],
+    )
+
+
+def m4_points(
+    first_ts: np.ndarray, first: np.ndarray,
+    min_ts: np.ndarray, min_: np.ndarray,
+    max_ts: np.ndarray, max_: np.ndarray,
+    last_ts: np.ndarray, last: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Expand per-bucket first/min/max/last values into one time-ordered
+    series (duplicate timestamps collapsed). Keeps every extreme a line
+    chart would draw, so LTTB over it matches LTTB over the raw series
+    closely at a fraction of the rows.
+    """
+    ts = np.concatenate([first_ts, min_ts, max_ts, last_ts]).astype("int64")
+    values = np.concatenate([first, min_, max_, last]).astype("float64")
+
+    ts, idx = np.unique(ts, return_index=True)
+    return ts, values[idx]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of the `threshold` points of (x, y) that best
+    preserve the visual shape of the series. First and last points are
+    always kept.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = x.astype("float64")
+    y = y.astype("float64")
+
+    every = (n - 2) / (threshold - 2)
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        # Average point of the *next* bucket
+        avg_start = int(math.floor((i + 1) * every)) + 1
+        avg_end = min(int(math.floor((i + 2) * every)) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        # Candidates in the current bucket
+        start = int(math.floor(i * every)) + 1
+        end = int(math.floor((i + 1) * every)) + 1
+
+        ax, ay = x[a], y[a]
+        areas = np.abs(
+            (ax - avg_x) * (y[start:end] - ay)
+            - (ax - x[start:end]) * (avg_y - ay)
+        )
+
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+
+    return indices
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import logging
+
+import psycopg
+
+from dashboard.cache import response_cache
+from data_ingestion.db import get_db_conninfo, ALERT_CHECK_TYPES, DATA_QUALITY_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+# Check types that make up a row of /health/symbols
+HEALTH_CHECK_TYPES = {"daily_coverage", "auto_backfill", "freshness"}
+
+SUBSCRIBER_QUEUE_SIZE = 256
+RECONNECT_DELAY_SEC = 5.0
+
+
+class EventBroadcaster:
+    """
+    Fans out data quality NOTIFY events to SSE subscribers.
+
+    A single LISTEN connection is shared by every open dashboard,
+    so database load scales with the number of report changes,
+    not the number of viewers.
+    """
+
+    def __init__(self, channel: str = DATA_QUALITY_CHANNEL):
+        self.channel = channel
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+
+    # ─────────────────────────────────────────────
+    # Lifecycle
+    # ─────────────────────────────────────────────
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ─────────────────────────────────────────────
+    # Subscriptions
+    # ─────────────────────────────────────────────
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def publish(self, event: str, data: dict):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait((event, data))
+            except asyncio.QueueFull:
+                # Slow client: drop it, EventSource reconnects and resyncs
+                logger.warning("SSE subscriber queue full — dropping client")
+                self._subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    # ─────────────────────────────────────────────
+    # LISTEN loop
+    # ─────────────────────────────────────────────
+    async def _listen_forever(self):
+        while True:
+            try:
+                conn = await psycopg.AsyncConnection.connect(
+                    get_db_conninfo(), autocommit=True
+                )
+                async with conn:
+                    await conn.execute(f"LISTEN {self.channel}")
+                    # Writes may have been missed while disconnected
+                    response_cache.invalidate()
+                    logger.info(f"LISTEN {self.channel} | subscribers={len(self._subscribers)}")
+
+                    async for notify in conn.notifies():
+                        self._dispatch(notify.payload)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(
+                    f"LISTEN {self.channel} failed — retrying in {RECONNECT_DELAY_SEC}s"
+                )
+                await asyncio.sleep(RECONNECT_DELAY_SEC)
+
+    def _dispatch(self, payload: str):
+        # Any report write may change a cached payload
+        response_cache.invalidate()
+
+        try:
+            report = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed notify payload: {payload!r}")
+            return
+
+        check_type = report.get("check_type")
+
+        if check_type in HEALTH_CHECK_TYPES:
+            self.publish("health", {
+                "symbol": report["symbol"],
+                "timeframe": report["timeframe"],
+                "check_type": check_type,
+                "status": report["status"],
+            })
+
+        elif check_type in ALERT_CHECK_TYPES:
+            alert = {
+                "id": report["id"],
+                "run_ts": report["run_ts"],
+                "symbol": report["symbol"],
+                "status": report["status"],
+            }
+            # Left out when too large for NOTIFY; clients keep what they have
+            if report.get("details") is not None:
+                alert["details"] = report["details"]
+            self.publish("alert", alert)
+
+
+broadcaster = EventBroadcaster()
+
+
+def format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -1,13 +1,44 @@
-from fastapi import FastAPI
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from dashboard.api.alerts import router as alerts_router
+from dashboard.api.candles import router as candles_router
+from dashboard.api.export import router as export_router
 from dashboard.api.health import router as health_router
+from dashboard.api.jobs import router as jobs_router
 from dashboard.api.symbols import router as symbols_router
+from dashboard.db import open_pool, close_pool
+from dashboard.events import broadcaster, format_sse
+from dashboard.pagination import NEXT_CURSOR_HEADER
+from monitoring.metrics import API_REQUEST_SECONDS, register_lag_collector
+
+SSE_HEARTBEAT_SEC = 15.0
+SSE_RETRY_MS = 5000
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_pool()
+    broadcaster.start()
+    register_lag_collector()
+    try:
+        yield
+    finally:
+        await broadcaster.stop()
+        await close_pool()
+
 
 app = FastAPI(
     title="Market Data Governance Dashboard",
-    version="1.0"
+    version="1.0",
+    lifespan=lifespan,
 )
 
 # ✅ CORS CONFIG (REQUIRED FOR FRONTEND)
@@ -20,9 +51,80 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", NEXT_CURSOR_HEADER],
 )
 
+@app.middleware("http")
+async def observe_latency(request: Request, call_next):
+    t0 = time.perf_counter()
+    response = await call_next(request)
+
+    # Label by route template (/symbols/{symbol}/history), not raw path
+    route = request.scope.get("route")
+    if route is not None and route.path not in ("/metrics", "/events"):
+        API_REQUEST_SECONDS.labels(
+            request.method, route.path, str(response.status_code)
+        ).observe(time.perf_counter() - t0)
+    return response
+
+
 # Routers
 app.include_router(alerts_router)
+app.include_router(candles_router)
+app.include_router(export_router)
 app.include_router(health_router)
+app.include_router(jobs_router)
 app.include_router(symbols_router)
+
+
+# ─────────────────────────────────────────────
+# PROMETHEUS
+# ─────────────────────────────────────────────
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    # Collection runs the candle lag query (blocking psycopg2)
+    body = await run_in_threadpool(generate_latest)
+    return Response(body, media_type=CONTENT_TYPE_LATEST)
+
+
+# ─────────────────────────────────────────────
+# SERVER-SENT EVENTS (health / alert deltas)
+# ─────────────────────────────────────────────
+@app.get("/events", tags=["Events"])
+async def stream_events(request: Request):
+    """
+    Push health and alert deltas as the governance agent writes reports.
+    Clients should load /health/symbols and /alerts/active once, then
+    apply `health` and `alert` events on top.
+    """
+    queue = broadcaster.subscribe()
+
+    async def event_stream():
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+
+            while not await request.is_disconnected():
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), timeout=SSE_HEARTBEAT_SEC
+                    )
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+
+                if item is None:
+                    break
+
+                event, data = item
+                yield format_sse(event, data)
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,37 @@
+import base64
+from datetime import datetime
+
+from fastapi import HTTPException
+
+# Response header carrying the cursor for the next (older) page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(run_ts: datetime, row_id: int) -> str:
+    raw = f"{run_ts.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode an opaque (run_ts, id) keyset cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        run_ts, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(run_ts), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_page(rows: list, limit: int) -> tuple[list, dict]:
+    """
+    Trim a `LIMIT limit + 1` result to one page and build the
+    next-cursor header from its last row.
+    """
+    if len(rows) <= limit:
+        return rows, {}
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, {NEXT_CURSOR_HEADER: encode_cursor(last["run_ts"], last["id"])}
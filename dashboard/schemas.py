@@ -18,8 +18,19 @@ class SymbolHealth(BaseModel):
     freshness: Dict[str, str]
 
 
+class SeriesLag(BaseModel):
+    symbol: str
+    timeframe: str
+    last_ts: Optional[datetime]
+    lag_minutes: Optional[float]
+    wall_lag_minutes: Optional[float]
+    allowed_minutes: int
+    status: str
+
+
 class QualityEvent(BaseModel):
+    id: int
     run_ts: datetime
     check_type: str
     status: str
-    details: Dict[str, Any]
+    details: Optional[Dict[str, Any]] = None
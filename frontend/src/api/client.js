@@ -16,7 +16,24 @@ export async function getSymbolHistory(symbol) {
 }
 
 export async function getAlertHistory() {
-  const res = await fetch("http://127.0.0.1:8000/alerts/history");
+  const res = await fetch(`${BASE_URL}/alerts/history?include_details=true`);
+  return res.json();
+}
+
+export async function getSeriesLag(status) {
+  const query = status ? `?status=${encodeURIComponent(status)}` : "";
+  const res = await fetch(`${BASE_URL}/health/lag${query}`);
+  return res.json();
+}
+
+export async function getJobRuns(jobName) {
+  const query = jobName ? `?job_name=${encodeURIComponent(jobName)}` : "";
+  const res = await fetch(`${BASE_URL}/jobs/runs${query}`);
+  return res.json();
+}
+
+export async function getJobSummary(hours = 24) {
+  const res = await fetch(`${BASE_URL}/jobs/summary?hours=${hours}`);
   return res.json();
 }
 
@@ -40,3 +57,18 @@ export async function resolveAlert(
   return res.json();
 }
 
+
+// --------------------------------------
+// Server-Sent Events (health / alert deltas)
+// --------------------------------------
+export function subscribeEvents({ onHealth, onAlert, onOpen }) {
+  const source = new EventSource(`${BASE_URL}/events`);
+
+  // Fires on first connect and on every reconnect → caller resyncs
+  source.onopen = () => onOpen?.();
+
+  source.addEventListener("health", (e) => onHealth?.(JSON.parse(e.data)));
+  source.addEventListener("alert", (e) => onAlert?.(JSON.parse(e.data)));
+
+  return () => source.close();
+}
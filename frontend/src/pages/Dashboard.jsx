@@ -4,6 +4,7 @@ import {
   getHealth,
   getAlerts,
   getAlertHistory,
+  subscribeEvents,
 } from "../api/client";
 
 import AlertsBanner from "../components/AlertsBanner";
@@ -12,7 +13,53 @@ import SymbolModal from "../components/SymbolModal";
 import SpinnerOverlay from "../components/SpinnerOverlay";
 import AlertTimeline from "../components/AlertTimeline";
 
-const REFRESH_INTERVAL_MS = 30_000; // 30 seconds
+// Live updates arrive over SSE; polling is only a safety net
+const REFRESH_INTERVAL_MS = 300_000; // 5 minutes
+
+const ACTIVE_ALERT_STATUSES = ["RAISED", "ACKED"];
+
+// --------------------------------------
+// SSE delta reducers
+// --------------------------------------
+const applyHealthDelta = (rows, delta) => {
+  const idx = rows.findIndex((r) => r.symbol === delta.symbol);
+  const current =
+    idx >= 0
+      ? rows[idx]
+      : {
+          symbol: delta.symbol,
+          daily_coverage: null,
+          auto_backfill: null,
+          freshness: {},
+        };
+
+  const row = { ...current, freshness: { ...current.freshness } };
+
+  if (delta.check_type === "daily_coverage") {
+    row.daily_coverage = delta.status;
+  } else if (delta.check_type === "auto_backfill") {
+    row.auto_backfill = delta.status;
+  } else if (delta.check_type === "freshness") {
+    row.freshness[delta.timeframe] = delta.status;
+  } else {
+    return rows;
+  }
+
+  if (idx < 0) return [...rows, row];
+  return rows.map((r, i) => (i === idx ? row : r));
+};
+
+const applyAlertDelta = (alerts, delta) => {
+  const others = alerts.filter((a) => a.id !== delta.id);
+  if (!ACTIVE_ALERT_STATUSES.includes(delta.status)) return others;
+  return [delta, ...others];
+};
+
+const applyAlertHistoryDelta = (events, delta) => {
+  const idx = events.findIndex((e) => e.id === delta.id);
+  if (idx < 0) return [delta, ...events];
+  return events.map((e, i) => (i === idx ? { ...e, ...delta } : e));
+};
 
 // --------------------------------------
 // URL helpers (FILTER + HISTORY)
@@ -101,6 +148,25 @@ export default function Dashboard() {
     return () => clearInterval(intervalId);
   }, [selectedSymbol]);
 
+  // --------------------------------------
+  // Live deltas (SSE)
+  // --------------------------------------
+  useEffect(() => {
+    return subscribeEvents({
+      // (Re)connected → resync from a full snapshot once
+      onOpen: fetchData,
+      onHealth: (delta) => {
+        setHealth((rows) => applyHealthDelta(rows, delta));
+        setLastUpdated(new Date());
+      },
+      onAlert: (delta) => {
+        setAlerts((rows) => applyAlertDelta(rows, delta));
+        setAlertHistory((rows) => applyAlertHistoryDelta(rows, delta));
+        setLastUpdated(new Date());
+      },
+    });
+  }, []);
+
   // --------------------------------------
   // Persist filter + history → URL
   // --------------------------------------
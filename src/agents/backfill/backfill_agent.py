@@ -1,7 +1,7 @@
-from datetime import date, datetime, timedelta, time
+from datetime import date, datetime, time
 from typing import List
 
-from agents.calendar.market_holiday_agent import MarketHolidayAgent
+from agents.calendar.trading_calendar import get_trading_calendar
 from data_ingestion.orchestrator import ingest_symbol
 
 
@@ -32,16 +32,10 @@ class BackfillAgent:
 
         existing_days = {row["d"] for row in cur.fetchall()}
 
-        missing_days = []
-        d = start_date
-
-        while d <= end_date:
-            if MarketHolidayAgent.is_trading_day(d):
-                if d not in existing_days:
-                    missing_days.append(d)
-            d += timedelta(days=1)
-
-        return missing_days
+        return [
+            d for d in get_trading_calendar().trading_days(start_date, end_date)
+            if d not in existing_days
+        ]
 
     def backfill_daily(
         self,
@@ -4,7 +4,7 @@ import pytz
 import logging
 
 from data_ingestion.db import get_db_connection
-from data_ingestion.insert import insert_ohlcv_batch
+from data_ingestion.sink import CandleSink
 from agents.calendar.market_holiday_agent import MarketHolidayAgent
 from data_ingestion.normalize import normalize_shoonya_candles
 from data_ingestion.timeframe_mapper import TIMEFRAMES
@@ -97,8 +97,10 @@ class IntradayBackfillAgent:
 
                 if records:
                     conn = get_db_connection()
-                    insert_ohlcv_batch(conn, records)
-                    conn.close()
+                    try:
+                        CandleSink(conn).write_records(records)
+                    finally:
+                        conn.close()
                     inserted += len(records)
 
             time.sleep(API_SLEEP_SECONDS)
@@ -58,3 +58,25 @@ class MarketHolidayAgent:
                 return [row["holiday_date"] for row in cur.fetchall()]
         finally:
             conn.close()
+
+    def get_special_sessions_for_year(self, year: int) -> list[dict]:
+        """
+        Extra sessions (e.g. Muhurat trading) for a year, including
+        ones held on weekends or holidays.
+        """
+        conn = get_db_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT session_date, open_time, close_time, description
+                    FROM market_special_sessions
+                    WHERE exchange = %s
+                      AND year = %s
+                    ORDER BY session_date, open_time
+                    """,
+                    (self.exchange, year),
+                )
+                return cur.fetchall()
+        finally:
+            conn.close()
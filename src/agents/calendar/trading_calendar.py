@@ -0,0 +1,181 @@
+import logging
+import threading
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+import pytz
+
+from agents.calendar.market_holiday_agent import MarketHolidayAgent
+
+logger = logging.getLogger(__name__)
+IST = pytz.timezone("Asia/Kolkata")
+
+REGULAR_SESSION = (time(9, 15), time(15, 30))
+
+
+class TradingCalendar:
+    """
+    In-memory NSE trading calendar.
+
+    Holidays and special sessions are loaded once per (exchange, year)
+    and kept for the life of the process, so day-by-day checks over
+    long ranges cost one query per year instead of one per date.
+    """
+
+    def __init__(self, exchange: str = MarketHolidayAgent.DEFAULT_EXCHANGE):
+        self.exchange = exchange
+        self._holiday_agent = MarketHolidayAgent(exchange)
+        self._holidays: Dict[int, Set[date]] = {}
+        self._special: Dict[int, Dict[date, List[Tuple[time, time]]]] = {}
+        self._lock = threading.Lock()
+
+    def holidays(self, year: int) -> Set[date]:
+        with self._lock:
+            if year not in self._holidays:
+                self._holidays[year] = set(
+                    self._holiday_agent.get_holidays_for_year(year)
+                )
+            return self._holidays[year]
+
+    def special_sessions(self, year: int) -> Dict[date, List[Tuple[time, time]]]:
+        """
+        {date: [(open, close), ...]} for special sessions such as
+        Muhurat trading. On these dates they replace the regular session.
+        """
+        with self._lock:
+            if year not in self._special:
+                sessions = defaultdict(list)
+                for row in self._holiday_agent.get_special_sessions_for_year(year):
+                    sessions[row["session_date"]].append(
+                        (row["open_time"], row["close_time"])
+                    )
+                self._special[year] = dict(sessions)
+            return self._special[year]
+
+    def sessions(self, d: date) -> List[Tuple[datetime, datetime]]:
+        """
+        IST (open, close) of every session held on `d`, in order.
+        """
+        special = self.special_sessions(d.year).get(d)
+        if special:
+            times = special
+        elif d.weekday() < 5 and d not in self.holidays(d.year):
+            times = [REGULAR_SESSION]
+        else:
+            return []
+
+        return [
+            (IST.localize(datetime.combine(d, open_)), IST.localize(datetime.combine(d, close)))
+            for open_, close in times
+        ]
+
+    def is_trading_day(self, d: date) -> bool:
+        if d in self.special_sessions(d.year):
+            return True
+        if d.weekday() >= 5:
+            return False
+        return d not in self.holidays(d.year)
+
+    def is_open(self, ts: datetime, grace: timedelta = timedelta(0)) -> bool:
+        """
+        True if `ts` falls in a session (or within `grace` after its close).
+        """
+        ts = ts.astimezone(IST)
+        return any(
+            open_ <= ts <= close + grace
+            for open_, close in self.sessions(ts.date())
+        )
+
+    def session_clock(self, start: date, end: date) -> "SessionClock":
+        """
+        SessionClock over every session from `start` to `end` (inclusive).
+        """
+        sessions = []
+        d = start
+        while d <= end:
+            sessions.extend(self.sessions(d))
+            d += timedelta(days=1)
+        return SessionClock(sessions)
+
+    def trading_days(self, start: date, end: date) -> List[date]:
+        """
+        Trading days in [start, end] (inclusive).
+        """
+        days = []
+        d = start
+        while d <= end:
+            if self.is_trading_day(d):
+                days.append(d)
+            d += timedelta(days=1)
+        return days
+
+    def next_trading_day(self, d: date, max_days: int = 30) -> date:
+        """
+        First trading day on or after `d`.
+        """
+        for _ in range(max_days):
+            if self.is_trading_day(d):
+                return d
+            d += timedelta(days=1)
+        raise ValueError(f"No trading day within {max_days} days of {d}")
+
+    def invalidate(self, year: int = None):
+        with self._lock:
+            if year is None:
+                self._holidays.clear()
+                self._special.clear()
+            else:
+                self._holidays.pop(year, None)
+                self._special.pop(year, None)
+
+
+class SessionClock:
+    """
+    Vectorized trading time over a fixed list of sessions.
+
+    Sessions are flattened into epoch-second arrays with a running total
+    of session time, so the trading seconds between many timestamps and
+    one end point cost a single searchsorted.
+    """
+
+    def __init__(self, sessions: List[Tuple[datetime, datetime]]):
+        self.opens = np.array([o.timestamp() for o, _ in sessions], dtype="float64")
+        self.closes = np.array([c.timestamp() for _, c in sessions], dtype="float64")
+        # cumulative[i] = session seconds before session i opens
+        self.cumulative = np.concatenate(
+            ([0.0], np.cumsum(self.closes - self.opens))
+        )
+
+    def _elapsed(self, ts: np.ndarray) -> np.ndarray:
+        # Session seconds from the first session up to each ts
+        i = np.searchsorted(self.opens, ts, side="right") - 1
+        held = i >= 0
+        i = np.where(held, i, 0)
+        if not len(self.opens):
+            return np.zeros_like(ts)
+        partial = np.clip(ts - self.opens[i], 0.0, self.closes[i] - self.opens[i])
+        return np.where(held, self.cumulative[i] + partial, 0.0)
+
+    def trading_seconds(self, starts, end: datetime) -> np.ndarray:
+        """
+        Session seconds from each of `starts` to `end` (0 where start > end).
+        """
+        starts = np.asarray([s.timestamp() for s in starts], dtype="float64")
+        end_elapsed = self._elapsed(np.array([end.timestamp()]))[0]
+        return np.maximum(end_elapsed - self._elapsed(starts), 0.0)
+
+
+_calendars: Dict[str, TradingCalendar] = {}
+_calendars_lock = threading.Lock()
+
+
+def get_trading_calendar(exchange: str = MarketHolidayAgent.DEFAULT_EXCHANGE) -> TradingCalendar:
+    """
+    Process-wide calendar per exchange (shared holiday cache).
+    """
+    with _calendars_lock:
+        if exchange not in _calendars:
+            _calendars[exchange] = TradingCalendar(exchange)
+        return _calendars[exchange]
@@ -1,15 +1,21 @@
+import json
+import logging
 from datetime import datetime, timedelta, date, time, timezone
-from typing import Dict, Any
+from typing import Dict, Any, List, Set, Tuple
 import pytz
 
 from psycopg2.extras import Json
 
-from agents.calendar.market_holiday_agent import MarketHolidayAgent
+from agents.calendar.trading_calendar import get_trading_calendar
 from agents.backfill.backfill_agent import BackfillAgent
 from agents.backfill.intraday_backfill_agent import IntradayBackfillAgent
 from data_ingestion.timeframe_mapper import TIMEFRAMES
+from data_ingestion.db import DATA_QUALITY_CHANNEL, NOTIFY_PAYLOAD_SQL
+from data_ingestion.candle_store import get_candle_store
+from monitoring.metrics import GOVERNANCE_REPORTS
 
 
+logger = logging.getLogger(__name__)
 IST = pytz.timezone("Asia/Kolkata")
 
 MARKET_OPEN = time(9, 15)
@@ -20,6 +26,86 @@ TIMEFRAME_MINUTES = {
     for tf, meta in TIMEFRAMES.items()
 }
 
+# Buffered reports (a jsonb array) → history, latest and NOTIFY in
+# one statement. Only the newest report per series reaches
+# data_quality_latest (ON CONFLICT cannot touch a row twice).
+FLUSH_REPORTS_SQL = """
+    WITH report AS (
+        INSERT INTO data_quality_reports (
+            run_ts,
+            symbol,
+            timeframe,
+            check_type,
+            status,
+            details
+        )
+        SELECT NOW(), r.symbol, r.timeframe, r.check_type, r.status, r.details
+        FROM ROWS FROM (
+            jsonb_to_recordset(%s::jsonb) AS (
+                symbol text,
+                timeframe text,
+                check_type text,
+                status text,
+                details jsonb
+            )
+        ) WITH ORDINALITY AS r(symbol, timeframe, check_type, status, details, ord)
+        ORDER BY r.ord
+        RETURNING id, run_ts, symbol, timeframe, check_type, status, details
+    ),
+    latest AS (
+        INSERT INTO data_quality_latest (
+            symbol,
+            timeframe,
+            check_type,
+            report_id,
+            run_ts,
+            status,
+            details
+        )
+        SELECT DISTINCT ON (symbol, timeframe, check_type)
+            symbol, timeframe, check_type, id, run_ts, status, details
+        FROM report
+        ORDER BY symbol, timeframe, check_type, id DESC
+        ON CONFLICT (symbol, timeframe, check_type) DO UPDATE
+        SET report_id = EXCLUDED.report_id,
+            run_ts = EXCLUDED.run_ts,
+            status = EXCLUDED.status,
+            details = EXCLUDED.details
+    )
+    -- Delivered to listeners only when the transaction commits
+    SELECT pg_notify(%s, """ + NOTIFY_PAYLOAD_SQL + """)
+    FROM report
+"""
+
+# Resolve open intraday alerts of the given series (parallel arrays)
+RESOLVE_INTRADAY_ALERTS_SQL = """
+    WITH resolved AS (
+        UPDATE data_quality_reports r
+        SET status = 'RESOLVED'
+        FROM unnest(%s::text[], %s::text[]) AS s(symbol, timeframe)
+        WHERE r.symbol = s.symbol
+          AND r.timeframe = s.timeframe
+          AND r.check_type = 'intraday_backfill_alert'
+          AND r.status IN ('RAISED', 'ACKED')
+        RETURNING r.id, r.run_ts, r.symbol, r.timeframe, r.check_type, r.status, r.details
+    ),
+    latest AS (
+        UPDATE data_quality_latest
+        SET status = 'RESOLVED'
+        WHERE report_id IN (SELECT id FROM resolved)
+    )
+    SELECT pg_notify(%s, """ + NOTIFY_PAYLOAD_SQL + """)
+    FROM resolved
+"""
+
+# Never suppressed as unchanged: escalation counts consecutive reports
+ALWAYS_RECORDED = {
+    "auto_backfill",
+    "auto_backfill_alert",
+    "intraday_backfill",
+    "intraday_backfill_alert",
+}
+
 
 class DataCompletenessAgent:
     """
@@ -32,32 +118,71 @@ class DataCompletenessAgent:
     - Intraday completeness detection
     - Intraday auto-backfill (safe & throttled)
     - Intraday escalation if healing repeatedly fails
+
+    Checks read in autocommit mode, so no snapshot or lock is held
+    across series or backfills. Reports and alert resolutions are
+    buffered and written by flush_reports in the run's one transaction.
     """
 
     MAX_PARTIAL_DAYS = 3
     MAX_INTRADAY_PARTIAL_RUNS = 3
 
+    # Allowed lag in trading minutes since the last bar closed (the
+    # convention of monitoring.health_metrics)
+    FRESHNESS_THRESHOLD_MINUTES = {"1M": 4, "5M": 10, "15M": 15}
+    DEFAULT_FRESHNESS_THRESHOLD_MINUTES = 60
+
+    def __init__(self, suppress_unchanged: bool = True):
+        self.calendar = get_trading_calendar()
+        self.suppress_unchanged = suppress_unchanged
+        self._pending: List[Dict[str, Any]] = []
+        self._resolve: Set[Tuple[str, str]] = set()
+
     # ─────────────────────────────────────────────
     # ENTRY POINT
     # ─────────────────────────────────────────────
     def run(self, conn):
-        cur = conn.cursor()
-
-        cur.execute("""
-            SELECT DISTINCT symbol, timeframe
-            FROM candles
-        """)
-        rows = cur.fetchall()
-
-        for row in rows:
-            symbol = row["symbol"]
-            timeframe = row["timeframe"]
-
-            if timeframe == "1D":
-                self._check_daily_coverage(conn, symbol)
-            else:
-                self._check_intraday_freshness(conn, symbol, timeframe)
-                self._check_intraday_completeness(conn, symbol, timeframe)
+        autocommit = conn.autocommit
+        conn.autocommit = True
+        try:
+            cur = conn.cursor()
+
+            # One row per series, with its last candle (kept by CandleSink)
+            cur.execute("""
+                SELECT symbol, timeframe, last_ts
+                FROM candle_watermarks
+            """)
+            rows = cur.fetchall()
+
+            intraday = [
+                (row["symbol"], row["timeframe"], row["last_ts"])
+                for row in rows
+                if row["timeframe"] != "1D"
+            ]
+            self._check_intraday_freshness(conn, intraday)
+
+            for row in rows:
+                symbol = row["symbol"]
+                timeframe = row["timeframe"]
+
+                if timeframe == "1D":
+                    self._check_daily_coverage(conn, symbol)
+                else:
+                    self._check_intraday_completeness(conn, symbol, timeframe)
+        except Exception:
+            # Keep the reports of checks that completed; never mask the
+            # original error with a flush failure
+            try:
+                self.flush_reports(conn)
+            except Exception:
+                logger.exception(
+                    f"DATA QUALITY FLUSH FAILED | {len(self._pending)} reports kept in buffer"
+                )
+            raise
+        else:
+            self.flush_reports(conn)
+        finally:
+            conn.autocommit = autocommit
 
     # ------------------------------------------------------------------
     # DAILY COVERAGE (EXISTING)
@@ -81,12 +206,7 @@ class DataCompletenessAgent:
         first_day: date = row["first_day"]
         last_day: date = row["last_day"]
 
-        expected_days = 0
-        d = first_day
-        while d <= last_day:
-            if MarketHolidayAgent.is_trading_day(d):
-                expected_days += 1
-            d += timedelta(days=1)
+        expected_days = len(self.calendar.trading_days(first_day, last_day))
 
         cur.execute("""
             SELECT COUNT(*) AS cnt
@@ -181,64 +301,86 @@ class DataCompletenessAgent:
                 )
 
     def _count_consecutive_partial_days(self, conn, symbol: str) -> int:
-        cur = conn.cursor()
-        cur.execute("""
-            SELECT status
-            FROM data_quality_reports
-            WHERE symbol = %s
-              AND check_type = 'auto_backfill'
-            ORDER BY run_ts DESC
-            LIMIT %s
-        """, (symbol, self.MAX_PARTIAL_DAYS + 5))
+        statuses = self._recent_statuses(
+            conn, symbol, "1D", "auto_backfill", self.MAX_PARTIAL_DAYS + 5
+        )
 
         count = 0
-        for row in cur.fetchall():
-            if row["status"] == "PARTIAL":
+        for status in statuses:
+            if status == "PARTIAL":
                 count += 1
             else:
                 break
         return count
 
     # ------------------------------------------------------------------
-    # INTRADAY FRESHNESS (EXISTING)
+    # INTRADAY FRESHNESS (TRADING TIME, TRANSITIONS ONLY)
     # ------------------------------------------------------------------
-    def _check_intraday_freshness(self, conn, symbol: str, timeframe: str):
-        cur = conn.cursor()
-
-        cur.execute("""
-            SELECT MAX(ts) AS last_ts
-            FROM candles
-            WHERE symbol = %s
-              AND timeframe = %s
-        """, (symbol, timeframe))
-
-        row = cur.fetchone()
-        if not row or not row["last_ts"]:
+    def _check_intraday_freshness(
+        self,
+        conn,
+        series: List[Tuple[str, str, datetime]],
+        now: datetime = None,
+    ):
+        """
+        Lag of every intraday series in trading minutes since its last
+        bar closed, so nights, weekends and holidays never turn a series
+        stale.
+
+        Evaluated in one batch; a report is written only when a series'
+        status differs from its data_quality_latest row.
+        """
+        if not series:
             return
 
-        last_ts: datetime = row["last_ts"]
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
 
-        lag_min = (now - last_ts).total_seconds() / 60
-        lag_min = max(lag_min, 0.0)
+        closes = [
+            ts + timedelta(minutes=TIMEFRAME_MINUTES.get(tf, 0))
+            for _, tf, ts in series
+        ]
+        clock = self.calendar.session_clock(
+            min(closes).astimezone(IST).date(),
+            now.astimezone(IST).date(),
+        )
+        lags = clock.trading_seconds(closes, now) / 60
 
-        thresholds = {"1M": 5, "5M": 15, "15M": 30}
-        max_allowed = thresholds.get(timeframe, 60)
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT symbol, timeframe, status
+            FROM data_quality_latest
+            WHERE check_type = 'freshness'
+        """)
+        previous = {
+            (row["symbol"], row["timeframe"]): row["status"]
+            for row in cur.fetchall()
+        }
+
+        for (symbol, timeframe, last_ts), close, lag_min in zip(series, closes, lags):
+            max_allowed = self.FRESHNESS_THRESHOLD_MINUTES.get(
+                timeframe, self.DEFAULT_FRESHNESS_THRESHOLD_MINUTES
+            )
+            status = "PASS" if lag_min <= max_allowed else "FAIL"
 
-        status = "PASS" if lag_min <= max_allowed else "FAIL"
+            if previous.get((symbol, timeframe)) == status:
+                continue
 
-        self.persist_report(
-            conn,
-            symbol,
-            timeframe,
-            "freshness",
-            status,
-            {
-                "last_candle_ts": last_ts.isoformat(),
-                "lag_minutes": round(lag_min, 2),
-                "threshold_minutes": max_allowed
-            }
-        )
+            self.persist_report(
+                conn,
+                symbol,
+                timeframe,
+                "freshness",
+                status,
+                {
+                    "last_candle_ts": last_ts.isoformat(),
+                    "lag_minutes": round(float(lag_min), 2),
+                    "wall_lag_minutes": round(
+                        max((now - close).total_seconds() / 60, 0.0), 2
+                    ),
+                    "threshold_minutes": max_allowed,
+                    "previous_status": previous.get((symbol, timeframe)),
+                }
+            )
 
     # ------------------------------------------------------------------
     # 🆕 INTRADAY COMPLETENESS + BACKFILL + ESCALATION
@@ -248,7 +390,6 @@ class DataCompletenessAgent:
             return
 
         cur = conn.cursor()
-        holiday_agent = MarketHolidayAgent()
 
         cur.execute("""
             SELECT DISTINCT ts::date AS trade_date
@@ -261,9 +402,11 @@ class DataCompletenessAgent:
 
         trade_days = [row["trade_date"] for row in cur.fetchall()]
 
+        days = []
+        to_heal = []
         for trade_date in trade_days:
 
-            if not holiday_agent.is_trading_day(trade_date):
+            if not self.calendar.is_trading_day(trade_date):
                 continue
 
             expected = self._expected_intraday_candles(trade_date, timeframe)
@@ -276,27 +419,36 @@ class DataCompletenessAgent:
             )
 
             missing = sorted(set(expected) - set(actual))
-            completeness_status = "PASS" if not missing else "FAIL"
+            days.append({
+                "trade_date": trade_date.isoformat(),
+                "expected_count": len(expected),
+                "actual_count": len(actual),
+                "missing_count": len(missing),
+            })
+            if missing:
+                to_heal.append((trade_date, missing))
+
+        if not days:
+            return
 
-            # 1️⃣ DETECTION
-            self.persist_report(
-                conn,
-                symbol,
-                timeframe,
-                "intraday_completeness",
-                completeness_status,
-                {
-                    "trade_date": trade_date.isoformat(),
-                    "expected_count": len(expected),
-                    "actual_count": len(actual),
-                    "missing_count": len(missing),
-                }
-            )
+        # 1️⃣ DETECTION: one report per series per run, so an unchanged
+        # series is suppressed and data_quality_latest covers every day
+        self.persist_report(
+            conn,
+            symbol,
+            timeframe,
+            "intraday_completeness",
+            "FAIL" if to_heal else "PASS",
+            {
+                "days": days,
+                "missing_count": sum(d["missing_count"] for d in days),
+            }
+        )
 
-            if not missing:
-                self._resolve_intraday_alert_if_any(conn, symbol, timeframe)
-                continue
+        if len(to_heal) < len(days):
+            self._resolve_intraday_alert_if_any(symbol, timeframe)
 
+        for trade_date, missing in to_heal:
             # 2️⃣ HEALING
             backfill_agent = IntradayBackfillAgent()
             result = backfill_agent.backfill_missing_candles(
@@ -336,36 +488,22 @@ class DataCompletenessAgent:
                     )
 
     def _count_intraday_partial_runs(self, conn, symbol: str, timeframe: str) -> int:
-        cur = conn.cursor()
-        cur.execute("""
-            SELECT status
-            FROM data_quality_reports
-            WHERE symbol = %s
-              AND timeframe = %s
-              AND check_type = 'intraday_backfill'
-            ORDER BY run_ts DESC
-            LIMIT %s
-        """, (symbol, timeframe, self.MAX_INTRADAY_PARTIAL_RUNS + 2))
+        statuses = self._recent_statuses(
+            conn, symbol, timeframe, "intraday_backfill", self.MAX_INTRADAY_PARTIAL_RUNS + 2
+        )
 
         count = 0
-        for row in cur.fetchall():
-            if row["status"] == "PARTIAL":
+        for status in statuses:
+            if status == "PARTIAL":
                 count += 1
             else:
                 break
         return count
 
-    def _resolve_intraday_alert_if_any(self, conn, symbol: str, timeframe: str):
-        cur = conn.cursor()
-        cur.execute("""
-            UPDATE data_quality_reports
-            SET status = 'RESOLVED'
-            WHERE symbol = %s
-              AND timeframe = %s
-              AND check_type = 'intraday_backfill_alert'
-              AND status IN ('RAISED', 'ACKED')
-        """, (symbol, timeframe))
-        conn.commit()
+    def _resolve_intraday_alert_if_any(self, symbol: str, timeframe: str):
+        # Applied by flush_reports, in the transaction that writes the
+        # PASS report, so neither commits without the other
+        self._resolve.add((symbol, timeframe))
 
     # ------------------------------------------------------------------
     # HELPERS
@@ -387,22 +525,9 @@ class DataCompletenessAgent:
     def _fetch_intraday_candles(
         self, conn, symbol, timeframe, start_ts, end_ts
     ):
-        cur = conn.cursor()
-        cur.execute("""
-            SELECT ts
-            FROM candles
-            WHERE symbol = %s
-              AND timeframe = %s
-              AND ts BETWEEN %s AND %s
-            ORDER BY ts
-        """, (
-            symbol,
-            timeframe,
-            start_ts.astimezone(timezone.utc),
-            end_ts.astimezone(timezone.utc),
-        ))
-
-        return [row["ts"].astimezone(IST) for row in cur.fetchall()]
+        return get_candle_store().get_timestamps(
+            conn, symbol, timeframe, start_ts, end_ts
+        )
 
     # ------------------------------------------------------------------
     # PERSISTENCE
@@ -416,22 +541,112 @@ class DataCompletenessAgent:
         status: str,
         details: Dict[str, Any]
     ):
+        """
+        Buffer a report; flush_reports writes the run's reports together.
+        """
+        self._pending.append({
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "check_type": check_type,
+            "status": status,
+            # Normalised as stored (jsonb), so unchanged reports compare equal
+            "details": json.loads(json.dumps(details)),
+        })
+
+    def flush_reports(self, conn) -> int:
+        """
+        Write buffered reports and alert resolutions in one transaction:
+        the resolutions, one multi-row insert into history, one upsert
+        into data_quality_latest and a NOTIFY per change (delivered on
+        commit). With suppress_unchanged, reports whose status and
+        details match the latest one are dropped. Returns the number of
+        reports written. On failure the transaction is rolled back and
+        everything stays buffered.
+        """
+        buffered, self._pending = self._pending, []
+        resolve, self._resolve = self._resolve, set()
+
+        autocommit = conn.autocommit
+        conn.autocommit = False
+        try:
+            pending = buffered
+            if pending and self.suppress_unchanged:
+                pending = self._drop_unchanged(conn, pending)
+
+            cur = conn.cursor()
+            if resolve:
+                # Before this run's reports, so an alert raised by this
+                # run stays open
+                symbols, timeframes = zip(*sorted(resolve))
+                cur.execute(
+                    RESOLVE_INTRADAY_ALERTS_SQL,
+                    (list(symbols), list(timeframes), DATA_QUALITY_CHANNEL),
+                )
+            if pending:
+                cur.execute(FLUSH_REPORTS_SQL, (Json(pending), DATA_QUALITY_CHANNEL))
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            self._pending[:0] = buffered
+            self._resolve |= resolve
+            raise
+        finally:
+            conn.autocommit = autocommit
+
+        for report in pending:
+            GOVERNANCE_REPORTS.labels(report["check_type"], report["status"]).inc()
+        return len(pending)
+
+    def _drop_unchanged(self, conn, pending: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         cur = conn.cursor()
         cur.execute("""
-            INSERT INTO data_quality_reports (
-                run_ts,
-                symbol,
-                timeframe,
-                check_type,
-                status,
-                details
-            )
-            VALUES (NOW(), %s, %s, %s, %s, %s)
-        """, (
-            symbol,
-            timeframe,
-            check_type,
-            status,
-            Json(details)
-        ))
-        conn.commit()
+            SELECT l.symbol, l.timeframe, l.check_type, l.status, l.details
+            FROM data_quality_latest l
+            JOIN (
+                SELECT DISTINCT r.symbol, r.timeframe, r.check_type
+                FROM jsonb_to_recordset(%s::jsonb) AS r(symbol text, timeframe text, check_type text)
+            ) k USING (symbol, timeframe, check_type)
+        """, (Json(pending),))
+        last = {
+            (row["symbol"], row["timeframe"], row["check_type"]): (row["status"], row["details"])
+            for row in cur.fetchall()
+        }
+
+        kept = []
+        for report in pending:
+            key = (report["symbol"], report["timeframe"], report["check_type"])
+            state = (report["status"], report["details"])
+
+            # Escalation counts consecutive backfill reports: keep them all
+            if report["check_type"] in ALWAYS_RECORDED or last.get(key) != state:
+                kept.append(report)
+            last[key] = state
+
+        return kept
+
+    def _recent_statuses(
+        self, conn, symbol: str, timeframe: str, check_type: str, limit: int
+    ) -> List[str]:
+        """
+        Newest-first statuses of a series' reports, this run's buffered
+        ones included.
+        """
+        statuses = [
+            r["status"] for r in reversed(self._pending)
+            if (r["symbol"], r["timeframe"], r["check_type"]) == (symbol, timeframe, check_type)
+        ]
+
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT status
+            FROM data_quality_reports
+            WHERE symbol = %s
+              AND timeframe = %s
+              AND check_type = %s
+            ORDER BY run_ts DESC
+            LIMIT %s
+        """, (symbol, timeframe, check_type, limit))
+        statuses.extend(row["status"] for row in cur.fetchall())
+
+        return statuses[:limit]
@@ -1,6 +1,7 @@
 from agents.data_quality.data_completeness_agent import DataCompletenessAgent
+from scheduler.universe import load_universe
 
-SYMBOLS = ["INFY", "TCS", "RELIANCE"]
+SYMBOLS = load_universe()
 
 agent = DataCompletenessAgent()
 
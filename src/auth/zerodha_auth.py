@@ -58,3 +58,17 @@ def load_access_token() -> str:
 
     with open(TOKEN_FILE) as f:
         return json.load(f)["access_token"]
+
+
+def create_kite_connect() -> KiteConnect:
+    """
+    KiteConnect configured from the environment:
+    - KITE_API_ROOT overrides the API host (e.g. the local fake Kite server)
+    - KITE_ACCESS_TOKEN is used instead of the saved login token
+    """
+    kite = KiteConnect(
+        api_key=API_KEY,
+        root=os.getenv("KITE_API_ROOT") or None,
+    )
+    kite.set_access_token(os.getenv("KITE_ACCESS_TOKEN") or load_access_token())
+    return kite
@@ -0,0 +1,338 @@
+# src/data_ingestion/archive.py
+
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytz
+
+from data_ingestion.db import get_db_connection
+from data_ingestion.export import CANDLE_SCHEMA, PARQUET_COMPRESSION, iter_candle_batches
+from data_ingestion.retention import RETENTION_POLICY, retention_cutoff
+
+logger = logging.getLogger(__name__)
+IST = pytz.timezone("Asia/Kolkata")
+
+# Cold tier root: <root>/timeframe=<TF>/symbol=<SYMBOL>/year=<YYYY>/*.parquet
+ARCHIVE_ROOT = Path(os.getenv("CANDLE_ARCHIVE_ROOT", "data/archive/candles"))
+
+# Columns stored in archive files (timeframe/symbol/year live in the path)
+ARCHIVE_COLUMNS = ["ts", "open", "high", "low", "close", "volume"]
+
+
+def partition_dir(root: Path, timeframe: str, symbol: str, year: int | None = None) -> Path:
+    path = root / f"timeframe={timeframe}" / f"symbol={symbol}"
+    if year is not None:
+        path = path / f"year={year}"
+    return path
+
+
+# ─────────────────────────────────────────────
+# Archival (hot → cold)
+# ─────────────────────────────────────────────
+
+def _archive_slice(
+    conn,
+    root: Path,
+    symbol: str,
+    timeframe: str,
+    year: int,
+    start: datetime,
+    end: datetime,
+    first_ts: datetime,
+    last_ts: datetime,
+) -> int:
+    """
+    Copy candles in [start, end) to one Parquet file, then delete them
+    from Postgres in the same transaction. The file name is derived
+    from the slice bounds, so a rerun after a crash overwrites rather
+    than duplicates.
+    """
+    out_dir = partition_dir(root, timeframe, symbol, year)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    name = f"part-{first_ts:%Y%m%d%H%M}-{last_ts:%Y%m%d%H%M}.parquet"
+    final_path = out_dir / name
+    tmp_path = out_dir / f".{name}.tmp"
+
+    written = 0
+    writer = None
+    try:
+        for batch in iter_candle_batches(conn, [symbol], timeframe, start, end):
+            table = pa.Table.from_batches([batch]).select(ARCHIVE_COLUMNS)
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    tmp_path, table.schema, compression=PARQUET_COMPRESSION
+                )
+            writer.write_table(table)
+            written += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if not written:
+        conn.rollback()
+        return 0
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            DELETE FROM candles
+            WHERE symbol = %s
+              AND timeframe = %s
+              AND ts >= %s
+              AND ts < %s
+            """,
+            (symbol, timeframe, start, end),
+        )
+        deleted = cur.rowcount
+
+    if deleted != written:
+        # Rows landed in the slice after we read it — keep them hot
+        conn.rollback()
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(
+            f"ARCHIVE SKIP | {symbol} | {timeframe} | {year} | "
+            f"wrote {written} but would delete {deleted}"
+        )
+        return 0
+
+    os.replace(tmp_path, final_path)
+    conn.commit()
+
+    logger.info(
+        f"ARCHIVE | {symbol} | {timeframe} | {year} | {written} candles → {final_path}"
+    )
+    return written
+
+
+def archive_timeframe(conn, timeframe: str, now: datetime, root: Path = ARCHIVE_ROOT) -> int:
+    """
+    Move every candle of `timeframe` older than its retention cutoff
+    to the Parquet archive. Returns candles archived.
+    """
+    cutoff = retention_cutoff(timeframe, now)
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT
+                symbol,
+                EXTRACT(YEAR FROM ts AT TIME ZONE 'Asia/Kolkata')::int AS year,
+                MIN(ts) AS first_ts,
+                MAX(ts) AS last_ts
+            FROM candles
+            WHERE timeframe = %s
+              AND ts < %s
+            GROUP BY 1, 2
+            ORDER BY 1, 2
+            """,
+            (timeframe, cutoff),
+        )
+        slices = cur.fetchall()
+    conn.commit()
+
+    archived = 0
+    for s in slices:
+        year_start = IST.localize(datetime(s["year"], 1, 1))
+        year_end = IST.localize(datetime(s["year"] + 1, 1, 1))
+
+        archived += _archive_slice(
+            conn,
+            root,
+            s["symbol"],
+            timeframe,
+            s["year"],
+            start=year_start,
+            end=min(year_end, cutoff),
+            first_ts=s["first_ts"].astimezone(IST),
+            last_ts=s["last_ts"].astimezone(IST),
+        )
+
+    return archived
+
+
+def run_archival(timeframes: list[str] | None = None, root: Path = ARCHIVE_ROOT):
+    """
+    Retention job: archive every timeframe, then drop hypertable chunks
+    that are now empty for all timeframes.
+    """
+    timeframes = timeframes or list(RETENTION_POLICY)
+    now = datetime.now(IST)
+
+    conn = get_db_connection()
+    try:
+        failed = False
+        for tf in timeframes:
+            try:
+                total = archive_timeframe(conn, tf, now, root)
+                logger.info(f"ARCHIVE DONE | {tf} | {total} candles")
+            except Exception:
+                conn.rollback()
+                failed = True
+                logger.exception(f"ARCHIVE FAILED | {tf}")
+
+        # The hypertable mixes timeframes, so only chunks older than the
+        # *longest* retention are guaranteed to be fully archived.
+        if not failed and set(timeframes) == set(RETENTION_POLICY):
+            oldest_cutoff = min(retention_cutoff(tf, now) for tf in RETENTION_POLICY)
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT drop_chunks('candles', older_than => %s)",
+                    (oldest_cutoff,),
+                )
+                dropped = cur.rowcount
+            conn.commit()
+            logger.info(f"ARCHIVE | dropped {dropped} chunks older than {oldest_cutoff}")
+    finally:
+        conn.close()
+
+
+# ─────────────────────────────────────────────
+# Unified reader (cold Parquet + hot Postgres)
+# ─────────────────────────────────────────────
+
+def _read_cold(root: Path, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+    path = partition_dir(root, timeframe, symbol)
+    if not path.exists():
+        return pd.DataFrame(columns=ARCHIVE_COLUMNS)
+
+    start_utc = pa.scalar(start.astimezone(timezone.utc), pa.timestamp("us", tz="UTC"))
+    end_utc = pa.scalar(end.astimezone(timezone.utc), pa.timestamp("us", tz="UTC"))
+
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    table = dataset.to_table(
+        columns=ARCHIVE_COLUMNS,
+        filter=(
+            (ds.field("year") >= start.astimezone(IST).year)
+            & (ds.field("year") <= end.astimezone(IST).year)
+            & (ds.field("ts") >= start_utc)
+            & (ds.field("ts") < end_utc)
+        ),
+    )
+    return table.to_pandas()
+
+
+def _read_hot(conn, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+    batches = list(iter_candle_batches(conn, [symbol], timeframe, start, end))
+
+    if not batches:
+        return pd.DataFrame(columns=ARCHIVE_COLUMNS)
+
+    return pa.Table.from_batches(batches).select(ARCHIVE_COLUMNS).to_pandas()
+
+
+def _merge_tiers(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Union of per-tier frames (coldest first, hot last) sorted by ts (IST).
+    Later frames win on overlap.
+    """
+    df = pd.concat([f for f in frames if not f.empty] or frames[-1:], ignore_index=True)
+    if df.empty:
+        return df
+
+    df["ts"] = pd.to_datetime(df["ts"], utc=True).dt.tz_convert("Asia/Kolkata")
+    return (
+        df.drop_duplicates(subset=["ts"], keep="last")
+        .sort_values("ts")
+        .reset_index(drop=True)
+    )
+
+
+def read_candles(
+    conn,
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    root: Path = ARCHIVE_ROOT,
+) -> pd.DataFrame:
+    """
+    Candles in [start, end) from whichever tier holds them.
+
+    The archive is only consulted when the range reaches past the
+    retention cutoff. Hot rows win over cold ones on overlap.
+    Returns ts (IST), open, high, low, close, volume sorted by ts.
+    """
+    hot = _read_hot(conn, symbol, timeframe, start, end)
+
+    frames = []
+    if start < retention_cutoff(timeframe, datetime.now(IST)):
+        frames.append(_read_cold(root, symbol, timeframe, start, end))
+    frames.append(hot)
+
+    return _merge_tiers(frames)
+
+
+def iter_tiered_batches(
+    conn,
+    symbols: list[str],
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    root: Path = ARCHIVE_ROOT,
+) -> Iterator[pa.RecordBatch]:
+    """
+    iter_candle_batches across both tiers: same CANDLE_SCHEMA batches,
+    ordered by symbol, ts.
+
+    Before the retention cutoff each symbol is read one IST year at a
+    time through the same merge as read_candles, so memory stays
+    bounded by a year of one symbol. The rest streams from Postgres.
+    """
+    cutoff = retention_cutoff(timeframe, datetime.now(IST))
+    if start >= cutoff:
+        yield from iter_candle_batches(conn, symbols, timeframe, start, end)
+        return
+
+    split = min(end, cutoff)
+    years = range(start.astimezone(IST).year, split.astimezone(IST).year + 1)
+
+    for symbol in sorted(set(symbols)):
+        for year in years:
+            lo = max(start, IST.localize(datetime(year, 1, 1)))
+            hi = min(split, IST.localize(datetime(year + 1, 1, 1)))
+
+            df = _merge_tiers([
+                _read_cold(root, symbol, timeframe, lo, hi),
+                _read_hot(conn, symbol, timeframe, lo, hi),
+            ])
+            if not df.empty:
+                yield pa.RecordBatch.from_pandas(
+                    df.assign(symbol=symbol, timeframe=timeframe),
+                    schema=CANDLE_SCHEMA,
+                    preserve_index=False,
+                )
+
+        if end > cutoff:
+            yield from iter_candle_batches(conn, [symbol], timeframe, cutoff, end)
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    parser = argparse.ArgumentParser(description="Archive candles past retention")
+    parser.add_argument(
+        "--timeframe",
+        action="append",
+        dest="timeframes",
+        help="Timeframe to archive (repeatable, default: all)",
+    )
+    args = parser.parse_args()
+
+    run_archival(args.timeframes)
@@ -0,0 +1,346 @@
+# src/data_ingestion/backfill_executor.py
+
+import hashlib
+import logging
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+import pytz
+from psycopg2.extras import execute_values
+
+from data_ingestion.chunk_planner import plan_fetch_chunks
+from data_ingestion.db import get_db_connection
+from data_ingestion.fetcher import fetch_candles
+from data_ingestion.writer import write_candles
+
+logger = logging.getLogger(__name__)
+IST = pytz.timezone("Asia/Kolkata")
+
+# Workers share one KiteClient, so API throughput is bounded by its
+# rate limit regardless of worker count; extra workers overlap DB writes.
+DEFAULT_WORKERS = 4
+
+MAX_ATTEMPTS = 3
+
+# A running task not finished within this window is considered orphaned
+STALE_TASK_MINUTES = 5
+
+
+def backfill_run_id(symbols: List[str], timeframes: List[str], start: datetime, end: datetime) -> str:
+    """
+    Deterministic run id: re-running the same backfill resumes it.
+    """
+    key = "|".join([
+        ",".join(sorted(symbols)),
+        ",".join(sorted(timeframes)),
+        start.isoformat(),
+        end.isoformat(),
+    ])
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+
+def plan_chunks(timeframe: str, start: datetime, end: datetime):
+    """
+    One work unit per Kite request (see chunk_planner).
+    """
+    # Local import: orchestrator imports this module
+    from data_ingestion.orchestrator import align_to_timeframe
+
+    return plan_fetch_chunks(
+        timeframe,
+        align_to_timeframe(start, timeframe),
+        align_to_timeframe(end, timeframe),
+    )
+
+
+# ─────────────────────────────────────────────
+# Task table
+# ─────────────────────────────────────────────
+
+def plan_backfill(
+    conn,
+    run_id: str,
+    symbols: List[str],
+    timeframes: List[str],
+    start: datetime,
+    end: datetime,
+) -> int:
+    """
+    Insert every (symbol, timeframe, chunk) work unit for a run.
+    Idempotent: existing tasks (done or not) are left untouched.
+    Returns tasks newly planned.
+    """
+    rows = [
+        (run_id, symbol, tf, chunk_start, chunk_end)
+        for tf in timeframes
+        for chunk_start, chunk_end in plan_chunks(tf, start, end)
+        for symbol in symbols
+    ]
+    if not rows:
+        return 0
+
+    with conn.cursor() as cur:
+        inserted = execute_values(
+            cur,
+            """
+            INSERT INTO backfill_tasks
+                (run_id, symbol, timeframe, chunk_start, chunk_end)
+            VALUES %s
+            ON CONFLICT (run_id, symbol, timeframe, chunk_start) DO NOTHING
+            RETURNING id
+            """,
+            rows,
+            page_size=1000,
+            fetch=True,
+        )
+    conn.commit()
+    return len(inserted)
+
+
+def requeue_stale_tasks(conn, run_id: str, stale_minutes: int = STALE_TASK_MINUTES) -> int:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE backfill_tasks
+            SET status = 'pending', claimed_by = NULL
+            WHERE run_id = %s
+              AND status = 'running'
+              AND claimed_at < NOW() - make_interval(mins => %s)
+            """,
+            (run_id, stale_minutes),
+        )
+        requeued = cur.rowcount
+    conn.commit()
+    return requeued
+
+
+def retry_failed_tasks(conn, run_id: str) -> int:
+    """
+    Give tasks that exhausted MAX_ATTEMPTS in an earlier call a fresh
+    set of attempts, so resuming a run retries them.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE backfill_tasks
+            SET status = 'pending', claimed_by = NULL, attempts = 0
+            WHERE run_id = %s
+              AND status = 'failed'
+            """,
+            (run_id,),
+        )
+        retried = cur.rowcount
+    conn.commit()
+    return retried
+
+
+def claim_task(conn, run_id: str, worker_id: str) -> Optional[dict]:
+    """
+    Claim the next pending task. SKIP LOCKED lets any number of workers
+    (threads or processes) pull from the same run without contention.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE backfill_tasks
+            SET status = 'running',
+                claimed_by = %s,
+                claimed_at = NOW(),
+                attempts = attempts + 1
+            WHERE id = (
+                SELECT id
+                FROM backfill_tasks
+                WHERE run_id = %s
+                  AND status = 'pending'
+                ORDER BY timeframe, chunk_start, symbol
+                FOR UPDATE SKIP LOCKED
+                LIMIT 1
+            )
+            RETURNING id, symbol, timeframe, chunk_start, chunk_end, attempts
+            """,
+            (worker_id, run_id),
+        )
+        task = cur.fetchone()
+    conn.commit()
+    return task
+
+
+def backfill_progress(conn, run_id: str) -> dict:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT status, COUNT(*) AS tasks, COALESCE(SUM(candles), 0) AS candles
+            FROM backfill_tasks
+            WHERE run_id = %s
+            GROUP BY status
+            """,
+            (run_id,),
+        )
+        rows = cur.fetchall()
+    conn.commit()
+    return {r["status"]: {"tasks": r["tasks"], "candles": r["candles"]} for r in rows}
+
+
+# ─────────────────────────────────────────────
+# Execution
+# ─────────────────────────────────────────────
+
+def _execute_task(conn, task: dict, worker_id: str) -> int:
+    """
+    Fetch and write one chunk. The candles and the task's 'done' mark
+    commit in the same transaction, so a crash never leaves a chunk
+    marked done without its data (or vice versa).
+    """
+    df = fetch_candles(
+        task["symbol"],
+        task["timeframe"],
+        task["chunk_start"].astimezone(IST),
+        task["chunk_end"].astimezone(IST),
+    )
+
+    candles = 0
+    if not df.empty:
+        write_candles(conn, task["symbol"], task["timeframe"], df, commit=False)
+        candles = len(df)
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE backfill_tasks
+            SET status = 'done',
+                finished_at = NOW(),
+                candles = %s,
+                error = NULL
+            WHERE id = %s
+              AND claimed_by = %s
+            """,
+            (candles, task["id"], worker_id),
+        )
+    conn.commit()
+    return candles
+
+
+def _fail_task(conn, task: dict, worker_id: str, error: Exception):
+    conn.rollback()
+    status = "failed" if task["attempts"] >= MAX_ATTEMPTS else "pending"
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE backfill_tasks
+            SET status = %s, claimed_by = NULL, error = %s
+            WHERE id = %s
+              AND claimed_by = %s
+            """,
+            (status, str(error)[:1000], task["id"], worker_id),
+        )
+    conn.commit()
+
+
+def _worker(run_id: str, worker_id: str, stop: threading.Event) -> int:
+    conn = get_db_connection()
+    done = 0
+    try:
+        while not stop.is_set():
+            task = claim_task(conn, run_id, worker_id)
+            if task is None:
+                break
+
+            try:
+                candles = _execute_task(conn, task, worker_id)
+                done += 1
+                logger.info(
+                    f"BACKFILL CHUNK | {task['symbol']} | {task['timeframe']} | "
+                    f"{task['chunk_start']:%Y-%m-%d} → {task['chunk_end']:%Y-%m-%d} | "
+                    f"{candles} candles"
+                )
+            except Exception as e:
+                logger.exception(
+                    f"BACKFILL CHUNK FAILED | {task['symbol']} | {task['timeframe']} | "
+                    f"{task['chunk_start']} | attempt {task['attempts']}"
+                )
+                _fail_task(conn, task, worker_id, e)
+    finally:
+        conn.close()
+    return done
+
+
+def run_backfill_tasks(
+    run_id: str,
+    workers: int = DEFAULT_WORKERS,
+    stop: Optional[threading.Event] = None,
+    retry_failed: bool = True,
+) -> dict:
+    """
+    Drain the pending tasks of a run on a worker pool.
+    Setting `stop` (or Ctrl-C) pauses: in-flight chunks finish and
+    the rest stay pending for the next call. Tasks that failed in an
+    earlier call are retried unless retry_failed=False; within one call
+    a task is tried at most MAX_ATTEMPTS times.
+    """
+    stop = stop or threading.Event()
+    base_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    conn = get_db_connection()
+    try:
+        requeued = requeue_stale_tasks(conn, run_id)
+        if requeued:
+            logger.warning(f"BACKFILL | {run_id} | requeued {requeued} stale tasks")
+        if retry_failed:
+            retried = retry_failed_tasks(conn, run_id)
+            if retried:
+                logger.warning(f"BACKFILL | {run_id} | retrying {retried} failed tasks")
+    finally:
+        conn.close()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backfill") as pool:
+        futures = [
+            pool.submit(_worker, run_id, f"{base_id}:{i}", stop)
+            for i in range(workers)
+        ]
+        try:
+            for f in futures:
+                f.result()
+        except KeyboardInterrupt:
+            logger.warning(f"BACKFILL | {run_id} | pausing after in-flight chunks")
+            stop.set()
+            raise
+
+    conn = get_db_connection()
+    try:
+        progress = backfill_progress(conn, run_id)
+    finally:
+        conn.close()
+
+    logger.info(f"BACKFILL PROGRESS | {run_id} | {progress}")
+    return progress
+
+
+def run_planned_backfill(
+    symbols: List[str],
+    timeframes: List[str],
+    start: datetime,
+    end: datetime,
+    workers: int = DEFAULT_WORKERS,
+) -> dict:
+    """
+    Plan (or resume) a multi-symbol backfill and run it to completion.
+    """
+    run_id = backfill_run_id(symbols, timeframes, start, end)
+
+    conn = get_db_connection()
+    try:
+        planned = plan_backfill(conn, run_id, symbols, timeframes, start, end)
+    finally:
+        conn.close()
+
+    logger.info(
+        f"BACKFILL PLAN | {run_id} | {len(symbols)} symbols × {timeframes} | "
+        f"{planned} new tasks | workers={workers}"
+    )
+
+    return run_backfill_tasks(run_id, workers)
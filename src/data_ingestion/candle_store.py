@@ -0,0 +1,270 @@
+# src/data_ingestion/candle_store.py
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from agents.calendar.trading_calendar import get_trading_calendar
+from data_ingestion.archive import read_candles
+
+logger = logging.getLogger(__name__)
+IST = pytz.timezone("Asia/Kolkata")
+
+COLUMNS = ["ts", "open", "high", "low", "close", "volume"]
+
+# Cache budget (bytes of NumPy array data)
+CACHE_MAX_BYTES = int(os.getenv("CANDLE_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+# Days older than this are treated as immutable and cacheable.
+# Must exceed the intraday healer's lookback (IntradayBackfillAgent
+# MAX_LOOKBACK_DAYS = 3) so healed days are never served stale.
+SETTLED_AFTER_DAYS = 4
+
+# Fixed per-block cost, so cached empty (non-trading) days still count
+# towards the budget and can be evicted
+BLOCK_OVERHEAD_BYTES = 256
+
+
+def _empty_block() -> Dict[str, np.ndarray]:
+    return {
+        "ts": np.array([], dtype="int64"),
+        "open": np.array([], dtype="float64"),
+        "high": np.array([], dtype="float64"),
+        "low": np.array([], dtype="float64"),
+        "close": np.array([], dtype="float64"),
+        "volume": np.array([], dtype="int64"),
+    }
+
+
+def _block_nbytes(block: Dict[str, np.ndarray]) -> int:
+    return BLOCK_OVERHEAD_BYTES + sum(a.nbytes for a in block.values())
+
+
+def _day_runs(days: List[date]) -> List[List[date]]:
+    """
+    Split sorted days into runs of consecutive calendar days.
+    """
+    runs = []
+    for d in days:
+        if runs and d - runs[-1][-1] == timedelta(days=1):
+            runs[-1].append(d)
+        else:
+            runs.append([d])
+    return runs
+
+
+class CandleStore:
+    """
+    Columnar candle read API with an in-process LRU block cache.
+
+    Candles are read in IST day blocks of NumPy arrays:
+        ts (int64 epoch ns, UTC), open, high, low, close, volume
+
+    Settled past days are cached and served without DB access;
+    recent days are always read through. Settled weekends and holidays
+    are cached as empty blocks; an empty trading day is never cached,
+    so a day healed by backfill shows up on the next read.
+    """
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._blocks: OrderedDict[tuple, Dict[str, np.ndarray]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    # ─────────────────────────────────────────────
+    # Public API
+    # ─────────────────────────────────────────────
+
+    def get(
+        self,
+        conn,
+        symbol: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Candles in [start, end) as a dict of column arrays.
+        """
+        start_ist = start.astimezone(IST)
+        end_ist = end.astimezone(IST)
+
+        if start_ist >= end_ist:
+            return _empty_block()
+
+        days = []
+        d = start_ist.date()
+        while datetime.combine(d, time(0, 0)) < end_ist.replace(tzinfo=None):
+            days.append(d)
+            d += timedelta(days=1)
+
+        settled_before = datetime.now(IST).date() - timedelta(days=SETTLED_AFTER_DAYS)
+        calendar = get_trading_calendar()
+
+        blocks: Dict[date, Dict[str, np.ndarray]] = {}
+        missing = []
+
+        with self._lock:
+            for d in days:
+                block = self._blocks.get((symbol, timeframe, d))
+                if block is not None:
+                    self._blocks.move_to_end((symbol, timeframe, d))
+                    blocks[d] = block
+                    self.hits += 1
+                else:
+                    missing.append(d)
+                    self.misses += 1
+
+        for run in _day_runs(missing):
+            fetched = self._load_days(conn, symbol, timeframe, run[0], run[-1])
+
+            for d in run:
+                block = fetched.get(d, _empty_block())
+                blocks[d] = block
+
+                if d < settled_before and (
+                    len(block["ts"]) or not calendar.is_trading_day(d)
+                ):
+                    self._put((symbol, timeframe, d), block)
+
+        merged = {
+            col: np.concatenate([blocks[d][col] for d in days])
+            for col in COLUMNS
+        }
+
+        start_ns = pd.Timestamp(start).as_unit("ns").value
+        end_ns = pd.Timestamp(end).as_unit("ns").value
+        mask = (merged["ts"] >= start_ns) & (merged["ts"] < end_ns)
+
+        return {col: arr[mask] for col, arr in merged.items()}
+
+    def get_timestamps(
+        self,
+        conn,
+        symbol: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> List[datetime]:
+        """
+        Candle timestamps in [start, end) as IST datetimes.
+        """
+        ts = self.get(conn, symbol, timeframe, start, end)["ts"]
+        return list(
+            pd.DatetimeIndex(ts, tz="UTC").tz_convert(IST).to_pydatetime()
+        )
+
+    def invalidate(
+        self,
+        symbol: str,
+        timeframe: str,
+        days: Optional[Iterable[date]] = None,
+    ):
+        """
+        Drop cached blocks for a series (all days, or only `days`).
+        Called by writers that touch past days.
+        """
+        with self._lock:
+            if days is None:
+                keys = [k for k in self._blocks if k[0] == symbol and k[1] == timeframe]
+            else:
+                keys = [(symbol, timeframe, d) for d in days]
+
+            for key in keys:
+                block = self._blocks.pop(key, None)
+                if block is not None:
+                    self._bytes -= _block_nbytes(block)
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+            self._bytes = 0
+
+    # ─────────────────────────────────────────────
+    # Internals
+    # ─────────────────────────────────────────────
+
+    def _put(self, key: tuple, block: Dict[str, np.ndarray]):
+        size = _block_nbytes(block)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._blocks.pop(key, None)
+            if old is not None:
+                self._bytes -= _block_nbytes(old)
+
+            self._blocks[key] = block
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, evicted = self._blocks.popitem(last=False)
+                self._bytes -= _block_nbytes(evicted)
+
+    def _load_days(
+        self,
+        conn,
+        symbol: str,
+        timeframe: str,
+        first_day: date,
+        last_day: date,
+    ) -> Dict[date, Dict[str, np.ndarray]]:
+        """
+        One range read for consecutive days, split into day blocks.
+        """
+        start = IST.localize(datetime.combine(first_day, time(0, 0)))
+        end = IST.localize(datetime.combine(last_day + timedelta(days=1), time(0, 0)))
+
+        df = read_candles(conn, symbol, timeframe, start, end)
+        if df.empty:
+            return {}
+
+        ts_index = pd.DatetimeIndex(df["ts"]).as_unit("ns")
+        ts_ns = ts_index.asi8
+        day_keys = ts_index.tz_convert(IST).date
+
+        arrays = {
+            "ts": ts_ns,
+            "open": df["open"].to_numpy(dtype="float64"),
+            "high": df["high"].to_numpy(dtype="float64"),
+            "low": df["low"].to_numpy(dtype="float64"),
+            "close": df["close"].to_numpy(dtype="float64"),
+            "volume": df["volume"].to_numpy(dtype="int64"),
+        }
+
+        blocks = {}
+        # Rows are sorted by ts, so each day is a contiguous slice
+        boundaries = np.flatnonzero(day_keys[1:] != day_keys[:-1]) + 1
+        starts = np.concatenate([[0], boundaries])
+        ends = np.concatenate([boundaries, [len(ts_ns)]])
+
+        for s, e in zip(starts, ends):
+            blocks[day_keys[s]] = {
+                col: np.ascontiguousarray(arr[s:e]) for col, arr in arrays.items()
+            }
+
+        return blocks
+
+
+_candle_store: Optional[CandleStore] = None
+
+
+def get_candle_store() -> CandleStore:
+    """
+    Process-wide CandleStore (shared cache).
+    """
+    global _candle_store
+    if _candle_store is None:
+        _candle_store = CandleStore()
+    return _candle_store
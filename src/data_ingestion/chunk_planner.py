@@ -0,0 +1,87 @@
+# src/data_ingestion/chunk_planner.py
+
+import bisect
+from datetime import datetime, time, timedelta
+from typing import List, Optional, Tuple
+
+import pytz
+
+from agents.calendar.trading_calendar import TradingCalendar, get_trading_calendar
+from data_ingestion.timeframe_mapper import TIMEFRAMES
+
+IST = pytz.timezone("Asia/Kolkata")
+
+
+def max_span(timeframe: str) -> timedelta:
+    """
+    Largest [from, to] span Kite serves in one historical_data call.
+    """
+    try:
+        return timedelta(days=TIMEFRAMES[timeframe]["kite_max_days"])
+    except KeyError:
+        raise ValueError(
+            f"Unsupported timeframe '{timeframe}'. "
+            f"Supported: {list(TIMEFRAMES.keys())}"
+        )
+
+
+def plan_fetch_chunks(
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    calendar: Optional[TradingCalendar] = None,
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Split [start, end) into the fewest historical_data requests.
+
+    Each chunk starts on a trading day and spans up to the interval's
+    Kite limit. The range is trimmed to its first/last trading days,
+    weekends/holidays at a chunk boundary are skipped rather than
+    spent, and windows with no trading day are never requested.
+    """
+    calendar = calendar or get_trading_calendar()
+    span = max_span(timeframe)
+
+    start = start.astimezone(IST)
+    end = end.astimezone(IST)
+    if start >= end:
+        return []
+
+    # Last calendar day that [start, end) touches
+    last_day = (end - timedelta(microseconds=1)).date()
+
+    days = calendar.trading_days(start.date(), last_day)
+    if not days:
+        return []
+
+    trading = set(days)
+
+    def midnight(d) -> datetime:
+        return IST.localize(datetime.combine(d, time(0, 0)))
+
+    last_end = min(end, midnight(days[-1] + timedelta(days=1)))
+
+    chunks = []
+    cursor = start
+    while cursor < last_end:
+        # Skip to the next trading day if the cursor sits on a closed one
+        if cursor.date() not in trading:
+            i = bisect.bisect_right(days, cursor.date())
+            if i == len(days):
+                break
+            cursor = midnight(days[i])
+
+        chunk_end = min(cursor + span, last_end)
+
+        # Don't spend the tail of a chunk on non-trading days: pull the
+        # end back to the close of the last trading day it covers
+        end_day = (chunk_end - timedelta(microseconds=1)).date()
+        if chunk_end < last_end and end_day not in trading:
+            while end_day not in trading and end_day > cursor.date():
+                end_day -= timedelta(days=1)
+            chunk_end = midnight(end_day + timedelta(days=1))
+
+        chunks.append((cursor, chunk_end))
+        cursor = chunk_end
+
+    return chunks
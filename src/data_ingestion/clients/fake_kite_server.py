@@ -0,0 +1,410 @@
+# src/data_ingestion/clients/fake_kite_server.py
+
+"""
+Local stand-in for the Kite Connect REST API.
+
+Serves instruments (CSV), historical candles and quotes in the same
+wire format as api.kite.trade, from recordings when available and
+synthetic data otherwise. Enforces per-endpoint token-bucket rate
+limits (HTTP 429, like Kite) and configurable latency.
+
+Point the ingestion stack at it with:
+    KITE_API_ROOT=http://127.0.0.1:8765
+    KITE_ACCESS_TOKEN=fake
+    KITE_INSTRUMENTS_FILE=data/instruments_fake.parquet
+"""
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import pytz
+import yaml
+
+logger = logging.getLogger(__name__)
+IST = pytz.timezone("Asia/Kolkata")
+
+DEFAULT_PORT = 8765
+SYMBOLS_CONFIG = "config/symbols.yaml"
+
+# Kite's documented limits (requests / second)
+DEFAULT_RATE_LIMITS = {
+    "historical": 3.0,
+    "quote": 1.0,
+    "default": 10.0,
+}
+
+INTERVAL_MINUTES = {
+    "minute": 1,
+    "3minute": 3,
+    "5minute": 5,
+    "10minute": 10,
+    "15minute": 15,
+    "30minute": 30,
+    "60minute": 60,
+    "day": 1440,
+}
+
+INSTRUMENT_COLUMNS = [
+    "instrument_token", "exchange_token", "tradingsymbol", "name",
+    "last_price", "expiry", "strike", "tick_size", "lot_size",
+    "instrument_type", "segment", "exchange",
+]
+
+MARKET_OPEN_MIN = 9 * 60 + 15
+MARKET_CLOSE_MIN = 15 * 60 + 30
+
+
+# ─────────────────────────────────────────────
+# Rate limiting
+# ─────────────────────────────────────────────
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._ts = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._ts) * self.rate)
+            self._ts = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+# ─────────────────────────────────────────────
+# Data
+# ─────────────────────────────────────────────
+
+def load_symbols(path: str = SYMBOLS_CONFIG) -> List[str]:
+    with open(path) as f:
+        cfg = yaml.safe_load(f) or {}
+    return [
+        entry["symbol"]
+        for group in ("indices", "equities")
+        for entry in cfg.get(group) or []
+    ]
+
+
+def _seed(*parts) -> int:
+    return int(hashlib.md5("|".join(map(str, parts)).encode()).hexdigest()[:8], 16)
+
+
+class FakeMarketData:
+    """
+    Deterministic synthetic market: the same (token, interval, day)
+    always yields the same candles. Recorded candles, if present under
+    `recordings/historical/<token>_<interval>.json` (Kite "candles"
+    arrays), take precedence.
+    """
+
+    def __init__(self, symbols: List[str], exchange: str = "NSE", recordings: Optional[Path] = None):
+        self.exchange = exchange
+        self.recordings = recordings
+        self.instruments = self._load_instruments(symbols)
+        self.by_token = {i["instrument_token"]: i for i in self.instruments}
+        self.by_symbol = {i["tradingsymbol"]: i for i in self.instruments}
+        self._recorded: Dict[tuple, list] = {}
+
+    def _load_instruments(self, symbols: List[str]) -> List[dict]:
+        if self.recordings and (self.recordings / "instruments.csv").exists():
+            with open(self.recordings / "instruments.csv") as f:
+                rows = list(csv.DictReader(f))
+            for row in rows:
+                row["instrument_token"] = int(row["instrument_token"])
+            return rows
+
+        return [
+            {
+                "instrument_token": 100_000 + i,
+                "exchange_token": 400 + i,
+                "tradingsymbol": symbol,
+                "name": symbol,
+                "last_price": 0,
+                "expiry": "",
+                "strike": 0,
+                "tick_size": 0.05,
+                "lot_size": 1,
+                "instrument_type": "EQ",
+                "segment": self.exchange,
+                "exchange": self.exchange,
+            }
+            for i, symbol in enumerate(symbols)
+        ]
+
+    def instruments_csv(self) -> bytes:
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=INSTRUMENT_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(self.instruments)
+        return buf.getvalue().encode()
+
+    def _recorded_candles(self, token: int, interval: str) -> Optional[list]:
+        if not self.recordings:
+            return None
+        key = (token, interval)
+        if key not in self._recorded:
+            path = self.recordings / "historical" / f"{token}_{interval}.json"
+            self._recorded[key] = json.loads(path.read_text()) if path.exists() else None
+        return self._recorded[key]
+
+    def _synthetic_day(self, token: int, interval: str, day: date) -> list:
+        rng = random.Random(_seed(token, interval, day))
+        price = 100 + _seed(token) % 3000 + rng.uniform(-5, 5)
+        step = INTERVAL_MINUTES[interval]
+
+        if step == 1440:
+            starts = [IST.localize(datetime.combine(day, datetime.min.time()))]
+        else:
+            session_open = IST.localize(datetime.combine(day, datetime.min.time())) + timedelta(minutes=MARKET_OPEN_MIN)
+            starts = [
+                session_open + timedelta(minutes=m)
+                for m in range(0, MARKET_CLOSE_MIN - MARKET_OPEN_MIN, step)
+            ]
+
+        candles = []
+        for ts in starts:
+            o = price
+            c = max(1.0, o * (1 + rng.gauss(0, 0.002)))
+            h = max(o, c) * (1 + abs(rng.gauss(0, 0.001)))
+            l = min(o, c) * (1 - abs(rng.gauss(0, 0.001)))
+            v = int(rng.uniform(1_000, 50_000) * (step if step < 1440 else 375))
+            candles.append([ts.strftime("%Y-%m-%dT%H:%M:%S%z"), round(o, 2), round(h, 2), round(l, 2), round(c, 2), v])
+            price = c
+        return candles
+
+    def historical(self, token: int, interval: str, start: datetime, end: datetime) -> list:
+        recorded = self._recorded_candles(token, interval)
+        if recorded is not None:
+            return [
+                c for c in recorded
+                if start <= datetime.fromisoformat(c[0]).astimezone(IST) <= end
+            ]
+
+        candles = []
+        day = start.date()
+        while day <= end.date():
+            if day.weekday() < 5:
+                for c in self._synthetic_day(token, interval, day):
+                    ts = datetime.strptime(c[0], "%Y-%m-%dT%H:%M:%S%z")
+                    if start <= ts <= end:
+                        candles.append(c)
+            day += timedelta(days=1)
+        return candles
+
+    def quote(self, key: str) -> Optional[dict]:
+        exchange, _, symbol = key.partition(":")
+        inst = self.by_symbol.get(symbol)
+        if inst is None:
+            return None
+
+        now = datetime.now(IST)
+        day = self._synthetic_day(inst["instrument_token"], "day", now.date())[0]
+        return {
+            "instrument_token": inst["instrument_token"],
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "last_trade_time": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "last_price": day[4],
+            "volume": day[5],
+            "ohlc": {"open": day[1], "high": day[2], "low": day[3], "close": day[4]},
+        }
+
+
+# ─────────────────────────────────────────────
+# HTTP
+# ─────────────────────────────────────────────
+
+class FakeKiteServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address,
+        market: FakeMarketData,
+        rate_limits: Optional[Dict[str, float]] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+    ):
+        super().__init__(address, _Handler)
+        self.market = market
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.buckets = {
+            name: TokenBucket(rate)
+            for name, rate in {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}.items()
+        }
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeKiteServer
+
+    def log_message(self, fmt, *args):
+        logger.debug(fmt % args)
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, payload: dict, status: int = 200):
+        self._send(status, json.dumps(payload).encode(), "application/json")
+
+    def _error(self, status: int, error_type: str, message: str):
+        self._json({"status": "error", "error_type": error_type, "message": message, "data": None}, status)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = [p for p in url.path.split("/") if p]
+
+        if parts == ["__stats"]:
+            self._json(dict(self.server.stats))
+            return
+
+        if parts[:2] == ["instruments", "historical"] and len(parts) == 4:
+            endpoint = "historical"
+        elif parts[:1] == ["quote"]:
+            endpoint = "quote"
+        else:
+            endpoint = "default"
+
+        self.server.count(f"{endpoint}.requests")
+
+        bucket = self.server.buckets.get(endpoint) or self.server.buckets["default"]
+        if not bucket.try_acquire():
+            self.server.count(f"{endpoint}.throttled")
+            self._error(429, "NetworkException", "Too many requests")
+            return
+
+        delay = self.server.latency_ms + random.uniform(0, self.server.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+
+        market = self.server.market
+
+        if endpoint == "historical":
+            token, interval = int(parts[2]), parts[3]
+            if token not in market.by_token:
+                self._error(400, "InputException", "invalid token")
+                return
+            if interval not in INTERVAL_MINUTES:
+                self._error(400, "InputException", "invalid interval")
+                return
+            try:
+                start = IST.localize(datetime.strptime(query["from"][0], "%Y-%m-%d %H:%M:%S"))
+                end = IST.localize(datetime.strptime(query["to"][0], "%Y-%m-%d %H:%M:%S"))
+            except (KeyError, ValueError):
+                self._error(400, "InputException", "invalid from/to")
+                return
+
+            candles = market.historical(token, interval, start, end)
+            self.server.count("historical.candles")
+            self._json({"status": "success", "data": {"candles": candles}})
+
+        elif endpoint == "quote":
+            data = {}
+            for key in query.get("i", []):
+                q = market.quote(key)
+                if q is not None:
+                    data[key] = q
+            self._json({"status": "success", "data": data})
+
+        elif parts == ["instruments"] or parts[:1] == ["instruments"] and len(parts) == 2:
+            self._send(200, market.instruments_csv(), "text/csv")
+
+        else:
+            self._error(404, "GeneralException", f"route not found: {url.path}")
+
+
+def start_fake_kite_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    symbols: Optional[List[str]] = None,
+    recordings: Optional[str] = None,
+    rate_limits: Optional[Dict[str, float]] = None,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+) -> FakeKiteServer:
+    """
+    Start the server on a background thread (port=0 picks a free port).
+    Call .shutdown() to stop.
+    """
+    market = FakeMarketData(
+        symbols if symbols is not None else load_symbols(),
+        recordings=Path(recordings) if recordings else None,
+    )
+    server = FakeKiteServer((host, port), market, rate_limits, latency_ms, jitter_ms)
+    threading.Thread(target=server.serve_forever, name="fake-kite", daemon=True).start()
+
+    logger.info(f"FAKE KITE | {server.url} | {len(market.instruments)} instruments")
+    return server
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    parser = argparse.ArgumentParser(description="Fake Kite Connect API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--symbols", help="Comma-separated symbols (default: config/symbols.yaml)")
+    parser.add_argument("--recordings", help="Directory with instruments.csv / historical/<token>_<interval>.json")
+    parser.add_argument("--historical-rps", type=float, default=DEFAULT_RATE_LIMITS["historical"])
+    parser.add_argument("--quote-rps", type=float, default=DEFAULT_RATE_LIMITS["quote"])
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = start_fake_kite_server(
+        host=args.host,
+        port=args.port,
+        symbols=[s.strip() for s in args.symbols.split(",")] if args.symbols else None,
+        recordings=args.recordings,
+        rate_limits={"historical": args.historical_rps, "quote": args.quote_rps},
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+    )
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
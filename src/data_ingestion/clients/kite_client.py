@@ -1,19 +1,33 @@
 import time
 import logging
+import threading
 from datetime import datetime, timedelta
+from typing import Optional
 import pandas as pd
-import os
 
-from kiteconnect import KiteConnect
-from kiteconnect.exceptions import KiteException
+from kiteconnect.exceptions import KiteException, NetworkException
 
-from auth.zerodha_auth import load_access_token
+from auth.zerodha_auth import create_kite_connect
+from data_ingestion.chunk_planner import plan_fetch_chunks
 from data_ingestion.symbol_resolver import resolve_symbol
 from data_ingestion.timeframe_mapper import TIMEFRAME_MAP, TIMEFRAMES
+from monitoring.metrics import KITE_CALLS, KITE_CALL_SECONDS, RATE_LIMIT_WAIT_SECONDS
 
 logger = logging.getLogger(__name__)
 
-MAX_KITE_DAYS = 2000
+# Per-thread count of historical_data requests (retries included), so
+# callers can attribute API calls to the work done on their thread
+_api_calls = threading.local()
+
+
+def api_calls_made() -> int:
+    return getattr(_api_calls, "count", 0)
+
+
+class FetchCancelled(Exception):
+    """
+    The caller's cancel event was set; no further requests were made.
+    """
 
 
 class KiteClient:
@@ -25,20 +39,62 @@ class KiteClient:
     # Zerodha allows ~3 requests / second.
     _MIN_CALL_INTERVAL_SEC = 0.4
 
+    # Retries for throttled / transient network failures (HTTP 429 etc.)
+    _MAX_RETRIES = 3
+    _RETRY_BACKOFF_SEC = 1.0
+
     def __init__(self):
-        self.kite = KiteConnect(api_key=os.getenv("KITE_API_KEY"))
-        self.kite.set_access_token(load_access_token())
+        self.kite = create_kite_connect()
         self._last_call_ts = 0.0
+        # Shared by backfill worker threads
+        self._rate_lock = threading.Lock()
 
     # ─────────────────────────────────────────────
     # Internal helpers
     # ─────────────────────────────────────────────
 
     def _rate_limit(self):
-        elapsed = time.time() - self._last_call_ts
-        if elapsed < self._MIN_CALL_INTERVAL_SEC:
-            time.sleep(self._MIN_CALL_INTERVAL_SEC - elapsed)
-        self._last_call_ts = time.time()
+        # Includes time queued behind other threads on the lock
+        t0 = time.perf_counter()
+        with self._rate_lock:
+            elapsed = time.time() - self._last_call_ts
+            if elapsed < self._MIN_CALL_INTERVAL_SEC:
+                time.sleep(self._MIN_CALL_INTERVAL_SEC - elapsed)
+            self._last_call_ts = time.time()
+        RATE_LIMIT_WAIT_SECONDS.observe(time.perf_counter() - t0)
+
+    def _historical_data(self, instrument_token, start, end, interval, cancel=None):
+        for attempt in range(self._MAX_RETRIES + 1):
+            self._rate_limit()
+            # Checked after the (possibly long) wait for a rate limit slot
+            if cancel is not None and cancel.is_set():
+                raise FetchCancelled(f"token={instrument_token}")
+            _api_calls.count = api_calls_made() + 1
+            t0 = time.perf_counter()
+            try:
+                data = self.kite.historical_data(
+                    instrument_token=instrument_token,
+                    from_date=start,
+                    to_date=end,
+                    interval=interval,
+                )
+                KITE_CALLS.labels("historical", "ok").inc()
+                return data
+            except NetworkException:
+                KITE_CALLS.labels("historical", "throttled").inc()
+                if attempt == self._MAX_RETRIES:
+                    raise
+                backoff = self._RETRY_BACKOFF_SEC * (2 ** attempt)
+                logger.warning(
+                    f"Kite throttled/network error | token={instrument_token} | "
+                    f"retry {attempt + 1}/{self._MAX_RETRIES} in {backoff:.1f}s"
+                )
+                time.sleep(backoff)
+            except KiteException:
+                KITE_CALLS.labels("historical", "error").inc()
+                raise
+            finally:
+                KITE_CALL_SECONDS.labels("historical").observe(time.perf_counter() - t0)
 
     # ─────────────────────────────────────────────
     # Public API
@@ -51,10 +107,13 @@ class KiteClient:
         start: datetime,
         end: datetime,
         exchange: str = "NSE",
+        cancel: Optional[threading.Event] = None,
     ) -> pd.DataFrame:
         """
         Fetch historical candles for a symbol.
-        Automatically chunks requests to satisfy Kite limits.
+        Requests are planned by plan_fetch_chunks: sized to the
+        interval's Kite span limit, skipping non-trading windows.
+        Setting `cancel` stops before the next request (FetchCancelled).
         """
 
         instrument_token = resolve_symbol(symbol, exchange)
@@ -64,22 +123,17 @@ class KiteClient:
             raise ValueError(f"Unsupported timeframe for Kite: {timeframe}")
 
         all_dfs = []
-        current_start = start
-
-        while current_start < end:
-            current_end = min(
-                current_start + timedelta(days=MAX_KITE_DAYS),
-                end,
-            )
-
-            self._rate_limit()
 
+        for current_start, current_end in plan_fetch_chunks(timeframe, start, end):
             try:
-                data = self.kite.historical_data(
-                    instrument_token=instrument_token,
-                    from_date=current_start,
-                    to_date=current_end,
-                    interval=interval,
+                # Kite's to_date is inclusive: stop a second short so
+                # chunks stay half-open and never return the bar at `end`
+                data = self._historical_data(
+                    instrument_token,
+                    current_start,
+                    current_end - timedelta(seconds=1),
+                    interval,
+                    cancel,
                 )
             except KiteException:
                 logger.exception(
@@ -92,8 +146,6 @@ class KiteClient:
                 df = pd.DataFrame(data)
                 all_dfs.append(df)
 
-            current_start = current_end
-
         if not all_dfs:
             return pd.DataFrame()
 
@@ -1,5 +1,48 @@
+import threading
+from contextlib import contextmanager
+
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+
+
+DB_CONFIG = {
+    "host": "localhost",
+    "port": 5432,
+    "dbname": "marketdata",
+    "user": "postgres",
+    "password": "postgres",
+}
+
+# LISTEN/NOTIFY channel carrying data quality report changes
+DATA_QUALITY_CHANNEL = "data_quality_events"
+
+# Check types of escalation alerts (served by the dashboard /alerts API)
+ALERT_CHECK_TYPES = ("auto_backfill_alert", "intraday_backfill_alert")
+
+# NOTIFY payloads are capped at 8000 bytes: alert details ride along
+# only while they fit comfortably, others fetch them over /alerts
+NOTIFY_DETAILS_MAX_BYTES = 6000
+
+# SQL literal list, e.g. 'a', 'b' (a tuple repr breaks on one element)
+_ALERT_CHECK_TYPES_SQL = ", ".join(f"'{t}'" for t in ALERT_CHECK_TYPES)
+
+# NOTIFY payload for a data_quality_reports row
+NOTIFY_PAYLOAD_SQL = f"""
+    json_build_object(
+        'id', id,
+        'run_ts', run_ts,
+        'symbol', symbol,
+        'timeframe', timeframe,
+        'check_type', check_type,
+        'status', status,
+        'details', CASE
+            WHEN check_type IN ({_ALERT_CHECK_TYPES_SQL})
+             AND octet_length(details::text) <= {NOTIFY_DETAILS_MAX_BYTES}
+            THEN details
+        END
+    )::text
+"""
 
 
 def get_db_connection():
@@ -7,10 +50,71 @@ def get_db_connection():
     Returns a PostgreSQL / TimescaleDB connection
     """
     return psycopg2.connect(
-        host="localhost",
-        port=5432,
-        dbname="marketdata",
-        user="postgres",
-        password="postgres",
+        **DB_CONFIG,
         cursor_factory=RealDictCursor
     )
+
+
+def get_db_conninfo() -> str:
+    """
+    libpq connection string for the same database
+    (used by the async dashboard pool).
+    """
+    return " ".join(f"{k}={v}" for k, v in DB_CONFIG.items())
+
+
+# ─────────────────────────────────────────────
+# Per-process connection pool (ingestion workers)
+# ─────────────────────────────────────────────
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def init_connection_pool(minconn: int = 1, maxconn: int = 4):
+    """
+    Give this process its own connection pool; pooled_connection()
+    uses it from then on. Ingestion workers call this at startup.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadedConnectionPool(
+                minconn, maxconn, **DB_CONFIG, cursor_factory=RealDictCursor
+            )
+    return _pool
+
+
+def close_connection_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
+@contextmanager
+def pooled_connection():
+    """
+    Borrow a connection from the process pool, or open a one-off
+    connection if no pool was initialised. Uncommitted work is rolled
+    back before the connection is returned.
+    """
+    pool = _pool
+    if pool is None:
+        conn = get_db_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        if conn.closed:
+            pool.putconn(conn, close=True)
+        else:
+            conn.rollback()
+            pool.putconn(conn)
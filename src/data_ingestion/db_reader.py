@@ -1,14 +1,22 @@
 # src/data_ingestion/db_reader.py
 
 def get_last_candle_ts(conn, symbol, timeframe):
+    """
+    Last committed candle ts for a series, from candle_watermarks.
+    Falls back to MAX(ts) for series written before the watermark
+    table existed.
+    """
     cur = conn.cursor()
     cur.execute(
         """
-        SELECT MAX(ts) AS last_ts
-        FROM candles
-        WHERE symbol=%s AND timeframe=%s
+        SELECT COALESCE(
+            (SELECT last_ts FROM candle_watermarks
+             WHERE symbol=%s AND timeframe=%s),
+            (SELECT MAX(ts) FROM candles
+             WHERE symbol=%s AND timeframe=%s)
+        ) AS last_ts
         """,
-        (symbol, timeframe)
+        (symbol, timeframe, symbol, timeframe)
     )
     row = cur.fetchone()
 
@@ -20,3 +28,31 @@ def get_last_candle_ts(conn, symbol, timeframe):
         return row.get("last_ts")
 
     return row[0]
+
+
+def get_last_candle_ts_many(conn, symbols, timeframe):
+    """
+    Last committed candle ts for many symbols of one timeframe in a
+    single round trip. Returns {symbol: ts or None}.
+    """
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT s.symbol,
+               COALESCE(
+                   w.last_ts,
+                   (SELECT MAX(c.ts) FROM candles c
+                    WHERE c.symbol = s.symbol AND c.timeframe = %s)
+               ) AS last_ts
+        FROM unnest(%s::text[]) AS s(symbol)
+        LEFT JOIN candle_watermarks w
+               ON w.symbol = s.symbol AND w.timeframe = %s
+        """,
+        (timeframe, list(symbols), timeframe)
+    )
+    rows = cur.fetchall()
+
+    if rows and isinstance(rows[0], dict):
+        return {r["symbol"]: r["last_ts"] for r in rows}
+
+    return {r[0]: r[1] for r in rows}
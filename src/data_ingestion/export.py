@@ -0,0 +1,228 @@
+# src/data_ingestion/export.py
+
+import logging
+from datetime import datetime
+from typing import Iterator, List
+
+import psycopg2.extensions
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from data_ingestion.db import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+# Rows per server-side cursor fetch / Arrow record batch
+EXPORT_BATCH_ROWS = 100_000
+
+PARQUET_COMPRESSION = "zstd"
+
+CANDLE_SCHEMA = pa.schema([
+    ("symbol", pa.string()),
+    ("timeframe", pa.string()),
+    ("ts", pa.timestamp("us", tz="UTC")),
+    ("open", pa.float64()),
+    ("high", pa.float64()),
+    ("low", pa.float64()),
+    ("close", pa.float64()),
+    ("volume", pa.int64()),
+])
+
+EXPORT_FORMATS = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+# ─────────────────────────────────────────────
+# Read side (server-side cursor → record batches)
+# ─────────────────────────────────────────────
+
+def rows_to_batch(rows: list) -> pa.RecordBatch:
+    """
+    Convert tuple rows in CANDLE_SCHEMA column order to a record batch.
+    """
+    columns = list(zip(*rows))
+    return pa.record_batch(
+        [
+            pa.array(values, type=field.type)
+            for values, field in zip(columns, CANDLE_SCHEMA)
+        ],
+        schema=CANDLE_SCHEMA,
+    )
+
+
+def iter_candle_batches(
+    conn,
+    symbols: List[str],
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    batch_rows: int = EXPORT_BATCH_ROWS,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Stream candles for symbols × [start, end) as Arrow record batches.
+
+    Uses a named (server-side) cursor, so memory stays bounded by
+    `batch_rows` regardless of the export size.
+    """
+    query = """
+        SELECT
+            symbol,
+            timeframe,
+            ts,
+            open::float8,
+            high::float8,
+            low::float8,
+            close::float8,
+            volume::bigint
+        FROM candles
+        WHERE symbol = ANY(%s)
+          AND timeframe = %s
+          AND ts >= %s
+          AND ts < %s
+        ORDER BY symbol, ts
+    """
+
+    # Plain tuple cursor: RealDictCursor would build a dict per row
+    with conn.cursor(
+        name="candle_export",
+        cursor_factory=psycopg2.extensions.cursor,
+    ) as cur:
+        cur.itersize = batch_rows
+        cur.execute(query, (list(symbols), timeframe, start, end))
+
+        while True:
+            rows = cur.fetchmany(batch_rows)
+            if not rows:
+                break
+            yield rows_to_batch(rows)
+
+
+# ─────────────────────────────────────────────
+# Write side
+# ─────────────────────────────────────────────
+
+class _ChunkSink:
+    """
+    Minimal append-only file object that hands written bytes back to
+    the caller, so Arrow/Parquet writers can feed an HTTP stream.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._pos = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _open_writer(sink, fmt: str):
+    if fmt == "arrow":
+        return pa.ipc.new_stream(sink, CANDLE_SCHEMA)
+    if fmt == "parquet":
+        return pq.ParquetWriter(
+            sink, CANDLE_SCHEMA, compression=PARQUET_COMPRESSION
+        )
+    raise ValueError(
+        f"Unsupported export format '{fmt}'. Supported: {list(EXPORT_FORMATS)}"
+    )
+
+
+def write_batches(sink, batches: Iterator[pa.RecordBatch], fmt: str) -> int:
+    """
+    Write record batches to a path or file object as an Arrow IPC
+    stream or Parquet (one row group per batch). Returns rows written.
+    """
+    rows = 0
+    writer = _open_writer(sink, fmt)
+    try:
+        for batch in batches:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        writer.close()
+    return rows
+
+
+def stream_export(
+    symbols: List[str],
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    fmt: str,
+) -> Iterator[bytes]:
+    """
+    Generator of encoded export bytes for HTTP streaming.
+    Opens its own connection for the lifetime of the download.
+    Candles past the retention cutoff come from the Parquet archive.
+    """
+    # Local import: archive imports this module
+    from data_ingestion.archive import iter_tiered_batches
+
+    sink = _ChunkSink()
+    writer = _open_writer(sink, fmt)
+
+    conn = get_db_connection()
+    try:
+        for batch in iter_tiered_batches(conn, symbols, timeframe, start, end):
+            writer.write_batch(batch)
+            yield sink.drain()
+
+        writer.close()
+        yield sink.drain()
+    finally:
+        conn.close()
+
+
+def export_candles(
+    symbols: List[str],
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    output: str,
+    fmt: str = "parquet",
+) -> int:
+    """
+    Export candles to a local Arrow IPC or Parquet file, reading the
+    archive for anything past the retention cutoff.
+    """
+    # Local import: archive imports this module
+    from data_ingestion.archive import iter_tiered_batches
+
+    conn = get_db_connection()
+    try:
+        rows = write_batches(
+            output,
+            iter_tiered_batches(conn, symbols, timeframe, start, end),
+            fmt,
+        )
+    finally:
+        conn.close()
+
+    logger.info(
+        f"EXPORT | {len(symbols)} symbols | {timeframe} | "
+        f"{start} → {end} | {rows} rows → {output}"
+    )
+    return rows
@@ -1,19 +1,23 @@
 import logging
+import threading
 import pandas as pd
 from datetime import datetime
+from typing import Optional
 
 from data_ingestion.clients.kite_client import KiteClient
 
 logger = logging.getLogger(__name__)
 
 _kite_client = None
+_kite_client_lock = threading.Lock()
 
 
 def _get_kite_client() -> KiteClient:
     global _kite_client
-    if _kite_client is None:
-        logger.info("Initializing Kite client")
-        _kite_client = KiteClient()
+    with _kite_client_lock:
+        if _kite_client is None:
+            logger.info("Initializing Kite client")
+            _kite_client = KiteClient()
     return _kite_client
 
 
@@ -22,12 +26,15 @@ def fetch_candles(
     timeframe: str,
     start: datetime,
     end: datetime,
+    cancel: Optional[threading.Event] = None,
 ) -> pd.DataFrame:
     """
     Fetch historical candles from Zerodha Kite.
 
     Returns DataFrame with columns:
     ts, open, high, low, close, volume
+
+    Raises FetchCancelled once `cancel` is set.
     """
 
     client = _get_kite_client()
@@ -37,4 +44,5 @@ def fetch_candles(
         timeframe=timeframe,
         start=start,
         end=end,
+        cancel=cancel,
     )
@@ -28,7 +28,8 @@ def detect_gaps(df, timeframe):
     Detect gaps inside an intraday dataframe.
 
     Returns:
-        List of (gap_start, gap_end)
+        List of half-open (gap_start, gap_end) windows, in the same
+        [start, end) convention as fetch_candles / plan_fetch_chunks
     """
     timeframe = timeframe.upper()
 
@@ -46,7 +47,7 @@ def detect_gaps(df, timeframe):
     for ts in timestamps:
         if prev_ts and ts - prev_ts > expected_delta * 1.5:
             gaps.append(
-                (prev_ts + expected_delta, ts - expected_delta)
+                (prev_ts + expected_delta, ts)
             )
         prev_ts = ts
 
@@ -1,15 +1,13 @@
 import pandas as pd
-from kiteconnect import KiteConnect
 import os
-from auth.zerodha_auth import load_access_token
+from auth.zerodha_auth import create_kite_connect
 
 
-INSTRUMENTS_FILE = "data/instruments_kite.parquet"
+INSTRUMENTS_FILE = os.getenv("KITE_INSTRUMENTS_FILE", "data/instruments_kite.parquet")
 
 
 def download_instruments():
-    kite = KiteConnect(api_key=os.getenv("KITE_API_KEY"))
-    kite.set_access_token(load_access_token())
+    kite = create_kite_connect()
 
     data = kite.instruments()
     df = pd.DataFrame(data)
@@ -0,0 +1,293 @@
+# src/data_ingestion/live_aggregator.py
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from agents.calendar.trading_calendar import IST, TradingCalendar, get_trading_calendar
+from data_ingestion.timeframe_mapper import TIMEFRAMES
+
+logger = logging.getLogger(__name__)
+
+# Timeframes built from ticks ("1M" is the base; the rest roll up from it)
+LIVE_TIMEFRAMES = ("1M", "5M", "15M")
+
+# (symbol, timeframe, bar_start_epoch_sec, open, high, low, close, volume)
+ClosedBar = Tuple[str, str, int, float, float, float, float, int]
+
+# (symbol, timeframe, bar_start_epoch_sec, bar_end_epoch_sec) of a bar
+# that was not built from all of its ticks and must come from REST
+PartialBar = Tuple[str, str, int, int]
+
+
+def bucket_start(epoch_sec: int, step_sec: int, session_open: int) -> int:
+    """
+    Start of the `step_sec` bucket holding `epoch_sec`; buckets are
+    aligned to the open of the session they fall in.
+    """
+    return epoch_sec - (epoch_sec - session_open) % step_sec
+
+
+class _Bar:
+    __slots__ = ("start", "end", "open", "high", "low", "close", "volume")
+
+    def __init__(self, start: int, end: int, open_: float, high: float, low: float, close: float, volume: int):
+        self.start = start
+        self.end = end
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+
+class _InstrumentState:
+    """
+    Per-instrument state: one open bar per timeframe, the last
+    cumulative day volume seen (ticks carry cumulative volume) and the
+    time of the first tick since start / reconnect (`since`).
+    """
+
+    __slots__ = ("symbol", "last_cum_volume", "bars", "since")
+
+    def __init__(self, symbol: str, n_timeframes: int):
+        self.symbol = symbol
+        self.last_cum_volume: Optional[int] = None
+        self.bars: List[Optional[_Bar]] = [None] * n_timeframes
+        self.since: Optional[int] = None
+
+
+class LiveCandleAggregator:
+    """
+    Builds OHLCV bars from ticks in memory.
+
+    1M bars are built from ticks; higher timeframes are rolled up from
+    closed 1M bars, so all timeframes agree with each other. Bars are
+    returned as ClosedBar tuples as soon as they close — either when a
+    tick for a later minute arrives or when `close_due()` is called past
+    the bar end.
+
+    Sessions (holidays and special sessions included) come from the
+    trading calendar. A bar whose bucket started before the first tick
+    seen since start / reset() (or at it) missed ticks or volume: it is
+    never emitted, and is reported by take_partial() for a REST refetch
+    instead.
+    """
+
+    def __init__(
+        self,
+        symbols_by_token: Dict[int, str],
+        timeframes: Sequence[str] = LIVE_TIMEFRAMES,
+        calendar: Optional[TradingCalendar] = None,
+    ):
+        if timeframes[0] != "1M":
+            raise ValueError("Live timeframes must start with the 1M base timeframe")
+
+        self.timeframes = list(timeframes)
+        self.steps = [TIMEFRAMES[tf]["minutes"] * 60 for tf in self.timeframes]
+        self.calendar = calendar or get_trading_calendar()
+        self._sessions: Dict[object, List[Tuple[int, int]]] = {}
+        self._partial: List[PartialBar] = []
+
+        self._states: Dict[int, _InstrumentState] = {
+            token: _InstrumentState(symbol, len(self.timeframes))
+            for token, symbol in symbols_by_token.items()
+        }
+
+        self.ticks = 0
+        self.late_ticks = 0
+        self.partial_bars = 0
+
+    # ─────────────────────────────────────────────
+    # Sessions
+    # ─────────────────────────────────────────────
+
+    def session(self, epoch_sec: int) -> Optional[Tuple[int, int]]:
+        """
+        (open, close) epochs of the session holding `epoch_sec`, if any.
+        """
+        day = datetime.fromtimestamp(epoch_sec, timezone.utc).astimezone(IST).date()
+        sessions = self._sessions.get(day)
+        if sessions is None:
+            sessions = [
+                (int(o.timestamp()), int(c.timestamp()))
+                for o, c in self.calendar.sessions(day)
+            ]
+            self._sessions[day] = sessions
+
+        for open_, close in sessions:
+            if open_ <= epoch_sec < close:
+                return open_, close
+        return None
+
+    def bucket(self, epoch_sec: int, step_sec: int) -> Optional[Tuple[int, int]]:
+        """
+        (start, end) of the in-session bucket holding `epoch_sec`.
+        """
+        session = self.session(epoch_sec)
+        if session is None:
+            return None
+        start = bucket_start(epoch_sec, step_sec, session[0])
+        return start, min(start + step_sec, session[1])
+
+    # ─────────────────────────────────────────────
+    # Ticks
+    # ─────────────────────────────────────────────
+
+    def on_tick(self, token: int, price: float, cum_volume: Optional[int], ts: int) -> List[ClosedBar]:
+        """
+        Apply one tick (ts in epoch seconds). Returns bars it closed.
+        """
+        state = self._states.get(token)
+        if state is None:
+            return []
+
+        self.ticks += 1
+
+        volume = 0
+        if cum_volume is not None:
+            last = state.last_cum_volume
+            if last is not None:
+                # Cumulative volume resets at the start of a new day
+                volume = cum_volume - last if cum_volume >= last else cum_volume
+            state.last_cum_volume = cum_volume
+
+        minute = self.bucket(ts, 60)
+        if minute is None:
+            return []
+        if state.since is None:
+            state.since = ts
+
+        closed: List[ClosedBar] = []
+        start, end = minute
+        bar = state.bars[0]
+
+        if bar is not None and start < bar.start:
+            # Late tick for an already closed minute: keep its volume
+            self.late_ticks += 1
+            bar.volume += volume
+            return closed
+
+        if bar is not None and start > bar.start:
+            self._close_base(state, closed)
+            bar = None
+
+        if bar is None:
+            state.bars[0] = _Bar(start, end, price, price, price, price, volume)
+        else:
+            if price > bar.high:
+                bar.high = price
+            if price < bar.low:
+                bar.low = price
+            bar.close = price
+            bar.volume += volume
+
+        return closed
+
+    def close_due(self, now: int, grace: int = 0) -> List[ClosedBar]:
+        """
+        Close every bar whose end is at or before `now - grace`.
+        Covers instruments that stopped ticking.
+        """
+        cutoff = now - grace
+        closed: List[ClosedBar] = []
+
+        for state in self._states.values():
+            bar = state.bars[0]
+            if bar is not None and bar.end <= cutoff:
+                self._close_base(state, closed)
+
+            for i in range(1, len(self.timeframes)):
+                higher = state.bars[i]
+                if higher is not None and higher.end <= cutoff:
+                    self._emit(state, i, closed)
+
+        return closed
+
+    def close_all(self) -> List[ClosedBar]:
+        """
+        Close every open bar (shutdown / end of replay).
+        """
+        closed: List[ClosedBar] = []
+        for state in self._states.values():
+            if state.bars[0] is not None:
+                self._close_base(state, closed)
+            for i in range(1, len(self.timeframes)):
+                if state.bars[i] is not None:
+                    self._emit(state, i, closed)
+        return closed
+
+    def reset(self):
+        """
+        Tick stream interrupted (disconnect): open bars are missing
+        ticks, so they are dropped as partial, and coverage restarts
+        from the next tick of each instrument. The cumulative volume
+        baseline is dropped too, so the outage's volume never lands in
+        a bar.
+        """
+        for state in self._states.values():
+            for i in range(len(self.timeframes)):
+                bar = state.bars[i]
+                if bar is not None:
+                    state.bars[i] = None
+                    self._partial.append((state.symbol, self.timeframes[i], bar.start, bar.end))
+                    self.partial_bars += 1
+            state.since = None
+            state.last_cum_volume = None
+
+    def take_partial(self) -> List[PartialBar]:
+        """
+        Bars dropped since the last call, to be refetched over REST.
+        """
+        partial, self._partial = self._partial, []
+        return partial
+
+    # ─────────────────────────────────────────────
+    # Internals
+    # ─────────────────────────────────────────────
+
+    def _emit(self, state: _InstrumentState, i: int, closed: List[ClosedBar]):
+        bar = state.bars[i]
+        state.bars[i] = None
+
+        if bar.start <= state.since:
+            # Bucket opened at or before our first tick: only part of the
+            # bar, and the first tick's own volume is unknown (no baseline)
+            self._partial.append((state.symbol, self.timeframes[i], bar.start, bar.end))
+            self.partial_bars += 1
+            return
+
+        closed.append((
+            state.symbol, self.timeframes[i], bar.start,
+            bar.open, bar.high, bar.low, bar.close, bar.volume,
+        ))
+
+    def _close_base(self, state: _InstrumentState, closed: List[ClosedBar]):
+        """
+        Close the open 1M bar and fold it into the higher timeframes.
+        """
+        base = state.bars[0]
+        self._emit(state, 0, closed)
+
+        for i in range(1, len(self.timeframes)):
+            start, end = self.bucket(base.start, self.steps[i])
+            higher = state.bars[i]
+
+            if higher is not None and higher.start != start:
+                self._emit(state, i, closed)
+                higher = None
+
+            if higher is None:
+                higher = _Bar(start, end, base.open, base.high, base.low, base.close, base.volume)
+                state.bars[i] = higher
+            else:
+                if base.high > higher.high:
+                    higher.high = base.high
+                if base.low < higher.low:
+                    higher.low = base.low
+                higher.close = base.close
+                higher.volume += base.volume
+
+            # Last minute of the bucket folded in: close right away
+            if base.end >= higher.end:
+                self._emit(state, i, closed)
@@ -0,0 +1,340 @@
+# src/data_ingestion/live_ingestion.py
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from data_ingestion.db import get_db_connection
+from data_ingestion.fetcher import fetch_candles
+from data_ingestion.live_aggregator import LIVE_TIMEFRAMES, ClosedBar, LiveCandleAggregator
+from data_ingestion.sink import CandleSink, SINK_COLUMNS
+from data_ingestion.symbol_resolver import resolve_symbol
+from data_ingestion.tick_replay import record_ticks, tick_epoch
+
+logger = logging.getLogger(__name__)
+
+# How often closed bars are flushed to the sink
+FLUSH_INTERVAL_SEC = 1.0
+
+# Wait this long past a bar end for straggling ticks before closing it
+CLOSE_GRACE_SEC = 2
+
+# Partial / missed bars are refetched over REST once Kite has settled them
+REPAIR_DELAY_SEC = 60
+REPAIR_INTERVAL_SEC = 5.0
+
+
+def bars_to_frame(bars: List[ClosedBar]) -> pd.DataFrame:
+    frame = pd.DataFrame(bars, columns=SINK_COLUMNS)
+    frame["ts"] = pd.to_datetime(frame["ts"], unit="s", utc=True)
+    return frame
+
+
+def create_kite_ticker():
+    from kiteconnect import KiteTicker
+    from auth.zerodha_auth import load_access_token
+
+    return KiteTicker(
+        os.getenv("KITE_API_KEY"),
+        os.getenv("KITE_ACCESS_TOKEN") or load_access_token(),
+    )
+
+
+class LiveIngestionService:
+    """
+    Streams ticks from KiteTicker (or a TickReplay), aggregates them
+    into 1M/5M/15M bars in memory and flushes closed bars to the
+    CandleSink in batches from a single writer thread.
+
+    Bars the stream only saw part of (first bar after start or
+    reconnect) and bars missed while disconnected are not written from
+    ticks; a repair thread refetches those windows over REST.
+    """
+
+    def __init__(
+        self,
+        symbols: List[str],
+        ticker=None,
+        timeframes=LIVE_TIMEFRAMES,
+        flush_interval: float = FLUSH_INTERVAL_SEC,
+        close_grace: int = CLOSE_GRACE_SEC,
+        clock: Optional[Callable[[], float]] = None,
+        record_path: Optional[str] = None,
+        exchange: str = "NSE",
+    ):
+        self.tokens = {resolve_symbol(s, exchange): s for s in symbols}
+        self.aggregator = LiveCandleAggregator(self.tokens, timeframes)
+
+        self.ticker = ticker or create_kite_ticker()
+        self.flush_interval = flush_interval
+        self.close_grace = close_grace
+        self.clock = clock or time.time
+
+        self._record_fp = open(record_path, "a") if record_path else None
+
+        self._lock = threading.Lock()
+        self._pending: List[ClosedBar] = []
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._conn = None
+
+        self.bars_written = 0
+
+        # (symbol, timeframe) → [start, end) epoch window to refetch
+        self._repairs: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self._repairer: Optional[threading.Thread] = None
+        self._repair_conn = None
+        self._disconnected_at: Optional[float] = None
+        self.bars_repaired = 0
+
+    # ─────────────────────────────────────────────
+    # Ticker callbacks (ticker thread)
+    # ─────────────────────────────────────────────
+
+    def _on_connect(self, ws, response):
+        tokens = list(self.tokens)
+        ws.subscribe(tokens)
+        ws.set_mode(ws.MODE_FULL, tokens)
+        logger.info(f"LIVE | subscribed {len(tokens)} instruments")
+
+        with self._lock:
+            if self._disconnected_at is not None:
+                # Reconnected: bars open across the outage missed ticks
+                self.aggregator.reset()
+                self._add_outage(int(self._disconnected_at), int(self.clock()))
+                self._disconnected_at = None
+
+    def _on_ticks(self, ws, ticks):
+        now = self.clock()
+
+        with self._lock:
+            if self._record_fp:
+                record_ticks(self._record_fp, ticks)
+
+            for tick in ticks:
+                closed = self.aggregator.on_tick(
+                    tick["instrument_token"],
+                    tick["last_price"],
+                    tick.get("volume_traded"),
+                    tick_epoch(tick, default=now),
+                )
+                if closed:
+                    self._pending.extend(closed)
+
+    def _on_close(self, ws, code, reason):
+        logger.info(f"LIVE | ticker closed | {code} {reason}")
+
+        with self._lock:
+            # Open bars are held (not closed on time) until we reconnect
+            # or stop; see _take_pending
+            if self._disconnected_at is None:
+                self._disconnected_at = self.clock()
+
+    def _on_error(self, ws, code, reason):
+        logger.error(f"LIVE | ticker error | {code} {reason}")
+
+    # ─────────────────────────────────────────────
+    # Flushing (writer thread)
+    # ─────────────────────────────────────────────
+
+    def _take_pending(self, close_all: bool = False) -> List[ClosedBar]:
+        with self._lock:
+            if close_all:
+                self._pending.extend(self.aggregator.close_all())
+            elif self._disconnected_at is None:
+                self._pending.extend(
+                    self.aggregator.close_due(int(self.clock()), self.close_grace)
+                )
+            bars, self._pending = self._pending, []
+            for symbol, tf, start, end in self.aggregator.take_partial():
+                self._add_repair(symbol, tf, start, end)
+        return bars
+
+    def flush(self, close_all: bool = False) -> int:
+        bars = self._take_pending(close_all)
+        if not bars:
+            return 0
+
+        try:
+            if self._conn is None or self._conn.closed:
+                self._conn = get_db_connection()
+            CandleSink(self._conn).write_frame(bars_to_frame(bars))
+        except Exception:
+            logger.exception(f"LIVE FLUSH FAILED | {len(bars)} bars (will retry)")
+            with self._lock:
+                self._pending[:0] = bars
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            return 0
+
+        self.bars_written += len(bars)
+        logger.debug(f"LIVE FLUSH | {len(bars)} bars")
+        return len(bars)
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    # ─────────────────────────────────────────────
+    # REST repair (repair thread)
+    # ─────────────────────────────────────────────
+
+    def _add_repair(self, symbol: str, timeframe: str, start: int, end: int):
+        # Caller holds self._lock
+        window = self._repairs.get((symbol, timeframe))
+        if window is not None:
+            start, end = min(start, window[0]), max(end, window[1])
+        self._repairs[(symbol, timeframe)] = (start, end)
+
+    def _add_outage(self, start: int, end: int):
+        # Every bucket touched by [start, end) on every series
+        for i, tf in enumerate(self.aggregator.timeframes):
+            step = self.aggregator.steps[i]
+            first = self.aggregator.bucket(start, step)
+            last = self.aggregator.bucket(end, step)
+            window = (first[0] if first else start, last[1] if last else end)
+            for symbol in self.tokens.values():
+                self._add_repair(symbol, tf, *window)
+
+        logger.warning(f"LIVE | outage {end - start}s | refetching over REST")
+
+    def _take_due_repairs(self) -> List[Tuple[str, str, int, int]]:
+        cutoff = self.clock() - REPAIR_DELAY_SEC
+        with self._lock:
+            due = [
+                (symbol, tf, start, end)
+                for (symbol, tf), (start, end) in self._repairs.items()
+                if end <= cutoff
+            ]
+            for symbol, tf, _, _ in due:
+                del self._repairs[(symbol, tf)]
+        return due
+
+    def repair(self) -> int:
+        """
+        Refetch due partial / missed windows over REST and write them.
+        Failed windows are queued again.
+        """
+        written = 0
+        for symbol, tf, start, end in self._take_due_repairs():
+            try:
+                df = fetch_candles(
+                    symbol,
+                    tf,
+                    datetime.fromtimestamp(start, timezone.utc),
+                    datetime.fromtimestamp(end, timezone.utc),
+                )
+                if df.empty:
+                    continue
+                if self._repair_conn is None or self._repair_conn.closed:
+                    self._repair_conn = get_db_connection()
+                written += CandleSink(self._repair_conn).write(symbol, tf, df)
+            except Exception:
+                logger.exception(f"LIVE REPAIR FAILED | {symbol} | {tf} (will retry)")
+                with self._lock:
+                    self._add_repair(symbol, tf, start, end)
+                if self._repair_conn is not None:
+                    self._repair_conn.close()
+                    self._repair_conn = None
+
+        self.bars_repaired += written
+        return written
+
+    def _repair_loop(self):
+        while not self._stop.wait(REPAIR_INTERVAL_SEC):
+            self.repair()
+
+    # ─────────────────────────────────────────────
+    # Lifecycle
+    # ─────────────────────────────────────────────
+
+    def start(self):
+        self.ticker.on_connect = self._on_connect
+        self.ticker.on_ticks = self._on_ticks
+        self.ticker.on_close = self._on_close
+        self.ticker.on_error = self._on_error
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="live-flush", daemon=True)
+        self._flusher.start()
+
+        self._repairer = threading.Thread(target=self._repair_loop, name="live-repair", daemon=True)
+        self._repairer.start()
+
+        self.ticker.connect(threaded=True)
+        logger.info(f"LIVE START | {len(self.tokens)} symbols | {self.aggregator.timeframes}")
+
+    def stop(self):
+        self._stop.set()
+        self.ticker.close()
+        if self._flusher is not None:
+            self._flusher.join()
+        if self._repairer is not None:
+            self._repairer.join()
+
+        self.flush(close_all=True)
+
+        if self._repairs:
+            logger.warning(
+                f"LIVE STOP | {len(self._repairs)} series windows not yet repaired: "
+                f"{sorted(self._repairs.items())[:10]}"
+            )
+
+        if self._conn is not None:
+            self._conn.close()
+        if self._repair_conn is not None:
+            self._repair_conn.close()
+        if self._record_fp:
+            self._record_fp.close()
+
+        logger.info(
+            f"LIVE STOP | {self.aggregator.ticks} ticks | "
+            f"{self.aggregator.late_ticks} late | {self.bars_written} bars written | "
+            f"{self.aggregator.partial_bars} partial, {self.bars_repaired} repaired"
+        )
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import argparse
+
+    from data_ingestion.tick_replay import TickReplay
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    parser = argparse.ArgumentParser(description="Live tick ingestion")
+    parser.add_argument("--symbols", required=True, help="Comma-separated symbols")
+    parser.add_argument("--replay", help="Replay recorded ticks (JSONL) instead of KiteTicker")
+    parser.add_argument("--speed", type=float, default=0.0, help="Replay speed (0 = as fast as possible)")
+    parser.add_argument("--record", help="Append received ticks to this JSONL file")
+    args = parser.parse_args()
+
+    symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+
+    if args.replay:
+        replay = TickReplay(args.replay, speed=args.speed)
+        service = LiveIngestionService(symbols, ticker=replay, clock=replay.now, record_path=args.record)
+        service.start()
+        replay.join()
+        service.stop()
+    else:
+        service = LiveIngestionService(symbols, record_path=args.record)
+        service.start()
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.stop()
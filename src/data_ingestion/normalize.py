@@ -43,7 +43,7 @@ def normalize_shoonya_candles(
             records.append({
                 "symbol": symbol,
                 "timeframe": timeframe,
-                "candle_ts": ts,
+                "ts": ts,
                 "open": float(c["into"]),
                 "high": float(c["inth"]),
                 "low": float(c["intl"]),
@@ -1,23 +1,30 @@
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
 from datetime import datetime, timedelta, date, time
+from time import perf_counter
 import pandas as pd
 import pytz
 import logging
 import yaml
 
-from data_ingestion.timeframe_mapper import TIMEFRAMES
+from data_ingestion.timeframe_mapper import BAR_SETTLE_SECONDS, DAILY_SETTLE_DAYS, TIMEFRAMES
 from scheduler.job_registry import get_job_config
 from scheduler.guards import is_market_open
+from scheduler.priority_executor import seconds_left
 
+from data_ingestion.clients.kite_client import FetchCancelled, api_calls_made
 from data_ingestion.fetcher import fetch_candles
-from data_ingestion.db_reader import get_last_candle_ts
-from data_ingestion.writer import write_candles
+from data_ingestion.chunk_planner import plan_fetch_chunks
+from data_ingestion.db_reader import get_last_candle_ts, get_last_candle_ts_many
+from data_ingestion.writer import write_candle_frame, write_candles
 from data_ingestion.gap_detector import detect_gaps
-from data_ingestion.db import get_db_connection
+from data_ingestion.db import get_db_connection, pooled_connection
+from data_ingestion.backfill_executor import DEFAULT_WORKERS, run_planned_backfill
 
 logger = logging.getLogger(__name__)
 IST = pytz.timezone("Asia/Kolkata")
 
-MAX_BACKFILL_DAYS = 90
 
 def parse_date_local(value) -> datetime:
     """
@@ -52,6 +59,10 @@ DEFAULT_INTRADAY_LOOKBACK_MINUTES = {
     "1M": 24 * 60,
 }
 
+# Concurrent fetches per ingestion cycle. Calls are paced by the shared
+# KiteClient limiter; concurrency only overlaps request latency.
+INGEST_FETCH_WORKERS = 8
+
 # ─────────────────────────────────────────────
 # Timeframe helpers
 # ─────────────────────────────────────────────
@@ -76,10 +87,7 @@ def align_to_timeframe(ts: datetime, timeframe: str) -> datetime:
 # Incremental ingestion helpers
 # ─────────────────────────────────────────────
 
-def resolve_start_ts(conn, symbol: str, timeframe: str) -> datetime:
-    last_ts = get_last_candle_ts(conn, symbol, timeframe)
-    now = datetime.now(IST)
-
+def _start_after(last_ts, timeframe: str, now: datetime) -> datetime:
     if last_ts:
         return last_ts + _timeframe_delta(timeframe)
 
@@ -89,57 +97,210 @@ def resolve_start_ts(conn, symbol: str, timeframe: str) -> datetime:
     lookback = DEFAULT_INTRADAY_LOOKBACK_MINUTES[timeframe]
     return now - timedelta(minutes=lookback)
 
-# ─────────────────────────────────────────────
-# Scheduler ingestion (unchanged)
-# ─────────────────────────────────────────────
 
-def ingest_symbol(conn, symbol: str, timeframe: str):
-    start = resolve_start_ts(conn, symbol, timeframe)
-    now = datetime.now(IST)
+def resolve_start_ts(conn, symbol: str, timeframe: str) -> datetime:
+    last_ts = get_last_candle_ts(conn, symbol, timeframe)
+    return _start_after(last_ts, timeframe, datetime.now(IST))
 
-    def safe_now(tf: str, now_: datetime) -> datetime:
-        if tf == "1D":
-            return now_ - timedelta(days=3)
-        buffer_minutes = max(TIMEFRAMES[tf]["minutes"] * 3, 5)
-        return now_ - timedelta(minutes=buffer_minutes)
 
-    start = align_to_timeframe(start, timeframe)
-    end = align_to_timeframe(safe_now(timeframe, now), timeframe)
+def _safe_now(timeframe: str, now: datetime) -> datetime:
+    if timeframe == "1D":
+        return now - timedelta(days=DAILY_SETTLE_DAYS)
+    # Fetches are half-open, so aligning this down excludes the bar
+    # still forming; bars count as closed once settled
+    return now - timedelta(seconds=BAR_SETTLE_SECONDS)
 
-    if start >= end:
-        logger.info(f"{symbol} | {timeframe} | no new candles")
-        return
 
-    df = fetch_candles(symbol, timeframe, start, end)
-    if df.empty:
-        return
+def ingestion_window(last_ts, timeframe: str, now: datetime = None):
+    """
+    Aligned [start, end) still to fetch for a series whose last
+    committed candle is `last_ts` (None → default lookback).
+    """
+    now = now or datetime.now(IST)
+    start = align_to_timeframe(_start_after(last_ts, timeframe, now), timeframe)
+    end = align_to_timeframe(_safe_now(timeframe, now), timeframe)
+    return start, end
+
+
+def fetch_with_gaps(
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    metrics=None,
+    cancel: threading.Event = None,
+) -> pd.DataFrame:
+    """
+    Fetch a window and re-request any intraday holes once.
+    Timing, API calls and gap refetches are recorded on `metrics`
+    (a JobRunMetrics), failures included. Setting `cancel` stops the
+    fetch before its next Kite request (FetchCancelled); cancelled
+    fetches are left to the caller to record.
+    """
+    t0 = perf_counter()
+    calls_before = api_calls_made()
+    df = None
+    gaps = []
+    error = None
+    cancelled = False
+    try:
+        df = fetch_candles(symbol, timeframe, start, end, cancel=cancel)
+        if df.empty or timeframe == "1D":
+            return df
 
-    if timeframe != "1D":
         gaps = detect_gaps(df, timeframe)
         for g_start, g_end in gaps:
-            gap_df = fetch_candles(symbol, timeframe, g_start, g_end)
+            gap_df = fetch_candles(symbol, timeframe, g_start, g_end, cancel=cancel)
             if not gap_df.empty:
                 df = pd.concat([df, gap_df], ignore_index=True)
         df = df.drop_duplicates(subset=["ts"]).sort_values("ts")
+        return df
+    except FetchCancelled:
+        cancelled = True
+        raise
+    except Exception as e:
+        error = str(e) or type(e).__name__
+        raise
+    finally:
+        if metrics is not None and not cancelled:
+            metrics.record_fetch(
+                symbol,
+                perf_counter() - t0,
+                api_calls_made() - calls_before,
+                0 if df is None else len(df),
+                len(gaps),
+                error,
+            )
+
+# ─────────────────────────────────────────────
+# Scheduler ingestion
+# ─────────────────────────────────────────────
+
+def ingest_symbol(conn, symbol: str, timeframe: str):
+    start, end = ingestion_window(
+        get_last_candle_ts(conn, symbol, timeframe), timeframe
+    )
+
+    if start >= end:
+        logger.info(f"{symbol} | {timeframe} | no new candles")
+        return
+
+    df = fetch_with_gaps(symbol, timeframe, start, end)
+    if df.empty:
+        return
 
     write_candles(conn, symbol, timeframe, df)
     logger.info(f"{symbol} | {timeframe} | inserted {len(df)} candles")
 
 
-def run_ingestion_job(job_name: str, symbols: list[str]):
+def _timed_db(metrics):
+    return metrics.db() if metrics is not None else nullcontext()
+
+
+def run_ingestion_cycle(
+    conn,
+    symbols: list[str],
+    timeframe: str,
+    workers: int = INGEST_FETCH_WORKERS,
+    timeout: float = None,
+    fence=None,
+    metrics=None,
+) -> int:
+    """
+    Ingest many symbols of one timeframe as one cycle:
+
+    - all watermarks in one query
+    - fetches fanned out over a thread pool (paced by the shared
+      KiteClient rate limiter)
+    - one frame, one COPY, one commit
+
+    A failed fetch skips that symbol only; it is retried from its
+    watermark next cycle. Fetches still running after `timeout`
+    seconds are abandoned (cancelled before their next Kite request,
+    so they stop drawing on the shared rate limit) and what has
+    arrived is written. `fence`
+    (a scheduler Lease) guards the write against a takeover; `metrics`
+    (a JobRunMetrics) collects per-stage timings and counts.
+    Returns rows inserted or changed.
+    """
+    now = datetime.now(IST)
+    with _timed_db(metrics):
+        last_ts = get_last_candle_ts_many(conn, symbols, timeframe)
+        # Release the snapshot while fetches are in flight
+        conn.commit()
+
+    windows = {}
+    for symbol in symbols:
+        start, end = ingestion_window(last_ts.get(symbol), timeframe, now)
+        if start < end:
+            windows[symbol] = (start, end)
+
+    if not windows:
+        logger.info(f"CYCLE | {timeframe} | {len(symbols)} symbols | no new candles")
+        return 0
+
+    frames = []
+    cancel = threading.Event()
+    pool = ThreadPoolExecutor(
+        max_workers=min(workers, len(windows)), thread_name_prefix="ingest"
+    )
+    futures = {
+        pool.submit(fetch_with_gaps, symbol, timeframe, start, end, metrics, cancel): symbol
+        for symbol, (start, end) in windows.items()
+    }
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            symbol = futures[future]
+            try:
+                df = future.result()
+            except Exception:
+                logger.exception(f"CYCLE FETCH FAILED | {symbol} | {timeframe}")
+                continue
+            if not df.empty:
+                frames.append(df.assign(symbol=symbol, timeframe=timeframe))
+    except FuturesTimeout:
+        cancel.set()
+        pending = [futures[f] for f in futures if not f.done()]
+        logger.warning(
+            f"CYCLE TIMEOUT | {timeframe} | {len(pending)} fetches abandoned: {pending}"
+        )
+        if metrics is not None:
+            metrics.record_abandoned(pending)
+    finally:
+        cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if not frames:
+        return 0
+
+    frame = pd.concat(frames, ignore_index=True)
+    with _timed_db(metrics):
+        written = write_candle_frame(conn, frame, fence=fence)
+    if metrics is not None:
+        metrics.record_written(written)
+
+    logger.info(
+        f"CYCLE | {timeframe} | {len(frames)}/{len(symbols)} symbols | "
+        f"{len(frame)} candles | {written} written"
+    )
+    return written
+
+
+def run_ingestion_job(job_name: str, symbols: list[str], fence=None, metrics=None):
     job = get_job_config(job_name)
     timeframe = job["timeframe"]
 
-    if job["run_type"] == "INTRADAY" and not is_market_open():
+    # Grace lets the bar closing with the session still be fetched
+    grace = _timeframe_delta(timeframe) + timedelta(seconds=BAR_SETTLE_SECONDS)
+    if job["run_type"] == "INTRADAY" and not is_market_open(grace=grace):
         logger.info("Market closed — skipping job")
         return
 
-    conn = get_db_connection()
-    try:
-        for s in symbols:
-            ingest_symbol(conn, s, timeframe)
-    finally:
-        conn.close()
+    with pooled_connection() as conn:
+        run_ingestion_cycle(
+            conn, symbols, timeframe,
+            timeout=seconds_left(), fence=fence, metrics=metrics,
+        )
 
 # ─────────────────────────────────────────────
 # Backfill (single unit – unchanged)
@@ -156,12 +317,10 @@ def run_backfill(symbol: str, timeframe: str, start: datetime, end: datetime):
         last_ts = get_last_candle_ts(conn, symbol, timeframe)
         chunk_start = last_ts + _timeframe_delta(timeframe) if last_ts else start
 
-        while chunk_start < end:
-            chunk_end = min(chunk_start + timedelta(days=MAX_BACKFILL_DAYS), end)
-            df = fetch_candles(symbol, timeframe, chunk_start, chunk_end)
+        for c_start, c_end in plan_fetch_chunks(timeframe, chunk_start, end):
+            df = fetch_candles(symbol, timeframe, c_start, c_end)
             if not df.empty:
                 write_candles(conn, symbol, timeframe, df)
-            chunk_start = chunk_end
     finally:
         conn.close()
 
@@ -193,9 +352,19 @@ def run_multi_backfill(cfg: dict):
         f"timeframes={timeframes} | {start.date()} → {end.date()}"
     )
 
-    for s in symbols:
-        for tf in timeframes:
-            run_backfill(s, tf, start, end)
+    # Planned, resumable and parallel: see backfill_executor
+    progress = run_planned_backfill(
+        symbols,
+        timeframes,
+        start,
+        end,
+        workers=cfg.get("workers", DEFAULT_WORKERS),
+    )
+
+    if progress.get("failed") or progress.get("pending"):
+        logger.warning(f"⚠️ MULTI BACKFILL incomplete | {progress}")
+    else:
+        logger.info(f"🎉 MULTI BACKFILL completed | {progress}")
 
 # ─────────────────────────────────────────────
 # CLI
@@ -1,10 +1,14 @@
 from datetime import timedelta
 
+# Days of candles kept in Postgres (hot) per timeframe.
+# Older candles are moved to the Parquet archive (cold) by
+# data_ingestion.archive.
 RETENTION_POLICY = {
     "1D": 3650,
-    "15m": 180,
-    "5m": 90,
-    "1m": 30,
+    "15M": 180,
+    "10M": 120,
+    "5M": 90,
+    "1M": 30,
 }
 
 
@@ -0,0 +1,156 @@
+# src/data_ingestion/sink.py
+
+import io
+import logging
+import time
+from typing import Dict, List
+
+import pandas as pd
+import pytz
+
+from data_ingestion.candle_store import get_candle_store
+from monitoring.metrics import ROWS_STAGED, ROWS_WRITTEN, WRITE_SECONDS
+
+logger = logging.getLogger(__name__)
+IST = pytz.timezone("Asia/Kolkata")
+
+SINK_COLUMNS = ["symbol", "timeframe", "ts", "open", "high", "low", "close", "volume"]
+
+# Per-session staging table; rows vanish on commit
+CREATE_STAGE_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS candle_stage
+    ON COMMIT DELETE ROWS
+    AS SELECT symbol, timeframe, ts, open, high, low, close, volume
+    FROM candles
+    WITH NO DATA
+"""
+
+COPY_SQL = """
+    COPY candle_stage (symbol, timeframe, ts, open, high, low, close, volume)
+    FROM STDIN WITH (FORMAT csv)
+"""
+
+# Idempotent upsert: rewrites only rows whose values changed, and moves
+# the per-series watermark forward in the same statement.
+MERGE_SQL = """
+    WITH upserted AS (
+        INSERT INTO candles (symbol, timeframe, ts, open, high, low, close, volume)
+        SELECT DISTINCT ON (symbol, timeframe, ts)
+            symbol, timeframe, ts, open, high, low, close, volume
+        FROM candle_stage
+        ORDER BY symbol, timeframe, ts
+        ON CONFLICT (symbol, timeframe, ts) DO UPDATE
+        SET open = EXCLUDED.open,
+            high = EXCLUDED.high,
+            low = EXCLUDED.low,
+            close = EXCLUDED.close,
+            volume = EXCLUDED.volume
+        WHERE (candles.open, candles.high, candles.low, candles.close, candles.volume)
+              IS DISTINCT FROM
+              (EXCLUDED.open, EXCLUDED.high, EXCLUDED.low, EXCLUDED.close, EXCLUDED.volume)
+        RETURNING 1
+    ),
+    marks AS (
+        INSERT INTO candle_watermarks (symbol, timeframe, last_ts, updated_at)
+        SELECT symbol, timeframe, MAX(ts), NOW()
+        FROM candle_stage
+        GROUP BY symbol, timeframe
+        ON CONFLICT (symbol, timeframe) DO UPDATE
+        SET last_ts = GREATEST(candle_watermarks.last_ts, EXCLUDED.last_ts),
+            updated_at = NOW()
+    )
+    SELECT COUNT(*) AS written FROM upserted
+"""
+
+
+class CandleSink:
+    """
+    The single write path into `candles`.
+
+    Rows are bulk-loaded with COPY into a temp staging table, then
+    merged with an idempotent upsert. `candle_watermarks` moves in the
+    same transaction, so readers never see a watermark ahead of the
+    data it describes.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def write(self, symbol: str, timeframe: str, df: pd.DataFrame, commit: bool = True) -> int:
+        """
+        Write one series (df with ts, open, high, low, close, volume).
+        Returns rows inserted or changed.
+        """
+        if df.empty:
+            return 0
+
+        frame = df.assign(symbol=symbol, timeframe=timeframe)
+        return self.write_frame(frame, commit=commit)
+
+    def write_records(self, records: List[Dict], commit: bool = True) -> int:
+        """
+        Write dict records keyed like SINK_COLUMNS.
+        """
+        if not records:
+            return 0
+
+        return self.write_frame(pd.DataFrame.from_records(records), commit=commit)
+
+    def write_frame(self, frame: pd.DataFrame, commit: bool = True, fence=None) -> int:
+        """
+        Write a multi-series frame with SINK_COLUMNS in one COPY.
+
+        With commit=False the caller owns the transaction (e.g. to mark
+        work done atomically with the write). `fence` (a scheduler Lease)
+        is checked inside the transaction; the write is rolled back if
+        another replica has taken the lease over.
+        """
+        if frame.empty:
+            return 0
+
+        frame = frame[SINK_COLUMNS].copy()
+        frame["ts"] = pd.to_datetime(frame["ts"], utc=True)
+        frame["volume"] = frame["volume"].fillna(0).astype("int64")
+
+        buf = io.StringIO()
+        frame.to_csv(buf, index=False, header=False, date_format="%Y-%m-%d %H:%M:%S+00")
+        buf.seek(0)
+
+        t0 = time.perf_counter()
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(CREATE_STAGE_SQL)
+                # Stage may hold rows from an earlier write in this transaction
+                cur.execute("TRUNCATE candle_stage")
+                cur.copy_expert(COPY_SQL, buf)
+                if fence is not None:
+                    fence.check(cur)
+                cur.execute(MERGE_SQL)
+                row = cur.fetchone()
+
+            if commit:
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        written = row["written"] if isinstance(row, dict) else row[0]
+        WRITE_SECONDS.observe(time.perf_counter() - t0)
+        ROWS_STAGED.inc(len(frame))
+        ROWS_WRITTEN.inc(written)
+
+        self._invalidate_cache(frame)
+
+        logger.debug(
+            f"SINK | {frame[['symbol', 'timeframe']].drop_duplicates().shape[0]} series | "
+            f"{len(frame)} staged | {written} written"
+        )
+        return written
+
+    @staticmethod
+    def _invalidate_cache(frame: pd.DataFrame):
+        store = get_candle_store()
+        days = frame.assign(day=frame["ts"].dt.tz_convert(IST).dt.date)
+
+        for (symbol, timeframe), group in days.groupby(["symbol", "timeframe"]):
+            store.invalidate(symbol, timeframe, group["day"].unique())
@@ -0,0 +1,143 @@
+# src/data_ingestion/tick_replay.py
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from itertools import groupby
+from typing import Iterator, List, Optional
+
+import pytz
+
+logger = logging.getLogger(__name__)
+IST = pytz.timezone("Asia/Kolkata")
+
+# Fields kept when recording ticks (subset of KiteTicker full-mode ticks)
+RECORDED_FIELDS = ("instrument_token", "last_price", "volume_traded", "exchange_timestamp")
+
+
+def tick_epoch(tick: dict, default: Optional[float] = None) -> int:
+    """
+    Tick time in epoch seconds. Kite sends naive IST datetimes;
+    recordings carry ISO strings.
+    """
+    ts = tick.get("exchange_timestamp") or tick.get("last_trade_time")
+    if ts is None:
+        return int(default if default is not None else time.time())
+
+    if isinstance(ts, str):
+        ts = datetime.fromisoformat(ts)
+    if ts.tzinfo is None:
+        ts = IST.localize(ts)
+    return int(ts.timestamp())
+
+
+def record_ticks(fp, ticks: List[dict]):
+    """
+    Append ticks to an open JSONL file.
+    """
+    for tick in ticks:
+        row = {k: tick.get(k) for k in RECORDED_FIELDS}
+        ts = row["exchange_timestamp"]
+        if isinstance(ts, datetime):
+            row["exchange_timestamp"] = ts.isoformat()
+        fp.write(json.dumps(row) + "\n")
+
+
+def load_ticks(path: str) -> Iterator[dict]:
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class TickReplay:
+    """
+    Offline stand-in for KiteTicker.
+
+    Feeds recorded ticks (JSONL, see record_ticks) through the same
+    callbacks KiteTicker uses, grouped by timestamp like live batches.
+    speed=0 replays as fast as possible; speed=N replays N× real time.
+    `now()` is the replay clock (time of the last delivered batch).
+    """
+
+    MODE_LTP = "ltp"
+    MODE_QUOTE = "quote"
+    MODE_FULL = "full"
+
+    def __init__(self, path: str, speed: float = 0.0):
+        self.path = path
+        self.speed = speed
+
+        self.on_ticks = None
+        self.on_connect = None
+        self.on_close = None
+        self.on_error = None
+
+        self._subscribed: set = set()
+        self._clock: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # KiteTicker-compatible surface
+    def subscribe(self, tokens):
+        self._subscribed.update(tokens)
+        return True
+
+    def set_mode(self, mode, tokens):
+        return True
+
+    def connect(self, threaded: bool = False):
+        if threaded:
+            self._thread = threading.Thread(target=self._run, name="tick-replay", daemon=True)
+            self._thread.start()
+        else:
+            self._run()
+
+    def close(self, code=None, reason=None):
+        self._stop.set()
+
+    def is_connected(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def now(self) -> int:
+        return self._clock if self._clock is not None else int(time.time())
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    # Replay loop
+    def _run(self):
+        if self.on_connect:
+            self.on_connect(self, None)
+
+        delivered = 0
+        prev_ts = None
+        try:
+            for ts, batch in groupby(load_ticks(self.path), key=tick_epoch):
+                if self._stop.is_set():
+                    break
+
+                if self.speed and prev_ts is not None and ts > prev_ts:
+                    time.sleep((ts - prev_ts) / self.speed)
+                prev_ts = ts
+
+                ticks = [
+                    t for t in batch
+                    if not self._subscribed or t["instrument_token"] in self._subscribed
+                ]
+                self._clock = ts
+                if ticks and self.on_ticks:
+                    self.on_ticks(self, ticks)
+                    delivered += len(ticks)
+        except Exception as e:
+            logger.exception("TICK REPLAY FAILED")
+            if self.on_error:
+                self.on_error(self, None, str(e))
+        finally:
+            logger.info(f"TICK REPLAY DONE | {delivered} ticks")
+            if self.on_close:
+                self.on_close(self, 1000, "replay finished")
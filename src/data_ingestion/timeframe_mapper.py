@@ -1,33 +1,49 @@
 # src/data_ingestion/timeframe_mapper.py
 
+import os
+
+# kite_max_days: largest from/to span Kite serves per historical_data call
+
 TIMEFRAMES = {
     "1M": {
         "minutes": 1,
         "db": "1minute",
         "kite": "minute",      # Zerodha uses "minute"
+        "kite_max_days": 60,
     },
     "5M": {
         "minutes": 5,
         "db": "5minute",
         "kite": "5minute",
+        "kite_max_days": 100,
     },
     "10M": {
         "minutes": 10,
         "db": "10minute",
         "kite": "10minute",
+        "kite_max_days": 100,
     },
     "15M": {
         "minutes": 15,
         "db": "15minute",
         "kite": "15minute",
+        "kite_max_days": 200,
     },
     "1D": {
         "minutes": 1440,
         "db": "day",
         "kite": "day",
+        "kite_max_days": 2000,
     },
 }
 
+# Seconds after a bar closes before it is fetched, giving the broker
+# time to finalize it
+BAR_SETTLE_SECONDS = int(os.getenv("BAR_SETTLE_SECONDS", "10"))
+
+# Daily candles are only ingested once this many days old
+DAILY_SETTLE_DAYS = int(os.getenv("DAILY_SETTLE_DAYS", "3"))
+
 # 👇 BACKWARD-COMPAT EXPORT FOR KiteClient
 TIMEFRAME_MAP = {
     tf: meta["kite"]
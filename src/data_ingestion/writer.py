@@ -1,33 +1,20 @@
 # src/data_ingestion/writer.py
 
-import psycopg2.extras
+from data_ingestion.sink import CandleSink
 
 
-def write_candles(conn, symbol, timeframe, df):
-    if df.empty:
-        return
+def write_candles(conn, symbol, timeframe, df, commit=True):
+    """
+    Write one symbol/timeframe frame through the CandleSink.
+    Returns rows inserted or changed.
+    """
+    return CandleSink(conn).write(symbol, timeframe, df, commit=commit)
 
-    rows = [
-        (
-            symbol,
-            timeframe,
-            row.ts,
-            row.open,
-            row.high,
-            row.low,
-            row.close,
-            int(row.volume),
-        )
-        for row in df.itertuples()
-    ]
 
-    query = """
-    INSERT INTO candles
-    (symbol, timeframe, ts, open, high, low, close, volume)
-    VALUES %s
-    ON CONFLICT DO NOTHING
+def write_candle_frame(conn, frame, commit=True, fence=None):
     """
-
-    with conn.cursor() as cur:
-        psycopg2.extras.execute_values(cur, query, rows)
-        conn.commit()
+    Write a multi-series frame (SINK_COLUMNS) in one COPY and commit,
+    optionally fenced by a scheduler lease.
+    Returns rows inserted or changed.
+    """
+    return CandleSink(conn).write_frame(frame, commit=commit, fence=fence)
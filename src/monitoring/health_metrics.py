@@ -1,57 +1,170 @@
-from datetime import datetime, timezone
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from data_ingestion.db import get_db_connection
+from agents.calendar.trading_calendar import IST, TradingCalendar, get_trading_calendar
+from data_ingestion.db import pooled_connection
+from data_ingestion.timeframe_mapper import DAILY_SETTLE_DAYS, TIMEFRAMES
 
 
-# Allowed lag (in minutes) per timeframe
+# Allowed lag (in trading minutes after the last bar closed) per timeframe.
+# Nights, weekends and holidays do not count towards lag.
 ALLOWED_LAG_MINUTES = {
-    "1m": 2,
-    "5m": 7,
-    "15m": 20,
-    "1D": 1440  # daily
+    "1M": 2,
+    "5M": 7,
+    "15M": 20,
+    # Measured against the daily ingestion cutoff (see LAG_CUTOFF): a
+    # bar is fetched once its next day has passed the cutoff, and the
+    # daily job runs once a day, so up to two sessions are expected
+    "1D": 2 * 375 + 15,
 }
+DEFAULT_ALLOWED_LAG_MINUTES = 60
 
+# Ingestion deliberately stays this far behind "now"; lag is measured
+# against the cutoff so a series that is as fresh as ingestion allows
+# is OK
+LAG_CUTOFF = {
+    "1D": timedelta(days=DAILY_SETTLE_DAYS),
+}
 
-def get_last_candle(conn, symbol: str, timeframe: str):
+# One round trip for every requested series; NULL arrays mean "all"
+LAST_TS_SQL = """
+    SELECT w.symbol, w.timeframe, w.last_ts
+    FROM candle_watermarks w
+    WHERE (%(symbols)s::text[] IS NULL OR w.symbol = ANY(%(symbols)s::text[]))
+      AND (%(timeframes)s::text[] IS NULL OR w.timeframe = ANY(%(timeframes)s::text[]))
+"""
+
+
+@dataclass(frozen=True)
+class SeriesHealth:
+    symbol: str
+    timeframe: str
+    last_ts: Optional[datetime]
+    lag_minutes: Optional[float]       # trading time from the last bar close to the cutoff
+    wall_lag_minutes: Optional[float]  # clock time since the last bar closed
+    allowed_minutes: int
+    status: str                        # OK | WARN | NO_DATA
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def get_last_candles(
+    conn,
+    symbols: Optional[Iterable[str]] = None,
+    timeframes: Optional[Iterable[str]] = None,
+) -> Dict[Tuple[str, str], datetime]:
+    """
+    {(symbol, timeframe): last_ts} from candle_watermarks (maintained by
+    CandleSink on every write) in a single query.
+    """
     with conn.cursor() as cur:
         cur.execute(
-            """
-            SELECT MAX(ts) AS last_ts
-            FROM candles
-            WHERE symbol = %s AND timeframe = %s
-            """,
-            (symbol, timeframe)
+            LAST_TS_SQL,
+            {
+                "symbols": list(symbols) if symbols is not None else None,
+                "timeframes": list(timeframes) if timeframes is not None else None,
+            },
+        )
+        return {(r["symbol"], r["timeframe"]): r["last_ts"] for r in cur.fetchall()}
+
+
+def compute_health(
+    last_ts: Dict[Tuple[str, str], datetime],
+    symbols: Optional[Iterable[str]] = None,
+    timeframes: Optional[Iterable[str]] = None,
+    now: Optional[datetime] = None,
+    calendar: Optional[TradingCalendar] = None,
+) -> List[SeriesHealth]:
+    """
+    Health of each series. Without symbols/timeframes, every series in
+    `last_ts` is reported; with them, missing series come back NO_DATA.
+    """
+    now = now or datetime.now(timezone.utc)
+    calendar = calendar or get_trading_calendar()
+
+    if symbols is None and timeframes is None:
+        keys = sorted(last_ts)
+    else:
+        symbols = list(symbols) if symbols is not None else sorted({s for s, _ in last_ts})
+        timeframes = list(timeframes) if timeframes is not None else sorted({t for _, t in last_ts})
+        keys = [(s, tf) for s in symbols for tf in timeframes]
+
+    bar_closes = {}
+    for key in keys:
+        ts = last_ts.get(key)
+        if ts is not None:
+            bar = TIMEFRAMES.get(key[1])
+            bar_closes[key] = ts + timedelta(minutes=bar["minutes"] if bar else 0)
+
+    # Trading lag of every series, one vectorized pass per cutoff
+    trading_lag = {}
+    by_cutoff = {}
+    for key in bar_closes:
+        by_cutoff.setdefault(now - LAG_CUTOFF.get(key[1], timedelta(0)), []).append(key)
+
+    for as_of, group in by_cutoff.items():
+        closes = [bar_closes[k] for k in group]
+        clock = calendar.session_clock(
+            min(closes).astimezone(IST).date(),
+            as_of.astimezone(IST).date(),
         )
-        row = cur.fetchone()
-        return row["last_ts"]
+        seconds = clock.trading_seconds(closes, as_of)
+        trading_lag.update(zip(group, seconds / 60))
 
+    results = []
+    for symbol, tf in keys:
+        allowed = ALLOWED_LAG_MINUTES.get(tf, DEFAULT_ALLOWED_LAG_MINUTES)
+        ts = last_ts.get((symbol, tf))
 
+        if ts is None:
+            results.append(SeriesHealth(symbol, tf, None, None, None, allowed, "NO_DATA"))
+            continue
 
-def check_health(symbols, timeframes):
-    conn = get_db_connection()
+        lag = float(trading_lag[(symbol, tf)])
+        wall = max(0.0, (now - bar_closes[(symbol, tf)]).total_seconds() / 60)
 
-    now = datetime.now(timezone.utc)
+        results.append(SeriesHealth(
+            symbol,
+            tf,
+            ts,
+            round(lag, 2),
+            round(wall, 2),
+            allowed,
+            "OK" if lag <= allowed else "WARN",
+        ))
 
-    print("\nSYMBOL | TF  | LAST_TS | LAG(min) | STATUS")
-    print("-" * 55)
+    return results
 
-    try:
-        for symbol in symbols:
-            for tf in timeframes:
-                last_ts = get_last_candle(conn, symbol, tf)
 
-                if last_ts is None:
-                    print(f"{symbol:6} | {tf:3} | NONE | N/A | ❌ NO DATA")
-                    continue
+def check_health(
+    symbols: Optional[Iterable[str]] = None,
+    timeframes: Optional[Iterable[str]] = None,
+    now: Optional[datetime] = None,
+) -> List[SeriesHealth]:
+    """
+    Trading-time lag of every requested series (all series when both
+    are None) from one watermark query.
+    """
+    symbols = list(symbols) if symbols is not None else None
+    timeframes = list(timeframes) if timeframes is not None else None
 
-                lag_min = int((now - last_ts).total_seconds() / 60)
-                allowed = ALLOWED_LAG_MINUTES.get(tf, 60)
+    with pooled_connection() as conn:
+        last_ts = get_last_candles(conn, symbols, timeframes)
 
-                status = "OK" if lag_min <= allowed else "WARN"
+    return compute_health(last_ts, symbols, timeframes, now=now)
 
-                print(
-                    f"{symbol:6} | {tf:3} | {last_ts} | {lag_min:8} | {status}"
-                )
 
-    finally:
-        conn.close()
+def print_health(results: List[SeriesHealth]):
+    print("\nSYMBOL | TF  | LAST_TS | LAG(min) | STATUS")
+    print("-" * 55)
+
+    for r in results:
+        if r.status == "NO_DATA":
+            print(f"{r.symbol:6} | {r.timeframe:3} | NONE | N/A | ❌ NO DATA")
+            continue
+
+        print(
+            f"{r.symbol:6} | {r.timeframe:3} | {r.last_ts} | {r.lag_minutes:8.1f} | {r.status}"
+        )
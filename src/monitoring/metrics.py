@@ -0,0 +1,176 @@
+# src/monitoring/metrics.py
+"""
+Prometheus metrics for ingestion, governance and the dashboard API.
+
+Counters and histograms are process-local: each process (dashboard,
+scheduler, every ingestion worker) exposes its own. Candle lag gauges
+come from CandleLagCollector, which runs one query per scrape; register
+it in one process only (the dashboard and the scheduler do).
+"""
+
+import logging
+import os
+import threading
+
+from prometheus_client import Counter, Histogram, REGISTRY, start_http_server
+from prometheus_client.core import GaugeMetricFamily
+
+from monitoring.health_metrics import check_health
+
+logger = logging.getLogger(__name__)
+
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+
+# ─────────────────────────────────────────────
+# Kite API
+# ─────────────────────────────────────────────
+KITE_CALLS = Counter(
+    "kite_api_calls_total",
+    "Kite API requests, by endpoint and outcome (ok, throttled, error)",
+    ["endpoint", "outcome"],
+)
+
+KITE_CALL_SECONDS = Histogram(
+    "kite_api_call_seconds",
+    "Kite API request latency",
+    ["endpoint"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+
+RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "kite_rate_limit_wait_seconds",
+    "Time spent waiting on the client-side Kite rate limiter",
+    buckets=(0, 0.05, 0.1, 0.2, 0.4, 1, 2, 5, 10, 30),
+)
+
+# ─────────────────────────────────────────────
+# Candle writes
+# ─────────────────────────────────────────────
+ROWS_STAGED = Counter(
+    "candle_rows_staged_total",
+    "Candle rows sent to the sink",
+)
+
+ROWS_WRITTEN = Counter(
+    "candle_rows_written_total",
+    "Candle rows inserted or changed by the sink",
+)
+
+WRITE_SECONDS = Histogram(
+    "candle_write_seconds",
+    "CandleSink COPY + merge latency",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+# ─────────────────────────────────────────────
+# Scheduler jobs
+# ─────────────────────────────────────────────
+JOB_RUNS = Counter(
+    "scheduler_job_runs_total",
+    "Scheduler job runs, by job and final status",
+    ["job", "status"],
+)
+
+JOB_SECONDS = Histogram(
+    "scheduler_job_duration_seconds",
+    "Scheduler job run duration",
+    ["job"],
+    buckets=(0.5, 1, 2.5, 5, 10, 20, 30, 45, 60, 120, 300, 900),
+)
+
+# ─────────────────────────────────────────────
+# Governance
+# ─────────────────────────────────────────────
+GOVERNANCE_REPORTS = Counter(
+    "data_quality_reports_total",
+    "Data quality reports written, by check type and status",
+    ["check_type", "status"],
+)
+
+# ─────────────────────────────────────────────
+# Vector search / dashboard API
+# ─────────────────────────────────────────────
+FAISS_QUERY_SECONDS = Histogram(
+    "faiss_query_seconds",
+    "FAISS similarity search latency",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+API_REQUEST_SECONDS = Histogram(
+    "dashboard_request_seconds",
+    "Dashboard API request latency",
+    ["method", "route", "status"],
+)
+
+
+# ─────────────────────────────────────────────
+# Candle lag (collected per scrape)
+# ─────────────────────────────────────────────
+class CandleLagCollector:
+    """
+    candle_lag_seconds{symbol, timeframe}: trading seconds since the
+    last committed candle closed, for every series, from one watermark
+    query (see health_metrics.check_health). Flat outside sessions, so
+    alerts do not fire overnight.
+    """
+
+    def collect(self):
+        lag = GaugeMetricFamily(
+            "candle_lag_seconds",
+            "Trading seconds since the last committed candle of each series closed",
+            labels=["symbol", "timeframe"],
+        )
+        allowed = GaugeMetricFamily(
+            "candle_lag_allowed_seconds",
+            "Allowed trading-time lag per timeframe",
+            labels=["timeframe"],
+        )
+        up = GaugeMetricFamily(
+            "candle_lag_collector_up",
+            "1 if the last lag query succeeded",
+        )
+
+        try:
+            results = check_health()
+        except Exception:
+            logger.exception("Candle lag query failed")
+            up.add_metric([], 0)
+            yield up
+            return
+
+        timeframes = {}
+        for r in results:
+            if r.lag_minutes is None:
+                continue
+            lag.add_metric([r.symbol, r.timeframe], r.lag_minutes * 60)
+            timeframes[r.timeframe] = r.allowed_minutes
+
+        for tf, minutes in sorted(timeframes.items()):
+            allowed.add_metric([tf], minutes * 60)
+
+        up.add_metric([], 1)
+        yield lag
+        yield allowed
+        yield up
+
+
+_lag_registered = False
+_lock = threading.Lock()
+
+
+def register_lag_collector(registry=REGISTRY):
+    global _lag_registered
+    with _lock:
+        if not _lag_registered:
+            registry.register(CandleLagCollector())
+            _lag_registered = True
+
+
+def start_metrics_server(port: int = METRICS_PORT, lag: bool = False):
+    """
+    Serve /metrics for a non-HTTP process (scheduler, ingestion worker).
+    """
+    if lag:
+        register_lag_collector()
+    start_http_server(port)
+    logger.info(f"METRICS | serving on :{port}/metrics")
@@ -1,17 +1,17 @@
 # src/scheduler/guards.py
 
-from datetime import datetime, time
+from datetime import datetime, timedelta
 import pytz
 
-IST = pytz.timezone("Asia/Kolkata")
+from agents.calendar.trading_calendar import get_trading_calendar
 
-MARKET_OPEN = time(9, 15)
-MARKET_CLOSE = time(15, 30)
+IST = pytz.timezone("Asia/Kolkata")
 
-def is_market_open(now=None):
+def is_market_open(now=None, grace=timedelta(0), exchange="NSE"):
+    """
+    True during a trading session (holidays and special sessions per
+    the trading calendar), or within `grace` after it closes so the
+    final bar can still be fetched.
+    """
     now = now or datetime.now(IST)
-
-    if now.weekday() >= 5:  # Sat/Sun
-        return False
-
-    return MARKET_OPEN <= now.time() <= MARKET_CLOSE
+    return get_trading_calendar(exchange).is_open(now, grace)
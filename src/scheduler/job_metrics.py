@@ -0,0 +1,184 @@
+# src/scheduler/job_metrics.py
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+import pytz
+from psycopg2.extras import Json
+
+from data_ingestion.db import pooled_connection
+from monitoring.metrics import JOB_RUNS, JOB_SECONDS
+
+logger = logging.getLogger(__name__)
+IST = pytz.timezone("Asia/Kolkata")
+
+INSERT_SQL = """
+    INSERT INTO job_runs (
+        run_ts, finished_at, job_name, timeframe, run_key, replica, status,
+        symbols, symbols_failed, symbols_abandoned, api_calls, gap_refetches,
+        rows_fetched, rows_written, duration_ms, fetch_ms, db_ms, sleep_ms,
+        deadline_hit, per_symbol
+    )
+    VALUES (
+        %(run_ts)s, %(finished_at)s, %(job_name)s, %(timeframe)s, %(run_key)s,
+        %(replica)s, %(status)s, %(symbols)s, %(symbols_failed)s,
+        %(symbols_abandoned)s, %(api_calls)s, %(gap_refetches)s,
+        %(rows_fetched)s, %(rows_written)s, %(duration_ms)s, %(fetch_ms)s,
+        %(db_ms)s, %(sleep_ms)s, %(deadline_hit)s, %(per_symbol)s
+    )
+"""
+
+
+class JobRunMetrics:
+    """
+    Timings and counts for one job run, filled in by job_wrapper and
+    the ingestion cycle and saved as one `job_runs` row.
+
+    Fetches run on a thread pool, so all recording is locked. fetch_ms
+    is the sum across symbols (it can exceed duration_ms when fetches
+    overlap); per_symbol breaks it down.
+    """
+
+    def __init__(self, job_name: str, timeframe: str, run_key: str, replica: str):
+        self.job_name = job_name
+        self.timeframe = timeframe
+        self.run_key = run_key
+        self.replica = replica
+        self.started_at = datetime.now(IST)
+        self.finished_at: Optional[datetime] = None
+        self.duration_sec = 0.0
+        self.status = "running"
+
+        self.symbols = 0
+        self.api_calls = 0
+        self.gap_refetches = 0
+        self.rows_fetched = 0
+        self.rows_written = 0
+        self.fetch_sec = 0.0
+        self.db_sec = 0.0
+        self.sleep_sec = 0.0
+        self.symbols_failed = 0
+        self.symbols_abandoned = 0
+        self.deadline_hit = False
+        self.per_symbol = {}
+
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+
+    # ─────────────────────────────────────────────
+    # Recording
+    # ─────────────────────────────────────────────
+
+    def record_fetch(
+        self,
+        symbol: str,
+        seconds: float,
+        api_calls: int,
+        rows: int,
+        gap_refetches: int,
+        error: Optional[str] = None,
+    ):
+        with self._lock:
+            self.fetch_sec += seconds
+            self.api_calls += api_calls
+            self.rows_fetched += rows
+            self.gap_refetches += gap_refetches
+            if error:
+                self.symbols_failed += 1
+
+            entry = {
+                "fetch_ms": round(seconds * 1000, 1),
+                "api_calls": api_calls,
+                "rows": rows,
+                "gap_refetches": gap_refetches,
+            }
+            if error:
+                entry["error"] = error[:200]
+            # A fetch finishing after its cycle timed out stays abandoned
+            if not self.per_symbol.get(symbol, {}).get("abandoned"):
+                self.per_symbol[symbol] = entry
+
+    def record_abandoned(self, symbols):
+        with self._lock:
+            self.symbols_abandoned += len(symbols)
+            for symbol in symbols:
+                self.per_symbol[symbol] = {"abandoned": True}
+
+    def record_written(self, rows: int):
+        with self._lock:
+            self.rows_written += rows or 0
+
+    @contextmanager
+    def db(self):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.db_sec += time.perf_counter() - t0
+
+    def record_sleep(self, seconds: float):
+        with self._lock:
+            self.sleep_sec += seconds
+
+    def finish(self, status: str = "ok"):
+        self.finished_at = datetime.now(IST)
+        self.duration_sec = time.perf_counter() - self._t0
+        self.status = status
+        JOB_RUNS.labels(self.job_name, status).inc()
+        JOB_SECONDS.labels(self.job_name).observe(self.duration_sec)
+
+    # ─────────────────────────────────────────────
+    # Output
+    # ─────────────────────────────────────────────
+
+    def as_row(self) -> dict:
+        return {
+            "run_ts": self.started_at,
+            "finished_at": self.finished_at,
+            "job_name": self.job_name,
+            "timeframe": self.timeframe,
+            "run_key": self.run_key,
+            "replica": self.replica,
+            "status": self.status,
+            "symbols": self.symbols,
+            "symbols_failed": self.symbols_failed,
+            "symbols_abandoned": self.symbols_abandoned,
+            "api_calls": self.api_calls,
+            "gap_refetches": self.gap_refetches,
+            "rows_fetched": self.rows_fetched,
+            "rows_written": self.rows_written,
+            "duration_ms": round(self.duration_sec * 1000, 1),
+            "fetch_ms": round(self.fetch_sec * 1000, 1),
+            "db_ms": round(self.db_sec * 1000, 1),
+            "sleep_ms": round(self.sleep_sec * 1000, 1),
+            "deadline_hit": self.deadline_hit,
+            "per_symbol": Json(self.per_symbol),
+        }
+
+    def summary(self) -> str:
+        row = self.as_row()
+        return (
+            f"{row['status']} | {row['duration_ms']:.0f}ms | symbols={row['symbols']} "
+            f"(failed {row['symbols_failed']}, abandoned {row['symbols_abandoned']}) | "
+            f"api={row['api_calls']} | gaps={row['gap_refetches']} | "
+            f"rows {row['rows_fetched']}→{row['rows_written']} | "
+            f"fetch={row['fetch_ms']:.0f}ms db={row['db_ms']:.0f}ms sleep={row['sleep_ms']:.0f}ms"
+        )
+
+    def save(self):
+        """
+        Persist the run. Never fails the job: a metrics write error is
+        only logged.
+        """
+        try:
+            with pooled_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(INSERT_SQL, self.as_row())
+                conn.commit()
+        except Exception:
+            logger.exception(f"JOB METRICS NOT SAVED | {self.job_name} | {self.run_key}")
@@ -5,25 +5,29 @@ JOB_REGISTRY = {
         "timeframe": "1d",
         "tier": 1,
         "retention_days": None,
-        "run_type": "EOD"
+        "run_type": "EOD",
+        "misfire_grace_sec": 3600
     },
     "intraday_15m": {
         "timeframe": "15m",
         "tier": 2,
         "retention_days": 365,
-        "run_type": "INTRADAY"
+        "run_type": "INTRADAY",
+        "misfire_grace_sec": 300
     },
     "intraday_5m": {
         "timeframe": "5m",
         "tier": 2,
         "retention_days": 180,
-        "run_type": "INTRADAY"
+        "run_type": "INTRADAY",
+        "misfire_grace_sec": 180
     },
     "intraday_1m": {
         "timeframe": "1m",
         "tier": 3,
         "retention_days": 60,
-        "run_type": "INTRADAY"
+        "run_type": "INTRADAY",
+        "misfire_grace_sec": 30
     }
 }
 
@@ -1,18 +1,39 @@
 import time
 import logging
+from datetime import datetime, timedelta
 from typing import List
 
+import pytz
+
 from data_ingestion.orchestrator import run_ingestion_job
+from scheduler.job_metrics import JobRunMetrics
+from scheduler.job_registry import get_job_config
+from scheduler.leases import (
+    DEFAULT_LEASE_TTL,
+    Lease,
+    LeaseCoordinator,
+    LeaseLost,
+    claim_order,
+    SCHEDULER_SHARDS,
+    run_key_for,
+    shard_lease_key,
+    shard_symbols,
+)
+from scheduler.priority_executor import current_run_time, deadline_exceeded, seconds_left
 
 logger = logging.getLogger(__name__)
+IST = pytz.timezone("Asia/Kolkata")
 
 # ─────────────────────────────────────────────
 # Batching configuration
 # ─────────────────────────────────────────────
-BATCH_SIZE = 3
+# Symbols per ingestion cycle: one watermark query, concurrent fetches
+# and one COPY/commit per batch (see orchestrator.run_ingestion_cycle)
+BATCH_SIZE = 200
 
-# Adaptive throttling params
-MIN_SLEEP = 0.5      # seconds
+# Adaptive throttling params. API calls are already paced by the shared
+# KiteClient rate limiter, so batches only back off after errors.
+MIN_SLEEP = 0.0      # seconds
 MAX_SLEEP = 10.0     # seconds
 SLEEP_STEP = 1.0     # incremental backoff
 RECOVERY_STEP = 0.5  # speed-up on success
@@ -23,28 +44,52 @@ def chunked(lst: List[str], size: int):
         yield lst[i:i + size]
 
 
-def job_wrapper(job_name: str, symbols: List[str]):
-    """
-    Scheduler entry point with:
-    - symbol batching
-    - soft sleep
-    - adaptive throttling
-    """
+def _run_key() -> str:
+    run_time = current_run_time() or datetime.now(IST).replace(second=0, microsecond=0)
+    return run_key_for(run_time)
 
-    logger.info(
-        f"JOB START | {job_name} | symbols={len(symbols)}"
-    )
 
+def _lease_ttl() -> timedelta:
+    # Runs with a deadline hold their lease exactly that long
+    left = seconds_left()
+    if left is None:
+        return DEFAULT_LEASE_TTL
+    return timedelta(seconds=max(left, 1.0))
+
+
+def _run_batches(
+    job_name: str,
+    symbols: List[str],
+    lease: Lease,
+    coordinator: LeaseCoordinator,
+    metrics: JobRunMetrics,
+) -> int:
+    """
+    Returns the number of batches that failed.
+    """
     current_sleep = MIN_SLEEP
     error_streak = 0
+    failed = 0
 
     for batch_no, batch in enumerate(chunked(symbols, BATCH_SIZE), start=1):
+        if deadline_exceeded():
+            dropped = len(symbols) - (batch_no - 1) * BATCH_SIZE
+            logger.warning(
+                f"JOB DEADLINE | {job_name} | dropping {dropped} symbols"
+            )
+            metrics.deadline_hit = True
+            break
+
+        # Long runs keep their lease alive; losing it stops the run
+        if batch_no > 1 and not coordinator.renew(lease, _lease_ttl()):
+            raise LeaseLost(f"{lease.key} token {lease.token} superseded")
+
         logger.info(
             f"JOB {job_name} | batch {batch_no} | sleep={current_sleep:.1f}s | {batch}"
         )
 
         try:
-            run_ingestion_job(job_name, batch)
+            run_ingestion_job(job_name, batch, fence=lease, metrics=metrics)
 
             # ✅ Success → recover slowly
             error_streak = 0
@@ -53,8 +98,12 @@ def job_wrapper(job_name: str, symbols: List[str]):
                 current_sleep - RECOVERY_STEP
             )
 
+        except LeaseLost:
+            raise
+
         except Exception as e:
             error_streak += 1
+            failed += 1
 
             logger.exception(
                 f"JOB ERROR | {job_name} | batch={batch} | streak={error_streak}"
@@ -66,10 +115,98 @@ def job_wrapper(job_name: str, symbols: List[str]):
                 current_sleep + SLEEP_STEP * error_streak
             )
 
-        # Soft sleep between batches
-        if batch_no * BATCH_SIZE < len(symbols):
-            time.sleep(current_sleep)
+        # Backoff between batches, never past the run's deadline
+        if current_sleep and batch_no * BATCH_SIZE < len(symbols):
+            left = seconds_left()
+            pause = current_sleep if left is None else max(0.0, min(current_sleep, left))
+            time.sleep(pause)
+            metrics.record_sleep(pause)
+
+    return failed
+
+
+def job_wrapper(job_name: str, symbols: List[str], shard_count: int = SCHEDULER_SHARDS):
+    """
+    Scheduler entry point with:
+    - per-shard leases: replicas firing the same run split the symbol
+      shards between them, and writes are fenced by the lease token
+    - symbol batching
+    - adaptive throttling (backoff after errors)
+    - deadline: when run by PriorityThreadPoolExecutor, batches left
+      once the run's deadline passes are dropped (the next run picks
+      those symbols up from their watermark)
+    - per-run metrics saved to `job_runs` (see job_metrics)
+
+    Leases are keyed by shard id alone, so callers that split the
+    universe themselves hand out whole shards of the same
+    `shard_count` (see scheduler.worker): any two processes running a
+    shard then contend for, and are fenced by, the same lease.
+    """
+
+    coordinator = LeaseCoordinator()
+    run_key = _run_key()
+    shards = shard_symbols(symbols, shard_count)
+    metrics = JobRunMetrics(
+        job_name, get_job_config(job_name)["timeframe"], run_key, coordinator.owner
+    )
+    status = "ok"
+
+    logger.info(
+        f"JOB START | {job_name} | symbols={len(symbols)} | "
+        f"shards={len(shards)} | run={run_key} | replica={coordinator.owner}"
+    )
+
+    for shard in claim_order(list(shards), coordinator.owner):
+        if deadline_exceeded():
+            logger.warning(f"JOB DEADLINE | {job_name} | shard {shard} not started")
+            metrics.deadline_hit = True
+            break
+
+        lease = coordinator.acquire(
+            shard_lease_key(job_name, shard, shard_count), run_key, _lease_ttl()
+        )
+        if lease is None:
+            logger.info(f"JOB {job_name} | shard {shard} | held by another replica")
+            continue
+
+        metrics.symbols += len(shards[shard])
+        try:
+            if _run_batches(job_name, shards[shard], lease, coordinator, metrics):
+                status = "error"
+        except LeaseLost:
+            logger.warning(
+                f"JOB LEASE LOST | {job_name} | shard {shard} | token {lease.token}"
+            )
+            status = "lease_lost"
+            continue
+
+        coordinator.complete(lease)
+
+    if status == "ok" and metrics.deadline_hit:
+        status = "deadline"
+    metrics.finish(status)
 
     logger.info(
-        f"JOB END | {job_name}"
+        f"JOB END | {job_name} | {metrics.summary()}"
     )
+
+    # Runs where every shard was held elsewhere did no work here
+    if metrics.symbols:
+        metrics.save()
+
+
+def run_exclusive(job_name: str, fn, *args):
+    """
+    Run a non-sharded job (reconciliation, archival) on exactly one
+    replica per scheduled run.
+    """
+    coordinator = LeaseCoordinator()
+    lease = coordinator.acquire(job_name, _run_key(), _lease_ttl())
+    if lease is None:
+        logger.info(f"JOB {job_name} | held by another replica")
+        return
+
+    try:
+        return fn(*args)
+    finally:
+        coordinator.complete(lease)
@@ -0,0 +1,175 @@
+# src/scheduler/leases.py
+
+import logging
+import os
+import socket
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from data_ingestion.db import pooled_connection
+
+logger = logging.getLogger(__name__)
+
+# Symbol shards per job. Replicas claim shards one at a time, so with
+# N replicas each run's universe is split between them; 1 = failover only.
+SCHEDULER_SHARDS = int(os.getenv("SCHEDULER_SHARDS", "1"))
+
+DEFAULT_LEASE_TTL = timedelta(minutes=15)
+
+# Claim a lease for `run_key` if:
+#   - nobody holds it yet, or
+#   - the previous run is done (or its holder's lease expired), or
+#   - this same run's holder died (expired, not done) → take over
+ACQUIRE_SQL = """
+    INSERT INTO scheduler_leases
+        (lease_key, run_key, owner, token, expires_at, done, acquired_at)
+    VALUES (%(key)s, %(run_key)s, %(owner)s, 1, NOW() + %(ttl)s, FALSE, NOW())
+    ON CONFLICT (lease_key) DO UPDATE
+    SET run_key = EXCLUDED.run_key,
+        owner = EXCLUDED.owner,
+        token = scheduler_leases.token + 1,
+        expires_at = EXCLUDED.expires_at,
+        done = FALSE,
+        acquired_at = NOW()
+    WHERE (scheduler_leases.run_key < EXCLUDED.run_key
+           AND (scheduler_leases.done OR scheduler_leases.expires_at < NOW()))
+       OR (scheduler_leases.run_key = EXCLUDED.run_key
+           AND NOT scheduler_leases.done
+           AND scheduler_leases.expires_at < NOW())
+    RETURNING token
+"""
+
+# Holds a share lock on the lease row until the caller's transaction
+# ends, so a takeover (which bumps the token) cannot interleave with it
+FENCE_SQL = """
+    SELECT 1
+    FROM scheduler_leases
+    WHERE lease_key = %s
+      AND token = %s
+    FOR SHARE
+"""
+
+
+class LeaseLost(Exception):
+    """
+    The lease was taken over by another replica (fencing token moved).
+    """
+
+
+def replica_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+@dataclass(frozen=True)
+class Lease:
+    key: str
+    run_key: str
+    owner: str
+    token: int
+
+    def check(self, cur):
+        """
+        Fence a write: call inside the writing transaction. Raises
+        LeaseLost if another replica has since claimed this lease.
+        """
+        cur.execute(FENCE_SQL, (self.key, self.token))
+        if cur.fetchone() is None:
+            raise LeaseLost(f"{self.key} token {self.token} superseded")
+
+
+class LeaseCoordinator:
+    """
+    Postgres lease table coordinating active-active scheduler replicas.
+
+    Every replica fires every job; per (job, shard) only one replica
+    wins each run. Each claim bumps a fencing token that writers check
+    in their own transaction, so a replica that stalls past its TTL and
+    is taken over cannot commit afterwards.
+    """
+
+    def __init__(self, owner: Optional[str] = None):
+        self.owner = owner or replica_id()
+
+    def _execute(self, sql: str, params):
+        with pooled_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                row = cur.fetchone() if cur.description else None
+            conn.commit()
+            return row
+
+    def acquire(self, key: str, run_key: str, ttl: timedelta = DEFAULT_LEASE_TTL) -> Optional[Lease]:
+        row = self._execute(
+            ACQUIRE_SQL,
+            {"key": key, "run_key": run_key, "owner": self.owner, "ttl": ttl},
+        )
+        if row is None:
+            return None
+        return Lease(key, run_key, self.owner, row["token"])
+
+    def renew(self, lease: Lease, ttl: timedelta = DEFAULT_LEASE_TTL) -> bool:
+        row = self._execute(
+            """
+            UPDATE scheduler_leases
+            SET expires_at = NOW() + %s
+            WHERE lease_key = %s AND token = %s AND NOT done
+            RETURNING token
+            """,
+            (ttl, lease.key, lease.token),
+        )
+        return row is not None
+
+    def complete(self, lease: Lease):
+        """
+        Mark the run done; later runs can claim immediately, while
+        other replicas firing for the same run skip it.
+        """
+        self._execute(
+            """
+            UPDATE scheduler_leases
+            SET done = TRUE, expires_at = NOW()
+            WHERE lease_key = %s AND token = %s
+            """,
+            (lease.key, lease.token),
+        )
+
+
+def shard_of(symbol: str, shards: int = SCHEDULER_SHARDS) -> int:
+    # Stable across processes (unlike hash())
+    return zlib.crc32(symbol.encode()) % shards
+
+
+def shard_symbols(symbols: List[str], shards: int = SCHEDULER_SHARDS) -> Dict[int, List[str]]:
+    out: Dict[int, List[str]] = {}
+    for symbol in symbols:
+        out.setdefault(shard_of(symbol, shards), []).append(symbol)
+    return out
+
+
+def shard_lease_key(job_name: str, shard: int, shards: int = SCHEDULER_SHARDS) -> str:
+    # A shard id names the same symbols only under the same shard count
+    if shards == SCHEDULER_SHARDS:
+        return f"{job_name}:{shard}"
+    return f"{job_name}:{shard}/{shards}"
+
+
+def claim_order(shards: List[int], owner: str) -> List[int]:
+    """
+    Replica-specific rotation of shard ids, so replicas firing together
+    start on different shards instead of racing for the same one.
+    """
+    shards = sorted(shards)
+    if not shards:
+        return shards
+    start = zlib.crc32(owner.encode()) % len(shards)
+    return shards[start:] + shards[:start]
+
+
+def run_key_for(run_time: datetime) -> str:
+    """
+    Lease run key of a scheduled run: sortable, shared by replicas
+    firing for the same scheduled time.
+    """
+    return run_time.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
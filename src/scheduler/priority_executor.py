@@ -0,0 +1,169 @@
+# src/scheduler/priority_executor.py
+
+import heapq
+import itertools
+import logging
+import sys
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from apscheduler.events import EVENT_JOB_MISSED, JobExecutionEvent
+from apscheduler.executors.base import BaseExecutor, run_job
+
+from data_ingestion.clients.kite_client import KiteClient
+
+logger = logging.getLogger(__name__)
+
+# Lower runs first. Unlisted jobs get DEFAULT_PRIORITY.
+JOB_PRIORITIES = {
+    "intraday_1m": 0,
+    "intraday_5m": 1,
+    "intraday_15m": 2,
+    "eod_reconciliation": 5,
+    "daily_eod": 6,
+    "candle_archival": 9,
+}
+DEFAULT_PRIORITY = 5
+
+# A run not finished by scheduled time + deadline is dropped / cut short.
+# Slightly under each job's period so the next run never stacks behind it.
+JOB_DEADLINES = {
+    "intraday_1m": timedelta(seconds=55),
+    "intraday_5m": timedelta(minutes=4, seconds=30),
+    "intraday_15m": timedelta(minutes=14),
+}
+
+# Every ingestion job funnels through one rate-limited KiteClient, so
+# more concurrent jobs than API calls/second only adds queueing.
+MAX_CONCURRENT_JOBS = max(2, round(1 / KiteClient._MIN_CALL_INTERVAL_SEC))
+
+
+# ─────────────────────────────────────────────
+# Per-run deadline (read by job code)
+# ─────────────────────────────────────────────
+
+_local = threading.local()
+
+
+def current_deadline() -> Optional[datetime]:
+    return getattr(_local, "deadline", None)
+
+
+def current_run_time() -> Optional[datetime]:
+    """
+    Scheduled fire time of the run executing on this thread.
+    """
+    return getattr(_local, "run_time", None)
+
+
+def deadline_exceeded(now: Optional[datetime] = None) -> bool:
+    deadline = current_deadline()
+    if deadline is None:
+        return False
+    now = now or datetime.now(deadline.tzinfo)
+    return now >= deadline
+
+
+def seconds_left(now: Optional[datetime] = None) -> Optional[float]:
+    deadline = current_deadline()
+    if deadline is None:
+        return None
+    now = now or datetime.now(deadline.tzinfo)
+    return (deadline - now).total_seconds()
+
+
+# ─────────────────────────────────────────────
+# Executor
+# ─────────────────────────────────────────────
+
+class PriorityThreadPoolExecutor(BaseExecutor):
+    """
+    APScheduler executor with a priority queue in front of a fixed
+    worker pool.
+
+    - Jobs are started in (priority, submit order): 1M freshness runs
+      ahead of 15M, and everything runs ahead of EOD/archival.
+    - `max_workers` is the global concurrency cap.
+    - Runs still queued past their deadline are dropped (reported as
+      EVENT_JOB_MISSED); running jobs see the deadline via
+      current_deadline()/deadline_exceeded() and stop early.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_CONCURRENT_JOBS,
+        priorities: Optional[Dict[str, int]] = None,
+        deadlines: Optional[Dict[str, timedelta]] = None,
+    ):
+        super().__init__()
+        self.max_workers = max_workers
+        self.priorities = priorities if priorities is not None else JOB_PRIORITIES
+        self.deadlines = deadlines if deadlines is not None else JOB_DEADLINES
+
+        self._queue = []
+        self._seq = itertools.count()
+        self._cv = threading.Condition()
+        self._shutdown = False
+        self._workers = []
+
+    def start(self, scheduler, alias):
+        super().start(scheduler, alias)
+        self._shutdown = False
+        self._workers = [
+            threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+            for i in range(self.max_workers)
+        ]
+        for t in self._workers:
+            t.start()
+
+    def shutdown(self, wait=True):
+        with self._cv:
+            self._shutdown = True
+            self._cv.notify_all()
+        if wait:
+            for t in self._workers:
+                t.join()
+
+    def _do_submit_job(self, job, run_times):
+        priority = self.priorities.get(job.id, DEFAULT_PRIORITY)
+        window = self.deadlines.get(job.id)
+        deadline = run_times[-1] + window if window else None
+
+        with self._cv:
+            heapq.heappush(
+                self._queue,
+                (priority, next(self._seq), job, run_times, deadline),
+            )
+            self._cv.notify()
+
+    def _work(self):
+        while True:
+            with self._cv:
+                while not self._queue and not self._shutdown:
+                    self._cv.wait()
+                if self._shutdown:
+                    return
+                priority, _, job, run_times, deadline = heapq.heappop(self._queue)
+
+            if deadline is not None and datetime.now(deadline.tzinfo) >= deadline:
+                self._logger.warning(
+                    f"JOB DROPPED | {job.id} | deadline {deadline:%H:%M:%S} passed in queue"
+                )
+                self._run_job_success(job.id, [
+                    JobExecutionEvent(EVENT_JOB_MISSED, job.id, job._jobstore_alias, run_time)
+                    for run_time in run_times
+                ])
+                continue
+
+            _local.deadline = deadline
+            _local.run_time = run_times[-1]
+            try:
+                events = run_job(job, job._jobstore_alias, run_times, self._logger.name)
+            except BaseException:
+                self._run_job_error(job.id, *sys.exc_info()[1:])
+            else:
+                self._run_job_success(job.id, events)
+            finally:
+                _local.deadline = None
+                _local.run_time = None
@@ -1,20 +1,39 @@
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from scheduler.job_runner import job_wrapper
+from scheduler.job_runner import job_wrapper, run_exclusive
 from data_ingestion.eod_reconciliation import run_eod_reconciliation
+from data_ingestion.archive import run_archival
 from agents.data_quality.data_completeness_agent import DataCompletenessAgent
 from data_ingestion.db import get_db_connection
+from scheduler.priority_executor import PriorityThreadPoolExecutor
+from scheduler.triggers import TradingSessionTrigger
+from scheduler.universe import load_universe
+from monitoring.metrics import start_metrics_server
 
 
-scheduler = BlockingScheduler(timezone="Asia/Kolkata")
+# Jobs share one worker pool (capped to the Kite rate limit) and start
+# in priority order: 1M → 5M → 15M → reconciliation/EOD → archival.
+# Priorities and deadlines are keyed by job id (see priority_executor).
+scheduler = BlockingScheduler(
+    timezone="Asia/Kolkata",
+    executors={"default": PriorityThreadPoolExecutor()},
+)
 
-SYMBOLS = ["RELIANCE", "INFY", "TCS"]
+SYMBOLS = load_universe()
 
 
 def start():
     print("✅ Scheduler started. Waiting for jobs...")
 
+    # Safe to run on several replicas: every run is coordinated through
+    # scheduler_leases (see scheduler.leases), so each symbol shard or
+    # exclusive job runs on one replica per scheduled time.
+
+    # Intraday jobs fire at each bar close (+ settle delay) of every
+    # trading session, holidays and special sessions included, and
+    # never outside market hours.
+
     # ─────────────────────────────────────────────
     # Daily EOD (low priority, once per day)
     # ─────────────────────────────────────────────
@@ -34,7 +53,7 @@ def start():
     # ─────────────────────────────────────────────
     scheduler.add_job(
         job_wrapper,
-        CronTrigger(minute="*/15"),
+        TradingSessionTrigger(bar_minutes=15),
         args=["intraday_15m", SYMBOLS],
         id="intraday_15m",
         max_instances=1,
@@ -48,7 +67,7 @@ def start():
     # ─────────────────────────────────────────────
     scheduler.add_job(
         job_wrapper,
-        CronTrigger(minute="*/5"),
+        TradingSessionTrigger(bar_minutes=5),
         args=["intraday_5m", SYMBOLS],
         id="intraday_5m",
         max_instances=1,
@@ -62,7 +81,7 @@ def start():
     # ─────────────────────────────────────────────
     scheduler.add_job(
         job_wrapper,
-        CronTrigger(minute="*/1"),
+        TradingSessionTrigger(bar_minutes=1),
         args=["intraday_1m", SYMBOLS],
         id="intraday_1m",
         max_instances=1,          # ❗ no overlap
@@ -75,9 +94,9 @@ def start():
     # End-of-day intraday reconciliation
     # ─────────────────────────────────────────────
     scheduler.add_job(
-        run_eod_reconciliation,
+        run_exclusive,
         CronTrigger(hour=18, minute=0),
-        args=[SYMBOLS],
+        args=["eod_reconciliation", run_eod_reconciliation, SYMBOLS],
         id="eod_reconciliation",
         max_instances=1,
         coalesce=True,
@@ -85,6 +104,22 @@ def start():
         replace_existing=True,
     )
 
+    # ─────────────────────────────────────────────
+    # Retention: age out old candles to Parquet archive
+    # ─────────────────────────────────────────────
+    scheduler.add_job(
+        run_exclusive,
+        CronTrigger(hour=20, minute=0),
+        args=["candle_archival", run_archival],
+        id="candle_archival",
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=3600,
+        replace_existing=True,
+    )
+
+    # /metrics, including candle lag for every series
+    start_metrics_server(lag=True)
 
     scheduler.start()
 
@@ -0,0 +1,98 @@
+# src/scheduler/triggers.py
+
+from datetime import date, datetime, timedelta
+from typing import Iterator, Optional
+
+import pytz
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.cron import CronTrigger
+
+from agents.calendar.trading_calendar import TradingCalendar, get_trading_calendar
+from data_ingestion.timeframe_mapper import BAR_SETTLE_SECONDS, TIMEFRAMES
+from scheduler.job_registry import get_job_config
+
+IST = pytz.timezone("Asia/Kolkata")
+
+
+class TradingSessionTrigger(BaseTrigger):
+    """
+    Fires at every bar close of every trading session, plus a settle
+    delay, and never outside sessions.
+
+    Sessions come from the TradingCalendar: the regular session on
+    trading days, and special sessions (e.g. Muhurat trading) on the
+    dates they are held. Bars are aligned to each session's open; a
+    session that is not a whole number of bars fires once more at its
+    close. With `bar_minutes=None` it fires once per session, at close.
+    """
+
+    __slots__ = ("bar", "settle", "exchange", "horizon_days", "_calendar")
+
+    def __init__(
+        self,
+        bar_minutes: Optional[int],
+        settle_seconds: int = BAR_SETTLE_SECONDS,
+        exchange: str = "NSE",
+        calendar: Optional[TradingCalendar] = None,
+        horizon_days: int = 30,
+    ):
+        self.bar = timedelta(minutes=bar_minutes) if bar_minutes else None
+        self.settle = timedelta(seconds=settle_seconds)
+        self.exchange = exchange
+        self.horizon_days = horizon_days
+        self._calendar = calendar
+
+    @property
+    def calendar(self) -> TradingCalendar:
+        return self._calendar or get_trading_calendar(self.exchange)
+
+    def _bar_closes(self, d: date) -> Iterator[datetime]:
+        for open_, close in self.calendar.sessions(d):
+            if self.bar:
+                t = open_ + self.bar
+                while t < close:
+                    yield t
+                    t += self.bar
+            yield close
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        # Same convention as CronTrigger: strictly after the previous fire
+        if previous_fire_time:
+            threshold = min(now, previous_fire_time + timedelta(microseconds=1))
+            if threshold == previous_fire_time:
+                threshold += timedelta(microseconds=1)
+        else:
+            threshold = now
+        threshold = threshold.astimezone(IST)
+
+        # Start a day early in case the settle delay crosses midnight
+        d = threshold.date() - timedelta(days=1)
+        for _ in range(self.horizon_days + 1):
+            for bar_close in self._bar_closes(d):
+                fire = bar_close + self.settle
+                if fire >= threshold:
+                    return fire
+            d += timedelta(days=1)
+
+        return None
+
+    def __str__(self):
+        bar = f"{int(self.bar.total_seconds() // 60)}m" if self.bar else "session"
+        return f"trading_session[{self.exchange}, {bar}, +{int(self.settle.total_seconds())}s]"
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} (exchange='{self.exchange}', "
+            f"bar={self.bar}, settle={self.settle})>"
+        )
+
+
+def ingestion_trigger(job_name: str) -> BaseTrigger:
+    """
+    Trigger for a JOB_REGISTRY ingestion job: intraday jobs at bar
+    close, EOD once a day after the close.
+    """
+    job = get_job_config(job_name)
+    if job["run_type"] == "INTRADAY":
+        return TradingSessionTrigger(bar_minutes=TIMEFRAMES[job["timeframe"]]["minutes"])
+    return CronTrigger(hour=18, minute=0, timezone=IST)
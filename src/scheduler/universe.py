@@ -0,0 +1,174 @@
+# src/scheduler/universe.py
+
+import bisect
+import hashlib
+import logging
+import math
+import os
+import socket
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import yaml
+
+from data_ingestion.db import pooled_connection
+
+logger = logging.getLogger(__name__)
+
+# Path to a symbols YAML, or "instruments" for every NSE equity in the
+# Kite instruments parquet
+SYMBOL_UNIVERSE = os.getenv("SYMBOL_UNIVERSE", "config/symbols.yaml")
+
+# Virtual nodes per worker: smooths shard sizes on small worker counts
+RING_VNODES = 128
+
+# Bounded-load cap: no node is assigned more than this times its fair
+# share of keys
+RING_LOAD_FACTOR = 1.05
+
+HEARTBEAT_TTL = timedelta(seconds=30)
+
+
+# ─────────────────────────────────────────────
+# Universe
+# ─────────────────────────────────────────────
+
+def load_universe(source: str = SYMBOL_UNIVERSE, groups: Sequence[str] = ("equities",)) -> List[str]:
+    """
+    Symbols to ingest, from config/symbols.yaml (the given groups) or
+    from the instruments parquet.
+    """
+    if source == "instruments":
+        from data_ingestion.instruments import load_instruments
+
+        df = load_instruments()
+        eq = df[(df["exchange"] == "NSE") & (df["instrument_type"] == "EQ")]
+        return sorted(eq["tradingsymbol"].astype(str).unique())
+
+    with open(source) as f:
+        cfg = yaml.safe_load(f) or {}
+
+    symbols = []
+    for group in groups:
+        for entry in cfg.get(group) or []:
+            if entry["symbol"] not in symbols:
+                symbols.append(entry["symbol"])
+    return symbols
+
+
+# ─────────────────────────────────────────────
+# Consistent hashing
+# ─────────────────────────────────────────────
+
+def _hash(key: str) -> int:
+    return int(hashlib.md5(key.encode()).hexdigest()[:16], 16)
+
+
+class HashRing:
+    """
+    Consistent-hash ring of worker ids. Adding or removing a worker
+    moves only ~1/N of the keys.
+
+    With a load factor, assignment uses consistent hashing with bounded
+    loads: a key whose node is full moves on clockwise to the next node
+    with room, so no node exceeds ceil(load_factor * keys / nodes).
+    """
+
+    def __init__(self, nodes: Iterable[str], vnodes: int = RING_VNODES):
+        points = sorted(
+            (_hash(f"{node}#{i}"), node)
+            for node in set(nodes)
+            for i in range(vnodes)
+        )
+        self._keys = [p for p, _ in points]
+        self._nodes = [n for _, n in points]
+
+    def __len__(self):
+        return len(set(self._nodes))
+
+    def node_for(self, key: str) -> str:
+        if not self._keys:
+            raise ValueError("Hash ring has no nodes")
+        i = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._nodes[i]
+
+    def assign(self, keys: Iterable[str], load_factor: Optional[float] = None) -> Dict[str, List[str]]:
+        if load_factor is None:
+            out = defaultdict(list)
+            for key in keys:
+                out[self.node_for(key)].append(key)
+            return dict(out)
+
+        if not self._keys:
+            raise ValueError("Hash ring has no nodes")
+
+        # Same order on every caller, so every node computes the same map
+        keys = sorted(keys, key=lambda k: (_hash(k), k))
+        capacity = math.ceil(load_factor * len(keys) / len(self))
+
+        out = defaultdict(list)
+        for key in keys:
+            i = bisect.bisect(self._keys, _hash(key))
+            for step in range(len(self._keys)):
+                node = self._nodes[(i + step) % len(self._keys)]
+                if len(out[node]) < capacity:
+                    out[node].append(key)
+                    break
+        return dict(out)
+
+
+# ─────────────────────────────────────────────
+# Worker membership
+# ─────────────────────────────────────────────
+
+class WorkerRegistry:
+    """
+    Heartbeat table of live ingestion workers. A worker missing
+    heartbeats for HEARTBEAT_TTL drops out of the ring, and its
+    symbols move to the survivors on their next refresh.
+    """
+
+    def __init__(self, ttl: timedelta = HEARTBEAT_TTL):
+        self.ttl = ttl
+
+    def heartbeat(self, worker_id: str):
+        with pooled_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO ingestion_workers (worker_id, host, pid, started_at, heartbeat_at)
+                    VALUES (%s, %s, %s, NOW(), NOW())
+                    ON CONFLICT (worker_id) DO UPDATE
+                    SET host = EXCLUDED.host,
+                        pid = EXCLUDED.pid,
+                        heartbeat_at = NOW()
+                    """,
+                    (worker_id, socket.gethostname(), os.getpid()),
+                )
+            conn.commit()
+
+    def live_workers(self) -> List[str]:
+        with pooled_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT worker_id
+                    FROM ingestion_workers
+                    WHERE heartbeat_at > NOW() - %s
+                    ORDER BY worker_id
+                    """,
+                    (self.ttl,),
+                )
+                rows = cur.fetchall()
+            conn.commit()
+        return [r["worker_id"] for r in rows]
+
+    def deregister(self, worker_id: str):
+        with pooled_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM ingestion_workers WHERE worker_id = %s",
+                    (worker_id,),
+                )
+            conn.commit()
@@ -0,0 +1,227 @@
+# src/scheduler/worker.py
+"""
+Sharded ingestion workers.
+
+Each worker process heartbeats into `ingestion_workers`, places the
+live workers on a consistent-hash ring and ingests only the symbol
+shards the ring assigns it, on its own scheduler and connection pool.
+When a worker stops heartbeating the survivors pick up its shards on
+their next refresh.
+
+Usage:
+    PYTHONPATH=src python -m scheduler.worker --processes 4
+    PYTHONPATH=src python -m scheduler.worker --worker-id node2:w0 --metrics-port 9110
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from typing import List, Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from data_ingestion.db import close_connection_pool, init_connection_pool
+from monitoring.metrics import METRICS_PORT, start_metrics_server
+from scheduler.job_registry import JOB_REGISTRY, get_job_config
+from scheduler.job_runner import job_wrapper
+from scheduler.leases import shard_symbols
+from scheduler.priority_executor import MAX_CONCURRENT_JOBS, PriorityThreadPoolExecutor
+from scheduler.triggers import ingestion_trigger
+from scheduler.universe import RING_LOAD_FACTOR, HashRing, WorkerRegistry, load_universe
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SEC = 10
+
+# Connections per worker: one per concurrent job, plus heartbeat/leases
+DEFAULT_POOL_SIZE = MAX_CONCURRENT_JOBS + 2
+
+# Fixed symbol shards spread over the ring. Shard leases follow the
+# shard, not the worker, so two workers that both think they own a
+# shard mid-rebalance contend for one lease and its writes are fenced.
+# Many more shards than workers keeps per-worker symbol counts even.
+WORKER_SHARDS = int(os.getenv("WORKER_SHARDS", "1024"))
+
+
+class IngestionWorker:
+    def __init__(
+        self,
+        worker_id: str,
+        universe: Optional[List[str]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        heartbeat_sec: float = HEARTBEAT_SEC,
+        shard_count: int = WORKER_SHARDS,
+    ):
+        self.worker_id = worker_id
+        self.universe = universe if universe is not None else load_universe()
+        self.pool_size = pool_size
+        self.heartbeat_sec = heartbeat_sec
+        self.shard_count = shard_count
+        self.shards = shard_symbols(self.universe, shard_count)
+        self.registry = WorkerRegistry()
+
+        self._symbols: List[str] = []
+        self._peers: List[str] = []
+        self._lock = threading.Lock()
+
+    def symbols(self) -> List[str]:
+        with self._lock:
+            return list(self._symbols)
+
+    def refresh(self):
+        """
+        Heartbeat, then recompute this worker's shards from the live set.
+        """
+        self.registry.heartbeat(self.worker_id)
+        peers = self.registry.live_workers()
+        if self.worker_id not in peers:
+            peers.append(self.worker_id)
+
+        owned = (
+            HashRing(peers)
+            .assign((str(s) for s in self.shards), RING_LOAD_FACTOR)
+            .get(self.worker_id, [])
+        )
+        shard = [
+            symbol
+            for s in sorted(int(s) for s in owned)
+            for symbol in self.shards[s]
+        ]
+
+        with self._lock:
+            changed = peers != self._peers or shard != self._symbols
+            self._peers = peers
+            self._symbols = shard
+
+        if changed:
+            logger.info(
+                f"REBALANCE | {self.worker_id} | workers={len(peers)} | "
+                f"shards={len(owned)}/{len(self.shards)} | "
+                f"symbols={len(shard)}/{len(self.universe)}"
+            )
+
+    def _run_job(self, job_name: str):
+        symbols = self.symbols()
+        if not symbols:
+            logger.info(f"JOB {job_name} | {self.worker_id} | no symbols assigned")
+            return
+        job_wrapper(job_name, symbols, shard_count=self.shard_count)
+
+    def run(self, stop: Optional[threading.Event] = None):
+        stop = stop or threading.Event()
+        init_connection_pool(maxconn=self.pool_size)
+
+        scheduler = BackgroundScheduler(
+            timezone="Asia/Kolkata",
+            executors={"default": PriorityThreadPoolExecutor()},
+        )
+        try:
+            self.refresh()
+
+            for job_name in JOB_REGISTRY:
+                scheduler.add_job(
+                    self._run_job,
+                    ingestion_trigger(job_name),
+                    args=[job_name],
+                    id=job_name,
+                    max_instances=1,
+                    coalesce=True,
+                    misfire_grace_time=get_job_config(job_name)["misfire_grace_sec"],
+                    replace_existing=True,
+                )
+            scheduler.start()
+            logger.info(f"WORKER START | {self.worker_id}")
+
+            while not stop.wait(self.heartbeat_sec):
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception(f"WORKER HEARTBEAT FAILED | {self.worker_id}")
+        finally:
+            if scheduler.running:
+                scheduler.shutdown(wait=True)
+            try:
+                self.registry.deregister(self.worker_id)
+            finally:
+                close_connection_pool()
+            logger.info(f"WORKER STOP | {self.worker_id}")
+
+
+def _run_worker(worker_id: str, universe: List[str], metrics_port: Optional[int] = None):
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(processName)s | %(message)s",
+    )
+    if metrics_port:
+        start_metrics_server(metrics_port)
+    try:
+        IngestionWorker(worker_id, universe).run()
+    except KeyboardInterrupt:
+        pass
+
+
+def supervise(processes: int, universe: List[str], restart_delay: float = 5.0):
+    """
+    Run `processes` local workers with stable ids (host:w0…), restarting
+    any that exit. While one is down its symbols are served by the others.
+    Worker i serves Prometheus metrics on METRICS_PORT + 1 + i.
+    """
+    host = socket.gethostname()
+    ctx = multiprocessing.get_context("spawn")
+    procs = {}
+
+    def spawn(i: int):
+        worker_id = f"{host}:w{i}"
+        p = ctx.Process(
+            target=_run_worker,
+            args=(worker_id, universe, METRICS_PORT + 1 + i),
+            name=worker_id,
+        )
+        p.start()
+        procs[i] = p
+
+    for i in range(processes):
+        spawn(i)
+
+    try:
+        while True:
+            time.sleep(restart_delay)
+            for i, p in list(procs.items()):
+                if not p.is_alive():
+                    logger.warning(f"WORKER EXITED | {p.name} | code={p.exitcode} | restarting")
+                    spawn(i)
+    except KeyboardInterrupt:
+        for p in procs.values():
+            p.join()
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(message)s",
+    )
+
+    parser = argparse.ArgumentParser(description="Sharded ingestion workers")
+    parser.add_argument("--processes", type=int, default=1, help="Local worker processes")
+    parser.add_argument("--worker-id", help="Run a single worker with this id")
+    parser.add_argument("--universe", help="symbols YAML path, or 'instruments'")
+    parser.add_argument("--metrics-port", type=int, help="Serve /metrics here (single worker)")
+    args = parser.parse_args()
+
+    universe = load_universe(args.universe) if args.universe else load_universe()
+    logger.info(f"UNIVERSE | {len(universe)} symbols")
+
+    if args.worker_id:
+        if args.metrics_port:
+            start_metrics_server(args.metrics_port)
+        IngestionWorker(args.worker_id, universe).run()
+    else:
+        supervise(args.processes, universe)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,8 +19,9 @@ def run_backfill():
     logger.info(f"🚀 Starting Kite Backfill | {SYMBOL} | {TIMEFRAME}")
 
     # ─── DEFINE YOUR RANGE HERE ───
+    # Half-open [start, end): end is the day after the last one wanted
     start_dt = IST.localize(datetime(2024, 12, 1))
-    end_dt   = IST.localize(datetime(2024, 12, 31))
+    end_dt   = IST.localize(datetime(2025, 1, 1))
 
     logger.info(f"📅 Start: {start_dt}")
     logger.info(f"📅 End:   {end_dt}")
@@ -0,0 +1,42 @@
+from data_ingestion.db import get_db_connection
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS backfill_tasks (
+    id BIGSERIAL PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    chunk_start TIMESTAMPTZ NOT NULL,
+    chunk_end TIMESTAMPTZ NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',   -- pending | running | done | failed
+    attempts INT NOT NULL DEFAULT 0,
+    claimed_by TEXT,
+    claimed_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ,
+    candles INT,
+    error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE (run_id, symbol, timeframe, chunk_start)
+);
+
+-- Claim path: pending tasks of a run
+CREATE INDEX IF NOT EXISTS idx_backfill_tasks_run_status
+    ON backfill_tasks (run_id, status);
+"""
+
+def main():
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_TABLE_SQL)
+        conn.commit()
+        print("✅ backfill_tasks table created successfully")
+    except Exception as e:
+        conn.rollback()
+        print("❌ Failed to create backfill_tasks table")
+        raise e
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
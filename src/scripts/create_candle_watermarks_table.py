@@ -0,0 +1,39 @@
+from data_ingestion.db import get_db_connection
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS candle_watermarks (
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    last_ts TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (symbol, timeframe)
+);
+"""
+
+# One-off seed from existing candles (idempotent)
+SEED_SQL = """
+INSERT INTO candle_watermarks (symbol, timeframe, last_ts)
+SELECT symbol, timeframe, MAX(ts)
+FROM candles
+GROUP BY symbol, timeframe
+ON CONFLICT (symbol, timeframe) DO UPDATE
+SET last_ts = GREATEST(candle_watermarks.last_ts, EXCLUDED.last_ts)
+"""
+
+def main():
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_TABLE_SQL)
+            cur.execute(SEED_SQL)
+        conn.commit()
+        print("✅ candle_watermarks table created successfully")
+    except Exception as e:
+        conn.rollback()
+        print("❌ Failed to create candle_watermarks table")
+        raise e
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,47 @@ CREATE TABLE IF NOT EXISTS data_quality_reports (
     details JSONB,
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
+
+-- Keyset pagination on (run_ts, id) for symbol and alert history
+DROP INDEX IF EXISTS idx_dqr_symbol_run_ts;
+
+CREATE INDEX IF NOT EXISTS idx_dqr_symbol_run_ts_id
+    ON data_quality_reports (symbol, run_ts DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_dqr_check_type_run_ts_id
+    ON data_quality_reports (check_type, run_ts DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_dqr_check_type_status
+    ON data_quality_reports (check_type, status);
+
+-- Latest report per (symbol, timeframe, check_type).
+-- Maintained by DataCompletenessAgent.flush_reports in the same
+-- transaction as the report insert.
+CREATE TABLE IF NOT EXISTS data_quality_latest (
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    check_type TEXT NOT NULL,
+    report_id BIGINT NOT NULL,
+    run_ts TIMESTAMPTZ NOT NULL,
+    status TEXT NOT NULL,
+    details JSONB,
+    PRIMARY KEY (symbol, timeframe, check_type)
+);
+
+CREATE INDEX IF NOT EXISTS idx_dql_report_id
+    ON data_quality_latest (report_id);
+"""
+
+# One-off seed of data_quality_latest from existing history (idempotent)
+SEED_LATEST_SQL = """
+INSERT INTO data_quality_latest (
+    symbol, timeframe, check_type, report_id, run_ts, status, details
+)
+SELECT DISTINCT ON (symbol, timeframe, check_type)
+    symbol, timeframe, check_type, id, run_ts, status, details
+FROM data_quality_reports
+ORDER BY symbol, timeframe, check_type, run_ts DESC, id DESC
+ON CONFLICT (symbol, timeframe, check_type) DO NOTHING
 """
 
 def main():
@@ -18,8 +59,9 @@ def main():
     try:
         with conn.cursor() as cur:
             cur.execute(CREATE_SQL)
+            cur.execute(SEED_LATEST_SQL)
         conn.commit()
-        print("✅ data_quality_reports table created")
+        print("✅ data_quality_reports / data_quality_latest tables created")
     finally:
         conn.close()
 
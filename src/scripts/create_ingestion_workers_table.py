@@ -0,0 +1,28 @@
+from data_ingestion.db import get_db_connection
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ingestion_workers (
+    worker_id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    pid INT NOT NULL,
+    started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    heartbeat_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+def main():
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_TABLE_SQL)
+        conn.commit()
+        print("✅ ingestion_workers table created successfully")
+    except Exception as e:
+        conn.rollback()
+        print("❌ Failed to create ingestion_workers table")
+        raise e
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
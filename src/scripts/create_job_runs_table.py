@@ -0,0 +1,51 @@
+from data_ingestion.db import get_db_connection
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS job_runs (
+    id BIGSERIAL PRIMARY KEY,
+    run_ts TIMESTAMPTZ NOT NULL,          -- run start
+    finished_at TIMESTAMPTZ,
+    job_name TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    run_key TEXT NOT NULL,                -- scheduled run (see scheduler.leases)
+    replica TEXT NOT NULL,
+    status TEXT NOT NULL,                 -- ok | error | deadline | lease_lost
+    symbols INT NOT NULL DEFAULT 0,
+    symbols_failed INT NOT NULL DEFAULT 0,
+    symbols_abandoned INT NOT NULL DEFAULT 0,
+    api_calls INT NOT NULL DEFAULT 0,
+    gap_refetches INT NOT NULL DEFAULT 0,
+    rows_fetched INT NOT NULL DEFAULT 0,
+    rows_written INT NOT NULL DEFAULT 0,
+    duration_ms DOUBLE PRECISION NOT NULL DEFAULT 0,
+    fetch_ms DOUBLE PRECISION NOT NULL DEFAULT 0,
+    db_ms DOUBLE PRECISION NOT NULL DEFAULT 0,
+    sleep_ms DOUBLE PRECISION NOT NULL DEFAULT 0,
+    deadline_hit BOOLEAN NOT NULL DEFAULT FALSE,
+    per_symbol JSONB
+);
+
+-- Keyset pagination on (run_ts, id), overall and per job
+CREATE INDEX IF NOT EXISTS idx_job_runs_run_ts_id
+    ON job_runs (run_ts DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_job_runs_job_run_ts_id
+    ON job_runs (job_name, run_ts DESC, id DESC);
+"""
+
+def main():
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_TABLE_SQL)
+        conn.commit()
+        print("✅ job_runs table created successfully")
+    except Exception as e:
+        conn.rollback()
+        print("❌ Failed to create job_runs table")
+        raise e
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
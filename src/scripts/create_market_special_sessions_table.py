@@ -0,0 +1,71 @@
+import argparse
+from datetime import datetime
+
+from data_ingestion.db import get_db_connection
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS market_special_sessions (
+    exchange TEXT NOT NULL,
+    session_date DATE NOT NULL,
+    open_time TIME NOT NULL,
+    close_time TIME NOT NULL,
+    description TEXT,
+    year INT NOT NULL,
+    PRIMARY KEY (exchange, session_date, open_time)
+);
+"""
+
+INSERT_SQL = """
+INSERT INTO market_special_sessions (
+    exchange, session_date, open_time, close_time, description, year
+)
+VALUES (%s, %s, %s, %s, %s, %s)
+ON CONFLICT (exchange, session_date, open_time) DO UPDATE
+SET close_time = EXCLUDED.close_time,
+    description = EXCLUDED.description
+"""
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Create market_special_sessions and optionally add a session "
+                    "(e.g. --date 2024-11-01 --open 18:00 --close 19:00 "
+                    "--description 'Muhurat trading')"
+    )
+    parser.add_argument("--exchange", default="NSE")
+    parser.add_argument("--date", help="Session date (YYYY-MM-DD)")
+    parser.add_argument("--open", help="Session open (HH:MM, IST)")
+    parser.add_argument("--close", help="Session close (HH:MM, IST)")
+    parser.add_argument("--description")
+    args = parser.parse_args()
+
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_TABLE_SQL)
+
+            if args.date:
+                session_date = datetime.strptime(args.date, "%Y-%m-%d").date()
+                cur.execute(
+                    INSERT_SQL,
+                    (
+                        args.exchange,
+                        session_date,
+                        datetime.strptime(args.open, "%H:%M").time(),
+                        datetime.strptime(args.close, "%H:%M").time(),
+                        args.description,
+                        session_date.year,
+                    ),
+                )
+        conn.commit()
+        print("✅ market_special_sessions table created successfully")
+        if args.date:
+            print(f"✅ Special session {args.date} {args.open}–{args.close} saved")
+    except Exception as e:
+        conn.rollback()
+        print("❌ Failed to create market_special_sessions table")
+        raise e
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+from data_ingestion.db import get_db_connection
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS scheduler_leases (
+    lease_key TEXT PRIMARY KEY,          -- job name, or job:shard
+    run_key TEXT NOT NULL,               -- scheduled run (UTC, sortable)
+    owner TEXT NOT NULL,                 -- host:pid of the holding replica
+    token BIGINT NOT NULL,               -- fencing token, bumped on every claim
+    expires_at TIMESTAMPTZ NOT NULL,
+    done BOOLEAN NOT NULL DEFAULT FALSE,
+    acquired_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+def main():
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_TABLE_SQL)
+        conn.commit()
+        print("✅ scheduler_leases table created successfully")
+    except Exception as e:
+        conn.rollback()
+        print("❌ Failed to create scheduler_leases table")
+        raise e
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
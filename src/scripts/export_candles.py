@@ -0,0 +1,49 @@
+# src/scripts/export_candles.py
+
+import argparse
+import logging
+
+from data_ingestion.export import EXPORT_FORMATS, export_candles
+from data_ingestion.orchestrator import parse_date_local
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export candles to Arrow IPC / Parquet"
+    )
+    parser.add_argument(
+        "--symbols",
+        required=True,
+        help="Comma-separated symbols (e.g. INFY,TCS,RELIANCE)",
+    )
+    parser.add_argument("--timeframe", required=True, help="e.g. 1M, 5M, 1D")
+    parser.add_argument("--start", required=True, help="YYYY-MM-DD (inclusive)")
+    parser.add_argument("--end", required=True, help="YYYY-MM-DD (exclusive)")
+    parser.add_argument(
+        "--format",
+        choices=list(EXPORT_FORMATS),
+        default="parquet",
+    )
+    parser.add_argument("--output", required=True, help="Output file path")
+
+    args = parser.parse_args()
+
+    symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+
+    export_candles(
+        symbols=symbols,
+        timeframe=args.timeframe.upper(),
+        start=parse_date_local(args.start),
+        end=parse_date_local(args.end),
+        output=args.output,
+        fmt=args.format,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,7 @@ import argparse
 import logging
 
 from data_ingestion.orchestrator import run_ingestion_job
-
-
-def get_symbols():
-    return ["INFY", "TCS", "RELIANCE"]   # adjust if your symbol source differs
+from scheduler.universe import load_universe
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,7 +24,7 @@ def main():
 
     args = parser.parse_args()
 
-    symbols = get_symbols()
+    symbols = load_universe()
     run_ingestion_job(args.job, symbols)
 
 
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, time
 import pytz
 
 from data_ingestion.db import get_db_connection
+from data_ingestion.candle_store import get_candle_store
 from data_ingestion.timeframe_mapper import TIMEFRAMES
 
 IST = pytz.timezone("Asia/Kolkata")
@@ -13,7 +14,7 @@ IST = pytz.timezone("Asia/Kolkata")
 # ─────────────────────────────────────────────
 
 SYMBOL = "INFY"
-TIMEFRAME = "15m"  # "1m", "5m", "15m"
+TIMEFRAME = "15M"  # "1M", "5M", "15M"
 START_DATE = "2025-12-01"
 END_DATE   = "2025-12-31"
 
@@ -52,22 +53,11 @@ def generate_expected_candles(trade_date, timeframe):
 
 def fetch_actual_candles(conn, symbol, timeframe, start_dt, end_dt):
     """
-    Fetch candle timestamps from DB (converted to IST).
+    Candle timestamps in [start_dt, end_dt), converted to IST.
     """
-    query = """
-        SELECT candle_ts
-        FROM ohlcv
-        WHERE symbol = %s
-          AND timeframe = %s
-          AND candle_ts BETWEEN %s AND %s
-        ORDER BY candle_ts;
-    """
-
-    with conn.cursor() as cur:
-        cur.execute(query, (symbol, timeframe, start_dt, end_dt))
-        rows = cur.fetchall()
-
-    return [row[0].astimezone(IST) for row in rows]
+    return get_candle_store().get_timestamps(
+        conn, symbol, timeframe, start_dt, end_dt
+    )
 
 
 # ─────────────────────────────────────────────
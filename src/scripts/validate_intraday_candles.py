@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, time, date
 import pytz
 
 from data_ingestion.db import get_db_connection
+from data_ingestion.candle_store import get_candle_store
 from agents.calendar.market_holiday_agent import MarketHolidayAgent
 from data_ingestion.timeframe_mapper import TIMEFRAMES
 
@@ -46,29 +47,9 @@ def expected_intraday_candles(trade_date, timeframe, market_open, market_close):
 
 
 def fetch_actual_candles(conn, symbol, timeframe, start_ts, end_ts):
-    query = """
-        SELECT ts
-        FROM candles
-        WHERE symbol = %s
-          AND timeframe = %s
-          AND ts >= %s
-          AND ts < %s
-        ORDER BY ts
-    """
-
-    with conn.cursor() as cur:
-        cur.execute(
-            query,
-            (
-                symbol,
-                timeframe,
-                start_ts.astimezone(pytz.UTC),
-                end_ts.astimezone(pytz.UTC),
-            ),
-        )
-        rows = cur.fetchall()
-
-    return [row["ts"].astimezone(IST) for row in rows]
+    return get_candle_store().get_timestamps(
+        conn, symbol, timeframe, start_ts, end_ts
+    )
 
 
 # ─────────────────────────────────────────────
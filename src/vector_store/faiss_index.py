@@ -1,9 +1,12 @@
 import faiss
 import numpy as np
 import pickle
+import time
 from pathlib import Path
 from typing import List, Dict
 
+from monitoring.metrics import FAISS_QUERY_SECONDS
+
 
 class MarketStateFAISS:
     """
@@ -62,7 +65,9 @@ class MarketStateFAISS:
         """
         query = query.reshape(1, -1).astype("float32")
 
+        t0 = time.perf_counter()
         distances, indices = self.index.search(query, k)
+        FAISS_QUERY_SECONDS.observe(time.perf_counter() - t0)
 
         results = []
         for idx, dist in zip(indices[0], distances[0]):
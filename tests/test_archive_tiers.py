@@ -0,0 +1,161 @@
+import asyncio
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from agents.calendar.trading_calendar import IST, TradingCalendar
+from dashboard.api import candles
+from dashboard.downsample import bucket_starts, reduce_m4, reduce_ohlc
+from data_ingestion import archive
+from data_ingestion.export import CANDLE_SCHEMA, EXPORT_BATCH_ROWS, rows_to_batch
+from data_ingestion.retention import retention_cutoff
+
+SYMBOL = "INFY"
+TIMEFRAME = "1M"
+
+
+def _session_candles(start, end) -> pd.DataFrame:
+    """
+    1M candles for every weekday session in [start, end).
+    """
+    ts = []
+    day = start.astimezone(IST).date()
+    while day <= end.astimezone(IST).date():
+        if day.weekday() < 5:
+            open_ = IST.localize(datetime(day.year, day.month, day.day, 9, 15))
+            ts.extend(open_ + timedelta(minutes=m) for m in range(375))
+        day += timedelta(days=1)
+
+    ts = pd.DatetimeIndex(ts).tz_convert("UTC")
+    ts = ts[(ts >= start) & (ts < end)]
+
+    rng = np.random.default_rng(7)
+    close = 1500 + np.cumsum(rng.normal(0, 1, len(ts)))
+    return pd.DataFrame({
+        "ts": ts,
+        "open": close - 0.5,
+        "high": close + 1.0,
+        "low": close - 1.0,
+        "close": close,
+        "volume": rng.integers(100, 1000, len(ts)),
+    })
+
+
+@pytest.fixture
+def tiers(tmp_path, monkeypatch):
+    """
+    60 days of candles split at the 1M retention cutoff: older rows in a
+    Parquet archive under tmp_path, newer ones in a fake hot tier. One
+    candle sits in both tiers with a different hot close.
+    """
+    now = datetime.now(timezone.utc)
+    cutoff = retention_cutoff(TIMEFRAME, now)
+    start, end = now - timedelta(days=60), now
+
+    df = _session_candles(start, end)
+    cold = df[df["ts"] < cutoff]
+    hot = df[df["ts"] >= cutoff].copy()
+
+    overlap = cold.iloc[[-1]].copy()
+    overlap["close"] += 100
+    hot = pd.concat([overlap, hot], ignore_index=True)
+    df.loc[cold.index[-1], "close"] += 100
+
+    for year, part in cold.groupby(cold["ts"].dt.tz_convert("Asia/Kolkata").dt.year):
+        out = archive.partition_dir(tmp_path, TIMEFRAME, SYMBOL, year)
+        out.mkdir(parents=True)
+        table = pa.Table.from_pandas(part[archive.ARCHIVE_COLUMNS], preserve_index=False)
+        pq.write_table(table, out / "part.parquet")
+
+    def fake_hot_batches(conn, symbols, timeframe, lo, hi, batch_rows=EXPORT_BATCH_ROWS):
+        rows = hot[(hot["ts"] >= lo) & (hot["ts"] < hi)]
+        for i in range(0, len(rows), batch_rows):
+            chunk = rows.iloc[i:i + batch_rows]
+            yield rows_to_batch([
+                (SYMBOL, TIMEFRAME, r.ts.to_pydatetime(), r.open, r.high, r.low, r.close, r.volume)
+                for r in chunk.itertuples()
+            ])
+
+    monkeypatch.setattr(archive, "iter_candle_batches", fake_hot_batches)
+    return df, hot, tmp_path, start, end, cutoff
+
+
+def test_tiered_batches_span_cutoff(tiers):
+    df, _, root, start, end, cutoff = tiers
+
+    batches = list(archive.iter_tiered_batches(
+        None, [SYMBOL], TIMEFRAME, start, end, root=root
+    ))
+    table = pa.Table.from_batches(batches)
+
+    assert table.schema == CANDLE_SCHEMA
+    got = table.to_pandas()
+    assert got["ts"].min() < cutoff <= got["ts"].max()
+    assert got["ts"].is_monotonic_increasing
+    assert got["ts"].is_unique
+    np.testing.assert_array_equal(
+        got["ts"].to_numpy("datetime64[us]"), df["ts"].to_numpy("datetime64[us]")
+    )
+    # The candle held by both tiers comes from the hot one
+    np.testing.assert_allclose(got["close"], df["close"])
+
+
+def _ms(ts: pd.Series) -> np.ndarray:
+    return ts.dt.tz_localize(None).to_numpy("datetime64[ms]").astype("int64")
+
+
+def test_candles_api_spans_cutoff(tiers, monkeypatch):
+    df, hot, root, start, end, cutoff = tiers
+
+    cal = TradingCalendar()
+    for year in {start.year, end.year}:
+        cal._holidays[year] = set()
+        cal._special[year] = {}
+
+    queried = []
+
+    async def fake_fetch(sql, params, columns):
+        # Emulates the hot-tier queries over the fake hot rows
+        if isinstance(params, dict):
+            lo, hi, width = params["start"], params["end"], params["width"]
+        else:
+            lo, hi, width = params[2], params[3], None
+        queried.append(lo)
+
+        rows = hot[(hot["ts"] >= lo) & (hot["ts"] < hi)]
+        ts = _ms(rows["ts"])
+        if width is None:
+            return {"ts": ts, **{c: rows[c].to_numpy() for c in columns[1:]}}
+        width = int(width.total_seconds() // 60)
+        if columns == candles.M4_COLUMNS:
+            return dict(zip(columns, reduce_m4(ts, rows["close"].to_numpy(), width)))
+        keys = bucket_starts(ts, width)
+        return reduce_ohlc(keys, *(rows[c].to_numpy() for c in candles.OHLC_COLUMNS[1:]))
+
+    monkeypatch.setattr(candles, "ARCHIVE_ROOT", root)
+    monkeypatch.setattr(candles, "pooled_connection", lambda: nullcontext(None))
+    monkeypatch.setattr(candles, "get_trading_calendar", lambda: cal)
+    monkeypatch.setattr(candles, "_fetch_columns", fake_fetch)
+
+    arrays, width = asyncio.run(candles._ohlc(SYMBOL, TIMEFRAME, start, end, 1000))
+
+    assert queried and queried[0] >= cutoff
+    assert width > 1 and len(arrays["ts"]) <= 1000
+
+    ts = _ms(df["ts"])
+    expected = reduce_ohlc(
+        bucket_starts(ts, width),
+        *(df[c].to_numpy() for c in candles.OHLC_COLUMNS[1:]),
+    )
+    for column, values in expected.items():
+        np.testing.assert_allclose(arrays[column], values, err_msg=column)
+
+    line = asyncio.run(candles._lttb(SYMBOL, TIMEFRAME, start, end, 500))
+    assert len(line["ts"]) == 500
+    assert line["ts"][0] == ts[0] and line["ts"][-1] == ts[-1]
+    assert np.all(np.isin(line["ts"], ts))
@@ -0,0 +1,97 @@
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from agents.calendar.trading_calendar import TradingCalendar
+from dashboard.downsample import (
+    DAY_MINUTES,
+    bucket_starts,
+    lttb_indices,
+    m4_points,
+    ohlc_bucket_minutes,
+)
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+
+@pytest.fixture
+def calendar():
+    # Weekends only, no DB lookups
+    cal = TradingCalendar()
+    for year in range(2015, 2027):
+        cal._holidays[year] = set()
+        cal._special[year] = {}
+    return cal
+
+
+def _candle_ts(days, timeframe_minutes):
+    ts = []
+    for d in days:
+        if timeframe_minutes >= DAY_MINUTES:
+            ts.append(datetime(d.year, d.month, d.day, tzinfo=IST))
+            continue
+        open_ = datetime(d.year, d.month, d.day, 9, 15, tzinfo=IST)
+        ts.extend(
+            open_ + timedelta(minutes=m)
+            for m in range(0, 375, timeframe_minutes)
+        )
+    return np.array([int(t.timestamp() * 1000) for t in ts], dtype="int64")
+
+
+@pytest.mark.parametrize(
+    "timeframe_minutes, start, end, points",
+    [
+        (1, date(2026, 9, 1), date(2026, 9, 30), 1000),
+        (1, date(2021, 1, 1), date(2025, 12, 31), 1000),
+        (5, date(2026, 1, 1), date(2026, 9, 30), 1000),
+        (15, date(2024, 1, 1), date(2026, 9, 30), 1000),
+        (DAY_MINUTES, date(2016, 1, 1), date(2025, 12, 31), 500),
+        (1, date(2026, 9, 1), date(2026, 9, 30), 3),
+    ],
+)
+def test_buckets_fit_points(calendar, timeframe_minutes, start, end, points):
+    days = calendar.trading_days(start, end)
+    width = ohlc_bucket_minutes(
+        timeframe_minutes, len(days), (end - start).days + 1, points
+    )
+    ts = _candle_ts(days, timeframe_minutes)
+
+    assert width % timeframe_minutes == 0
+    assert len(np.unique(bucket_starts(ts, width))) <= points
+
+
+def test_intraday_buckets_restart_at_session_open(calendar):
+    days = calendar.trading_days(date(2026, 9, 1), date(2026, 9, 30))
+    width = ohlc_bucket_minutes(1, len(days), 30, 1000)
+    ts = _candle_ts(days, 1)
+
+    assert width < 375
+    per_day = -(-375 // width)
+    assert len(np.unique(bucket_starts(ts, width))) == per_day * len(days)
+
+    # The first bucket of every day starts at that day's 09:15 open
+    opens = _candle_ts(days, 375)
+    assert set(opens) <= set(bucket_starts(ts, width))
+
+
+def test_m4_keeps_extremes_for_lttb():
+    ts = np.arange(10_000, dtype="int64") * 60_000
+    close = np.sin(np.arange(10_000) / 300.0)
+    close[4321] = 5.0
+
+    buckets = bucket_starts(ts, 15)
+    starts, first = np.unique(buckets, return_index=True)
+    last = np.r_[first[1:], len(ts)] - 1
+    lo = np.array([s + np.argmin(close[s:e + 1]) for s, e in zip(first, last)])
+    hi = np.array([s + np.argmax(close[s:e + 1]) for s, e in zip(first, last)])
+
+    m4_ts, m4_close = m4_points(
+        ts[first], close[first], ts[lo], close[lo],
+        ts[hi], close[hi], ts[last], close[last],
+    )
+    assert np.all(np.diff(m4_ts) > 0)
+    assert len(m4_ts) <= 4 * len(starts)
+
+    idx = lttb_indices(m4_ts, m4_close, 200)
+    assert 5.0 in m4_close[idx]
@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+from scheduler.universe import RING_LOAD_FACTOR, HashRing
+from scheduler.worker import WORKER_SHARDS, IngestionWorker
+
+UNIVERSE = [f"SYM{i:04d}" for i in range(2000)]
+
+
+class _Registry:
+    def __init__(self, peers):
+        self.peers = peers
+
+    def heartbeat(self, worker_id):
+        pass
+
+    def live_workers(self):
+        return list(self.peers)
+
+
+def _assign(peers):
+    out = {}
+    for worker_id in peers:
+        worker = IngestionWorker(worker_id, UNIVERSE)
+        worker.registry = _Registry(peers)
+        worker.refresh()
+        out[worker_id] = worker.symbols()
+    return out
+
+
+@pytest.mark.parametrize("workers", [2, 3, 4, 8])
+def test_workers_split_universe_evenly(workers):
+    peers = [f"host:w{i}" for i in range(workers)]
+    assigned = _assign(peers)
+
+    symbols = [s for shard in assigned.values() for s in shard]
+    assert sorted(symbols) == sorted(UNIVERSE)
+
+    fair = len(UNIVERSE) / workers
+    assert max(len(s) for s in assigned.values()) <= 1.15 * fair
+
+
+def test_bounded_load_caps_shards_per_worker():
+    peers = [f"host:w{i}" for i in range(4)]
+    keys = [str(s) for s in range(WORKER_SHARDS)]
+    assigned = HashRing(peers).assign(keys, RING_LOAD_FACTOR)
+
+    assert sorted(k for ks in assigned.values() for k in ks) == sorted(keys)
+    cap = math.ceil(RING_LOAD_FACTOR * WORKER_SHARDS / len(peers))
+    assert max(len(ks) for ks in assigned.values()) <= cap
+
+
+def test_adding_a_worker_moves_few_shards():
+    keys = [str(s) for s in range(WORKER_SHARDS)]
+    before = HashRing([f"w{i}" for i in range(4)]).assign(keys, RING_LOAD_FACTOR)
+    after = HashRing([f"w{i}" for i in range(5)]).assign(keys, RING_LOAD_FACTOR)
+
+    owner = {k: n for n, ks in before.items() for k in ks}
+    moved = sum(1 for n, ks in after.items() for k in ks if owner[k] != n)
+    # Ideal is 1/5 of the keys; bounded loads add some churn
+    assert moved <= 0.35 * len(keys)